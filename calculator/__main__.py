@@ -0,0 +1,8 @@
+"""支持 python -m calculator 运行命令行计算器"""
+
+import sys
+
+from calculator.cli import main
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,95 @@
+"""精确分数模式与浮点模式的计算耗时对比
+
+两种场景：
+    - 重复计算同一批表达式（编译结果命中缓存，只比较虚拟机执行）
+    - 流式批量计算互不相同的金额表达式（每条都要解析和编译，接近财务批处理）
+
+运行方式：
+    python -m calculator.benchmarks.bench_exact [--count N] [--repeat R]
+"""
+
+import argparse
+import os
+import random
+import sys
+import time
+import timeit
+
+# 添加项目根目录到Python路径，确保可以导入calculator包
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from calculator.core.arithmetic import ArithmeticCalculator
+from calculator.core.batch import evaluate_stream
+from calculator.core.exact import format_fraction
+from calculator.cli import format_result
+
+SAMPLE_EXPRESSIONS = [
+    "0.1+0.2",
+    "12×(3+4)-5÷2+7.5",
+    "(1.5+2.25)×(3-4.75)÷(6+7)-8×(9.5-10)",
+    "((12+34)×56-78)÷90+1.5×(2.5-3.5)+(4×5-6÷7)(8+9)"
+]
+
+
+def financial_expressions(count, seed=0):
+    """生成金额计算表达式：单价×数量求和，打折后加税"""
+    rng = random.Random(seed)
+    for _ in range(count):
+        items = "+".join(
+            f"{rng.randint(1, 9999) / 100:.2f}×{rng.randint(1, 20)}" for _ in range(rng.randint(2, 5))
+        )
+        yield f"({items})×0.{rng.randint(80, 99)}×1.13"
+
+
+def bench_cached(repeat):
+    """同一批表达式重复计算的单次平均耗时（微秒）"""
+    results = {}
+    for name, evaluate in (("浮点", ArithmeticCalculator.evaluate_expression),
+                           ("精确分数", ArithmeticCalculator.evaluate_exact)):
+        for expression in SAMPLE_EXPRESSIONS:
+            evaluate(expression)  # 预热缓存
+        total = timeit.timeit(
+            lambda: [evaluate(expression) for expression in SAMPLE_EXPRESSIONS], number=repeat
+        )
+        results[name] = total / (repeat * len(SAMPLE_EXPRESSIONS)) * 1e6
+    return results
+
+
+def bench_batch(count, precision):
+    """流式批量计算并格式化输出的总耗时（秒）"""
+    expressions = list(enumerate(financial_expressions(count), 1))
+    results = {}
+    for name, exact, format_value in (
+        ("浮点", False, format_result),
+        ("精确分数", True, lambda value: format_fraction(value, precision))
+    ):
+        ArithmeticCalculator.clear_expression_cache()
+        start = time.perf_counter()
+        for result in evaluate_stream(expressions, exact=exact):
+            format_value(result.value)
+        results[name] = time.perf_counter() - start
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="精确分数模式与浮点模式的计算耗时对比")
+    parser.add_argument("--count", type=int, default=100000, help="批量计算的表达式数量")
+    parser.add_argument("--repeat", type=int, default=20000, help="缓存场景的重复次数")
+    parser.add_argument("--precision", type=int, default=2, help="精确模式输出的小数位数")
+    args = parser.parse_args()
+
+    cached = bench_cached(args.repeat)
+    print("缓存命中（只执行字节码）:")
+    for name, micros in cached.items():
+        print(f"  {name:<6} {micros:8.2f} µs/表达式")
+    print(f"  精确分数 / 浮点 = {cached['精确分数'] / cached['浮点']:.1f}x")
+
+    batch = bench_batch(args.count, args.precision)
+    print(f"批量计算 {args.count} 条金额表达式（含解析和格式化）:")
+    for name, seconds in batch.items():
+        print(f"  {name:<6} {seconds:8.2f} s  ({args.count / seconds:,.0f} 条/s)")
+    print(f"  精确分数 / 浮点 = {batch['精确分数'] / batch['浮点']:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,56 @@
+"""阶乘计算耗时对比
+
+比较原来逐个累乘的循环、calculator.core.factorial 的精确计算，
+以及不计算精确值的位数估算和科学计数法近似。
+
+运行方式：
+    python -m calculator.benchmarks.bench_factorial [--sizes 1000 10000 100000]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# 添加项目根目录到Python路径，确保可以导入calculator包
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from calculator.core.factorial import factorial, factorial_digits, factorial_scientific
+
+
+def loop_factorial(n):
+    """原来的实现：从2到n逐个累乘"""
+    result = 1
+    for i in range(2, n + 1):
+        result *= i
+    return result
+
+
+def best_time(function, n, repeat):
+    """多次运行取最短耗时（秒）"""
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        function(n)
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main():
+    parser = argparse.ArgumentParser(description="阶乘计算耗时对比")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[1000, 10000, 100000], help="要计算的n")
+    parser.add_argument("--repeat", type=int, default=3, help="每项重复次数，取最短耗时")
+    args = parser.parse_args()
+
+    print(f"{'n':>10} {'位数':>10} {'逐个累乘':>12} {'二分乘积':>12} {'加速':>8} {'位数估算':>10} {'科学计数法':>10}")
+    for n in args.sizes:
+        loop = best_time(loop_factorial, n, args.repeat)
+        exact = best_time(factorial, n, args.repeat)
+        digits = best_time(factorial_digits, n, args.repeat)
+        scientific = best_time(factorial_scientific, n, args.repeat)
+        print(f"{n:>10} {factorial_digits(n):>10} {loop * 1e3:>10.2f}ms {exact * 1e3:>10.2f}ms "
+              f"{loop / exact:>7.1f}x {digits * 1e6:>8.1f}µs {scientific * 1e6:>8.1f}µs")
+
+
+if __name__ == "__main__":
+    main()
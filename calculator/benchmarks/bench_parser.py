@@ -0,0 +1,94 @@
+"""表达式解析基准测试
+
+对比旧的解析流程（界面层 re.sub 预处理 + 正则校验 + 括号计数 + ast.parse + 展开）
+与手写分词器/运算符优先级解析器的解析耗时。
+
+运行方式：
+    python -m calculator.benchmarks.bench_parser [--repeat N]
+"""
+
+import argparse
+import ast
+import os
+import re
+import sys
+import timeit
+
+# 添加项目根目录到Python路径，确保可以导入calculator包
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from calculator.core.expression_parser import compile_expression
+
+# 典型的界面输入，长度约20～200个字符
+SAMPLE_EXPRESSIONS = [
+    "12×(3+4)-5÷2+7.5",
+    "(12.5+3)×4-7÷(2+3)(1.25-0.5)+100×3-((4+5)×6)÷7",
+    "(1.5+2.25)×(3-4.75)÷(6+7)-8×(9.5-10)+((11+12)×13-14)÷15+16×17-18÷(19+20)",
+    "((((12+34)×56-78)÷90+1.5)×(2.5-3.5)+(4×5-6÷7)(8+9))×(10-11.25)÷(12+13.5)"
+    "-(14×15-16)÷(17+18)+19×(20-21.5)÷22+(23+24)×25-26÷(27×28)+29.75-30×31"
+]
+
+_BINARY_OPERATORS = {ast.Add: 'ADD', ast.Sub: 'SUB', ast.Mult: 'MUL', ast.Div: 'DIV'}
+
+
+def legacy_parse(text):
+    """旧版流程：界面预处理后交给 ast.parse，再展开为后缀指令列表"""
+    expression = text
+    open_brackets = expression.count('(')
+    close_brackets = expression.count(')')
+    if open_brackets > close_brackets:
+        expression += ')' * (open_brackets - close_brackets)
+    expression = expression.replace('×', '*').replace('÷', '/')
+    expression = re.sub(r'([0-9\)])\s*\(', r'\1*(', expression)
+    expression = re.sub(r'\)\s*([0-9])', r')*\1', expression)
+
+    if not re.match(r'^[0-9\s\+\-\*/\.\(\)]*$', expression):
+        raise ValueError("表达式包含不支持的字符")
+    if expression.count('(') != expression.count(')'):
+        raise ValueError("括号不匹配")
+    tree = ast.parse(expression, mode='eval')
+
+    program = []
+
+    def flatten(node):
+        if isinstance(node, ast.Constant):
+            program.append(('PUSH', node.value))
+        elif isinstance(node, ast.BinOp):
+            flatten(node.left)
+            flatten(node.right)
+            program.append((_BINARY_OPERATORS[type(node.op)], None))
+        elif isinstance(node, ast.UnaryOp):
+            flatten(node.operand)
+            if isinstance(node.op, ast.USub):
+                program.append(('NEG', None))
+        else:
+            raise ValueError(f"不支持的表达式节点: {type(node).__name__}")
+
+    flatten(tree.body)
+    return program
+
+
+def new_parse(text):
+    """新版流程：单遍分词 + 运算符优先级解析"""
+    return compile_expression(text, auto_close=True)
+
+
+def run(repeat):
+    """运行基准测试并打印结果表"""
+    print(f"{'长度':>6} {'旧流程(µs)':>12} {'新解析器(µs)':>14} {'加速比':>8}")
+    for text in SAMPLE_EXPRESSIONS:
+        assert legacy_parse(text) == new_parse(text).disassemble(), text
+        legacy = min(timeit.repeat(lambda: legacy_parse(text), number=repeat, repeat=5)) / repeat
+        new = min(timeit.repeat(lambda: new_parse(text), number=repeat, repeat=5)) / repeat
+        print(f"{len(text):>6} {legacy * 1e6:>12.1f} {new * 1e6:>14.1f} {legacy / new:>7.1f}x")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="表达式解析基准测试")
+    parser.add_argument("--repeat", type=int, default=2000, help="每个样例的重复次数")
+    args = parser.parse_args()
+    run(args.repeat)
+
+
+if __name__ == "__main__":
+    main()
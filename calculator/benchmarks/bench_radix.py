@@ -0,0 +1,68 @@
+"""大整数进制转换耗时
+
+对 10^3 到 10^6 位十进制数的整数，测量 calculator.core.radix 在各进制下的
+输出（整数→字符串）和解析（字符串→整数）耗时，并与原来逐位 %、// 的循环对比。
+逐位循环是平方复杂度，只在不超过 --naive-limit 位时运行。
+
+运行方式：
+    python -m calculator.benchmarks.bench_radix [--digits 1000 10000 100000 1000000] [--bases 2 10 16 36]
+"""
+
+import argparse
+import os
+import sys
+import time
+
+# 添加项目根目录到Python路径，确保可以导入calculator包
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from calculator.core.radix import BASE62_DIGITS, base_to_int, int_to_base
+
+# log10(7)，用于生成指定十进制位数的测试数
+_LOG10_7 = 0.84509804
+
+
+def naive_to_base(value, base):
+    """原来的实现：每次 % 取一位、// 去掉一位"""
+    result = []
+    while value > 0:
+        result.append(BASE62_DIGITS[value % base])
+        value = value // base
+    return "".join(reversed(result))
+
+
+def timed(function, *args):
+    """运行一次，返回 (结果, 耗时秒数)"""
+    start = time.perf_counter()
+    result = function(*args)
+    return result, time.perf_counter() - start
+
+
+def main():
+    parser = argparse.ArgumentParser(description="大整数进制转换耗时")
+    parser.add_argument("--digits", type=int, nargs="+", default=[1000, 10000, 100000, 1000000],
+                        help="测试数的十进制位数")
+    parser.add_argument("--bases", type=int, nargs="+", default=[2, 10, 16, 36], help="目标进制")
+    parser.add_argument("--naive-limit", type=int, default=10000, help="逐位循环只在不超过这个位数时运行")
+    args = parser.parse_args()
+
+    int_to_base(1 << 4000, 10)  # 预热：导入decimal模块
+    print(f"{'位数':>9} {'进制':>4} {'输出':>10} {'解析':>10} {'逐位循环':>10} {'加速':>8}")
+    for digits in args.digits:
+        value = 7 ** int(digits / _LOG10_7)
+        for base in args.bases:
+            text, output_time = timed(int_to_base, value, base)
+            parsed, parse_time = timed(base_to_int, text, base)
+            assert parsed == value
+            naive = speedup = "-"
+            if digits <= args.naive_limit:
+                naive_text, naive_time = timed(naive_to_base, value, base)
+                assert naive_text == text
+                naive = f"{naive_time * 1e3:.2f}ms"
+                speedup = f"{naive_time / output_time:.0f}x"
+            print(f"{digits:>9} {base:>4} {output_time * 1e3:>8.2f}ms {parse_time * 1e3:>8.2f}ms "
+                  f"{naive:>10} {speedup:>8}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""大文件流式进制转换的吞吐量和内存占用
+
+生成一个按行排列的十六进制转储文件，用 calculator.core.radix_stream 转换为
+其他2的幂进制，报告吞吐量和进程的峰值常驻内存。峰值内存应当只与每段的大小
+有关，与文件大小无关；作为对比，--whole 会把整个文件读入内存后用
+BaseConverter.convert 一次转换。
+
+运行方式：
+    python -m calculator.benchmarks.bench_radix_stream [--size-mb 64] [--to 2] [--whole]
+"""
+
+import argparse
+import os
+import random
+import resource
+import sys
+import tempfile
+import time
+
+# 添加项目根目录到Python路径，确保可以导入calculator包
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from calculator.core.base_converter import BaseConverter
+from calculator.core.radix_stream import convert_file
+
+
+def write_hex_dump(path, size_mb, seed=0):
+    """写入约 size_mb MB 的十六进制转储，每行64个数字"""
+    rng = random.Random(seed)
+    lines = size_mb * (1 << 20) // 65
+    with open(path, 'w', encoding='ascii') as file:
+        for _ in range(lines):
+            file.write(f"{rng.getrandbits(256):064x}\n")
+
+
+def peak_rss_mb():
+    """当前进程的峰值常驻内存（MB）"""
+    return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024
+
+
+def main():
+    parser = argparse.ArgumentParser(description="大文件流式进制转换的吞吐量和内存占用")
+    parser.add_argument("--size-mb", type=int, default=64, help="输入文件大小（MB）")
+    parser.add_argument("--to", type=int, default=2, help="目标进制（2、4、8、16、32）")
+    parser.add_argument("--chunk-digits", type=int, default=1 << 20, help="每段的输入数字个数")
+    parser.add_argument("--whole", action="store_true", help="改为整体读入后用 BaseConverter.convert 转换")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        source = os.path.join(directory, "input.hex")
+        target = os.path.join(directory, "output.txt")
+        write_hex_dump(source, args.size_mb)
+        size = os.path.getsize(source)
+        baseline = peak_rss_mb()
+
+        start = time.perf_counter()
+        if args.whole:
+            with open(source, encoding='ascii') as file:
+                result = BaseConverter.convert("".join(file.read().split()), 16, args.to)
+            with open(target, 'w', encoding='ascii') as file:
+                file.write(result)
+            del result
+        else:
+            convert_file(source, target, 16, args.to, args.chunk_digits)
+        elapsed = time.perf_counter() - start
+
+        print(f"输入 {size / (1 << 20):.1f} MB，输出 {os.path.getsize(target) / (1 << 20):.1f} MB，"
+              f"用时 {elapsed:.2f} s（{size / (1 << 20) / elapsed:.1f} MB/s）")
+        print(f"峰值常驻内存 {peak_rss_mb():.1f} MB（生成输入后为 {baseline:.1f} MB）")
+
+
+if __name__ == "__main__":
+    main()
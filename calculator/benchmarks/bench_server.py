@@ -0,0 +1,110 @@
+"""计算服务负载测试
+
+开启多个连接，每个连接上保持固定数量的在途请求，统计请求延迟的
+p50/p99 和吞吐量。未指定服务地址时在本进程中启动一个服务（与负载
+生成器共享同一个事件循环和CPU，结果偏保守）。
+
+运行方式：
+    python -m calculator.benchmarks.bench_server [--port PORT | --unix PATH]
+        [--connections C] [--concurrency K] [--requests N] [--batch-size B]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+import time
+
+# 添加项目根目录到Python路径，确保可以导入calculator包
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from calculator.server.client import RPCClient, RPCError
+from calculator.server.server import EvaluationServer
+
+# 轮流发送的调用
+SAMPLE_CALLS = [
+    ("evaluate_expression", ["12×(3+4)-5÷2+7.5"]),
+    ("evaluate_expression", ["(1.5+2.25)×(3-4.75)÷(6+7)-8×(9.5-10)"]),
+    ("ScientificCalculator.sin", [0.5]),
+    ("UnitConverter.convert_length", [12.5, "kilometer", "mile"]),
+    ("BaseConverter.convert", ["ff", 16, 2])
+]
+
+
+def percentile(sorted_values, fraction):
+    """已排序数据的百分位数（最近秩法）"""
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, max(0, int(round(fraction * len(sorted_values))) - 1))
+    return sorted_values[index]
+
+
+async def _worker(client, count, batch_size, latencies, errors):
+    """在一个连接上串行发送count个请求（或批量请求）"""
+    for i in range(count):
+        start = time.perf_counter()
+        if batch_size > 1:
+            calls = [SAMPLE_CALLS[(i + j) % len(SAMPLE_CALLS)] for j in range(batch_size)]
+            results = await client.batch(calls)
+            errors[0] += sum(isinstance(result, Exception) for result in results)
+        else:
+            method, params = SAMPLE_CALLS[i % len(SAMPLE_CALLS)]
+            try:
+                await client.call(method, *params)
+            except RPCError:
+                errors[0] += 1
+        latencies.append(time.perf_counter() - start)
+
+
+async def run(args):
+    """运行负载测试并打印结果"""
+    server = None
+    host, port, path = args.host, args.port, args.unix
+    if args.port is None and args.unix is None:
+        server = EvaluationServer(workers=args.workers)
+        listener = await server.start_tcp("127.0.0.1", 0)
+        host, port = listener.sockets[0].getsockname()[:2]
+
+    clients = [await RPCClient.connect(host, port, path) for _ in range(args.connections)]
+    per_worker = max(1, args.requests // (args.connections * args.concurrency))
+    latencies = []
+    errors = [0]
+
+    start = time.perf_counter()
+    await asyncio.gather(*(
+        _worker(client, per_worker, args.batch_size, latencies, errors)
+        for client in clients
+        for _ in range(args.concurrency)
+    ))
+    elapsed = time.perf_counter() - start
+
+    for client in clients:
+        await client.close()
+    if server is not None:
+        await server.close()
+
+    latencies.sort()
+    requests = len(latencies)
+    calls = requests * args.batch_size
+    print(f"连接数: {args.connections}  每连接并发: {args.concurrency}  批量大小: {args.batch_size}")
+    print(f"请求数: {requests}  调用数: {calls}  错误数: {errors[0]}  耗时: {elapsed:.2f} s")
+    print(f"吞吐量: {requests / elapsed:.0f} 请求/s  ({calls / elapsed:.0f} 调用/s)")
+    print(f"延迟 p50: {percentile(latencies, 0.50) * 1e3:.3f} ms  p99: {percentile(latencies, 0.99) * 1e3:.3f} ms")
+
+
+def main():
+    parser = argparse.ArgumentParser(description="计算服务负载测试")
+    parser.add_argument("--host", default="127.0.0.1", help="服务地址")
+    parser.add_argument("--port", type=int, help="服务端口；与--unix都不指定时在本进程中启动服务")
+    parser.add_argument("--unix", metavar="PATH", help="服务的Unix套接字路径")
+    parser.add_argument("--workers", type=int, default=0, help="本进程中启动的服务使用的进程池大小")
+    parser.add_argument("--connections", type=int, default=4, help="连接数")
+    parser.add_argument("--concurrency", type=int, default=8, help="每个连接上的在途请求数")
+    parser.add_argument("--requests", type=int, default=20000, help="请求总数")
+    parser.add_argument("--batch-size", type=int, default=1, help="每个请求包含的调用数，大于1时发送批量请求")
+    args = parser.parse_args()
+    asyncio.run(run(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,117 @@
+"""主窗口首帧时间基准测试
+
+对比启动时创建全部选项卡（旧行为）与只创建当前选项卡、其余选项卡在
+第一次切换时才创建（当前行为）两种方式下，从创建主窗口到窗口第一次
+绘制完成的耗时，以及之后第一次切换到各选项卡的耗时。
+
+没有显示器时使用 offscreen 平台运行：
+    QT_QPA_PLATFORM=offscreen python -m calculator.benchmarks.bench_startup [--repeat N]
+"""
+
+import argparse
+import os
+import statistics
+import sys
+import time
+
+# 添加项目根目录到Python路径，确保可以导入calculator包
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from PyQt6.QtCore import QEvent, QEventLoop, QObject, QTimer
+from PyQt6.QtWidgets import QApplication
+
+from calculator.ui.main_window import CalculatorMainWindow
+
+
+class EagerMainWindow(CalculatorMainWindow):
+    """旧行为：初始化界面时创建全部选项卡"""
+
+    def init_ui(self):
+        super().init_ui()
+        for index in range(self.tabs.count()):
+            self._ensure_tab_built(index)
+
+
+class _FirstPaintFilter(QObject):
+    """记录窗口第一次收到绘制事件的时间，并退出等待的事件循环"""
+
+    def __init__(self, loop):
+        super().__init__()
+        self.loop = loop
+        self.painted_at = None
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Paint and self.painted_at is None:
+            self.painted_at = time.perf_counter()
+            # 等本次绘制完成后再退出事件循环
+            QTimer.singleShot(0, self.loop.quit)
+        return False
+
+
+def time_to_first_frame(window_class):
+    """创建并显示主窗口，返回 (构造耗时, 首帧耗时, 窗口)，单位为秒"""
+    loop = QEventLoop()
+    paint_filter = _FirstPaintFilter(loop)
+    start = time.perf_counter()
+    window = window_class()
+    constructed = time.perf_counter()
+    window.installEventFilter(paint_filter)
+    window.show()
+    # 超时保护：平台不产生绘制事件时不会无限等待
+    QTimer.singleShot(5000, loop.quit)
+    loop.exec()
+    window.removeEventFilter(paint_filter)
+    painted_at = paint_filter.painted_at or time.perf_counter()
+    return constructed - start, painted_at - start, window
+
+
+def time_tab_switches(window):
+    """依次切换到每个选项卡，返回每次切换（含事件处理）的耗时列表，单位为秒"""
+    app = QApplication.instance()
+    timings = []
+    for index in range(1, window.tabs.count()):
+        start = time.perf_counter()
+        window.tabs.setCurrentIndex(index)
+        app.processEvents()
+        timings.append(time.perf_counter() - start)
+    return timings
+
+
+def main():
+    parser = argparse.ArgumentParser(description="主窗口首帧时间基准测试")
+    parser.add_argument("--repeat", type=int, default=10, help="每种方式重复的次数")
+    args = parser.parse_args()
+
+    app = QApplication.instance() or QApplication(sys.argv)
+
+    # 预热：首次创建窗口会加载字体、样式等一次性资源
+    _, _, window = time_to_first_frame(EagerMainWindow)
+    window.close()
+    window.deleteLater()
+    app.processEvents()
+
+    results = {EagerMainWindow: [], CalculatorMainWindow: []}
+    switches = {EagerMainWindow: [], CalculatorMainWindow: []}
+    for _ in range(args.repeat):
+        # 两种方式交替运行，减少缓存和系统负载变化带来的偏差
+        for window_class in results:
+            construct, first_frame, window = time_to_first_frame(window_class)
+            results[window_class].append((construct, first_frame))
+            switches[window_class].append(time_tab_switches(window))
+            window.close()
+            window.deleteLater()
+            app.processEvents()
+
+    labels = {EagerMainWindow: "启动时创建全部选项卡", CalculatorMainWindow: "首次切换时创建选项卡"}
+    print(f"重复次数: {args.repeat}（取中位数）")
+    for window_class, timings in results.items():
+        construct = statistics.median(t[0] for t in timings) * 1e3
+        first_frame = statistics.median(t[1] for t in timings) * 1e3
+        per_tab = [statistics.median(column) * 1e3 for column in zip(*switches[window_class])]
+        tabs = "  ".join(f"{value:.1f}" for value in per_tab)
+        print(f"{labels[window_class]}: 构造 {construct:.1f} ms  首帧 {first_frame:.1f} ms  "
+              f"首次切换到选项卡2~4 {tabs} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,436 @@
+"""命令行入口
+
+不依赖图形界面，只使用 calculator.core（以及按需使用 calculator.data），
+绝不导入PyQt6，适合在脚本和shell管道中大量调用：
+
+    python -m calculator -e "1+2*3"       # 计算一个表达式并退出
+    python -m calculator                  # 交互式REPL
+    echo "(1+2)*3" | python -m calculator # 从标准输入逐行计算
+    python -m calculator --batch exprs.txt --workers 4  # 流式批量计算文件
+    python -m calculator --exact -e "0.1+0.2"  # 精确有理数计算，输出 0.3
+    python -m calculator --decimal --precision 50 -e "1/7"  # 50位有效数字的十进制计算
+    python -m calculator convert --from 16 --to 2 dump.hex -o dump.bin  # 流式转换大文件的进制
+"""
+
+import sys
+
+from calculator.core.arithmetic import ArithmeticCalculator
+
+PROMPT = ">>> "
+
+REPL_HELP = """输入表达式并回车即可计算，支持 + - * / × ÷ 、括号和隐式乘法。
+命令:
+  :history   显示本次会话的计算历史
+  :help      显示帮助
+  :quit      退出（也可以使用 exit、quit 或 Ctrl-D）"""
+
+
+def format_result(result):
+    """格式化计算结果：整数值的浮点数显示为整数
+
+    Args:
+        result: 计算结果
+
+    Returns:
+        结果字符串
+    """
+    if isinstance(result, float) and result.is_integer():
+        result = int(result)
+    return str(result)
+
+
+def exact_formatter(precision=None):
+    """获取精确模式结果的格式化函数
+
+    fractions 模块只在使用精确模式时导入，不拖慢普通计算的启动。
+
+    Args:
+        precision: 小数位数，为None时显示为分数
+
+    Returns:
+        接收 Fraction、返回字符串的函数
+    """
+    from calculator.core.exact import format_fraction
+    return lambda result: format_fraction(result, precision)
+
+
+def decimal_formatter():
+    """获取十进制模式结果的格式化函数，decimal 只在使用十进制模式时导入"""
+    from calculator.core.decimal_context import format_decimal
+    return format_decimal
+
+
+def evaluate(expression, exact=False, precision=None, decimal_precision=None):
+    """计算一个表达式并格式化结果
+
+    Args:
+        expression: 表达式字符串
+        exact: 是否以精确有理数计算
+        precision: 精确模式结果的小数位数，为None时显示为分数
+        decimal_precision: 以指定有效数字位数的 Decimal 计算，为None时不使用
+
+    Returns:
+        结果字符串
+
+    Raises:
+        ValueError: 表达式无效或计算错误
+    """
+    if exact:
+        return exact_formatter(precision)(ArithmeticCalculator.evaluate_exact(expression))
+    if decimal_precision is not None:
+        result = ArithmeticCalculator.evaluate_decimal(expression, precision=decimal_precision)
+        return decimal_formatter()(result)
+    return format_result(ArithmeticCalculator.evaluate_expression(expression))
+
+
+def configured_precision():
+    """读取配置中的计算精度（小数位数）"""
+    from calculator.data.config_manager import ConfigManager
+    return ConfigManager.shared().get_precision()
+
+
+def build_parser():
+    """创建命令行参数解析器"""
+    # argparse 只在解析参数时需要，放在函数内导入
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="python -m calculator",
+        description="Python多功能计算器（命令行模式）"
+    )
+    parser.add_argument(
+        "-e", "--expression", action="append", metavar="EXPR",
+        help="计算表达式并输出结果后退出，可重复指定"
+    )
+    parser.add_argument(
+        "--batch", metavar="FILE",
+        help="流式批量计算文件中的表达式，每行一个结果，- 表示标准输入；"
+             "出错的行输出空行，错误信息写入标准错误或 --errors 指定的文件"
+    )
+    parser.add_argument(
+        "--column", metavar="NAME|INDEX",
+        help="把批量输入作为CSV读取，计算指定列（列名或从0开始的列号）"
+    )
+    parser.add_argument(
+        "--no-header", action="store_true",
+        help="CSV输入没有表头"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=1, metavar="N",
+        help="批量计算使用的工作进程数（默认1，在当前进程中计算）"
+    )
+    parser.add_argument(
+        "--chunk-size", type=int, default=1000, metavar="N",
+        help="分发到工作进程的每块表达式数量（默认1000）"
+    )
+    parser.add_argument(
+        "-o", "--output", metavar="FILE",
+        help="批量计算结果的输出文件，默认为标准输出"
+    )
+    parser.add_argument(
+        "--errors", metavar="FILE",
+        help="批量计算错误信息的输出文件，默认为标准错误"
+    )
+    parser.add_argument(
+        "--exact", action="store_true",
+        help="以精确有理数计算（0.1+0.2 正好等于 0.3），结果按精度舍入为小数"
+    )
+    parser.add_argument(
+        "--fraction", action="store_true",
+        help="精确模式下把结果显示为分数（如 1/3），不做舍入"
+    )
+    parser.add_argument(
+        "--decimal", action="store_true",
+        help="以十进制高精度计算，--precision 为有效数字位数"
+    )
+    parser.add_argument(
+        "--precision", type=int, metavar="N",
+        help="精确模式结果的小数位数或十进制模式的有效数字位数，默认使用配置中的 precision"
+    )
+    parser.add_argument(
+        "--save-history", action="store_true",
+        help="把成功的计算追加到历史记录（JSONL存储）"
+    )
+    return parser
+
+
+def build_convert_parser():
+    """创建 convert 子命令的参数解析器"""
+    import argparse
+
+    parser = argparse.ArgumentParser(
+        prog="python -m calculator convert",
+        description="在2、4、8、16、32进制之间流式转换文件中的数字，内存占用与文件大小无关"
+    )
+    parser.add_argument("input", metavar="FILE", help="输入文件，数字之间的空白和换行被忽略")
+    parser.add_argument("--from", dest="from_base", type=int, required=True, metavar="BASE", help="源进制")
+    parser.add_argument("--to", dest="to_base", type=int, required=True, metavar="BASE", help="目标进制")
+    parser.add_argument(
+        "-o", "--output", metavar="FILE",
+        help="输出文件，默认为标准输出"
+    )
+    parser.add_argument(
+        "--chunk-digits", type=int, default=1 << 20, metavar="N",
+        help="每段的输入数字个数（默认1048576），决定内存占用"
+    )
+    parser.add_argument(
+        "--preserve-width", action="store_true",
+        help="保留前导0，输出位数由输入的总位数决定"
+    )
+    return parser
+
+
+def run_convert(argv, out=None, err=None):
+    """convert 子命令：流式转换文件中的数字
+
+    Args:
+        argv: 子命令之后的参数列表
+        out: 结果输出流，默认为标准输出或 --output 指定的文件
+        err: 错误输出流，默认为标准错误
+
+    Returns:
+        退出码，成功为0，出错为1
+    """
+    from calculator.core.radix_stream import convert_file
+
+    args = build_convert_parser().parse_args(argv)
+    err = err or sys.stderr
+    if args.chunk_digits < 1:
+        err.write("错误: 每段的数字个数必须大于0\n")
+        return 1
+    try:
+        if out is None and args.output:
+            with open(args.output, 'w', encoding='ascii', newline='') as stream:
+                convert_file(args.input, stream, args.from_base, args.to_base,
+                             args.chunk_digits, args.preserve_width)
+                stream.write("\n")
+        else:
+            out = out or sys.stdout
+            convert_file(args.input, out, args.from_base, args.to_base,
+                         args.chunk_digits, args.preserve_width)
+            out.write("\n")
+    except (ValueError, OSError) as e:
+        err.write(f"错误: {e}\n")
+        return 1
+    return 0
+
+
+class _HistoryRecorder:
+    """按需创建历史记录管理器，未启用时不导入 calculator.data
+
+    历史记录使用jsonl存储，每条记录同步追加到文件，退出前不需要刷新。
+    """
+
+    def __init__(self, enabled):
+        self.enabled = enabled
+        self._manager = None
+
+    def record(self, expression, result):
+        if not self.enabled:
+            return
+        if self._manager is None:
+            from calculator.data.history_manager import HistoryManager
+            self._manager = HistoryManager(storage="jsonl")
+        self._manager.add_history_item(expression, result)
+
+
+def run_expressions(expressions, recorder, out=None, err=None, exact=False, precision=None,
+                    decimal_precision=None):
+    """依次计算给定的表达式
+
+    Args:
+        expressions: 表达式字符串的可迭代对象
+        recorder: 历史记录器
+        out: 结果输出流，默认为标准输出
+        err: 错误输出流，默认为标准错误
+        exact: 是否以精确有理数计算
+        precision: 精确模式结果的小数位数，为None时显示为分数
+        decimal_precision: 以指定有效数字位数的 Decimal 计算，为None时不使用
+
+    Returns:
+        退出码，全部成功为0，有任何错误为1
+    """
+    out = out or sys.stdout
+    err = err or sys.stderr
+    status = 0
+    for expression in expressions:
+        try:
+            result = evaluate(expression, exact, precision, decimal_precision)
+        except ValueError as e:
+            err.write(f"错误: {e}\n")
+            status = 1
+            continue
+        out.write(result + "\n")
+        recorder.record(expression, result)
+    return status
+
+
+def run_batch(args, out=None, err=None, precision=None, decimal_precision=None):
+    """流式批量计算
+
+    Args:
+        args: 解析后的命令行参数
+        out: 结果输出流，默认为标准输出或 --output 指定的文件
+        err: 错误输出流，默认为标准错误或 --errors 指定的文件
+        precision: 精确模式结果的小数位数，为None时显示为分数
+        decimal_precision: 以指定有效数字位数的 Decimal 计算，为None时不使用
+
+    Returns:
+        退出码，全部成功为0，有任何错误为1
+    """
+    from contextlib import ExitStack
+
+    from calculator.core.batch import evaluate_stream, read_csv_column, read_lines
+
+    with ExitStack() as stack:
+        if args.batch == "-":
+            source = sys.stdin
+        else:
+            source = stack.enter_context(open(args.batch, 'r', encoding='utf-8', newline=''))
+        if out is None:
+            out = stack.enter_context(open(args.output, 'w', encoding='utf-8')) if args.output else sys.stdout
+        if err is None:
+            err = stack.enter_context(open(args.errors, 'w', encoding='utf-8')) if args.errors else sys.stderr
+
+        if args.column is not None:
+            column = int(args.column) if args.column.isdigit() else args.column
+            items = read_csv_column(source, column, has_header=not args.no_header)
+        else:
+            items = read_lines(source)
+
+        status = 0
+        try:
+            if args.exact:
+                format_value = exact_formatter(precision)
+            elif decimal_precision is not None:
+                format_value = decimal_formatter()
+            else:
+                format_value = format_result
+            results = evaluate_stream(
+                items, workers=args.workers, chunk_size=args.chunk_size,
+                exact=args.exact, decimal_precision=decimal_precision
+            )
+            for result in results:
+                if result.error is None:
+                    out.write(format_value(result.value) + "\n")
+                else:
+                    # 输出空行保持与输入逐行对应，错误写入错误通道
+                    out.write("\n")
+                    err.write(f"第{result.line}行: {result.expression}: {result.error}\n")
+                    status = 1
+        except ValueError as e:
+            err.write(f"错误: {e}\n")
+            return 2
+        return status
+
+
+def run_repl(recorder, stdin=None, out=None, err=None, exact=False, precision=None,
+             decimal_precision=None):
+    """运行交互式REPL；标准输入不是终端时不显示提示符，逐行计算
+
+    Args:
+        recorder: 历史记录器
+        stdin: 输入流，默认为标准输入
+        out: 结果输出流，默认为标准输出
+        err: 错误输出流，默认为标准错误
+        exact: 是否以精确有理数计算
+        precision: 精确模式结果的小数位数，为None时显示为分数
+        decimal_precision: 以指定有效数字位数的 Decimal 计算，为None时不使用
+
+    Returns:
+        退出码
+    """
+    stdin = stdin or sys.stdin
+    out = out or sys.stdout
+    err = err or sys.stderr
+    interactive = stdin.isatty()
+    if interactive:
+        try:
+            import readline  # noqa: F401  提供行编辑和上下键历史
+        except ImportError:
+            pass
+        out.write("Python多功能计算器，输入 :help 查看帮助\n")
+
+    session = []
+    status = 0
+    while True:
+        if interactive:
+            try:
+                line = input(PROMPT)
+            except EOFError:
+                out.write("\n")
+                break
+            except KeyboardInterrupt:
+                out.write("\n")
+                continue
+        else:
+            line = stdin.readline()
+            if not line:
+                break
+        line = line.strip()
+        if not line:
+            continue
+
+        if line in (":quit", ":q", "exit", "quit"):
+            break
+        if line == ":help":
+            out.write(REPL_HELP + "\n")
+            continue
+        if line == ":history":
+            for item in session:
+                out.write(item + "\n")
+            continue
+
+        try:
+            result = evaluate(line, exact, precision, decimal_precision)
+        except ValueError as e:
+            err.write(f"错误: {e}\n")
+            status = 1
+            continue
+        out.write(result + "\n")
+        session.append(f"{line} = {result}")
+        recorder.record(line, result)
+    # 交互模式下单个输入错误不影响退出码
+    return 0 if interactive else status
+
+
+def main(argv=None):
+    """命令行主函数
+
+    Args:
+        argv: 命令行参数列表，默认为 sys.argv[1:]
+
+    Returns:
+        退出码
+    """
+    if argv is None:
+        argv = sys.argv[1:]
+    if argv[:1] == ["convert"]:
+        return run_convert(argv[1:])
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.exact and args.decimal:
+        parser.error("--exact 和 --decimal 不能同时使用")
+    if args.fraction and not args.exact:
+        parser.error("--fraction 只能与 --exact 一起使用")
+    if args.precision is not None and not (args.exact or args.decimal):
+        parser.error("--precision 只能与 --exact 或 --decimal 一起使用")
+    if args.precision is not None and args.fraction:
+        parser.error("--fraction 显示分数，不能与 --precision 一起使用")
+    if args.save_history and args.batch:
+        parser.error("--save-history 不能用于 --batch 批量计算")
+    precision = None
+    decimal_precision = None
+    if args.exact and not args.fraction:
+        precision = args.precision if args.precision is not None else configured_precision()
+    elif args.decimal:
+        decimal_precision = args.precision if args.precision is not None else configured_precision()
+        if decimal_precision < 1:
+            parser.error("十进制模式的有效数字位数必须大于0")
+    options = {'exact': args.exact, 'precision': precision, 'decimal_precision': decimal_precision}
+    recorder = _HistoryRecorder(args.save_history)
+    if args.expression:
+        return run_expressions(args.expression, recorder, **options)
+    if args.batch:
+        return run_batch(args, precision=precision, decimal_precision=decimal_precision)
+    return run_repl(recorder, **options)
@@ -1,13 +1,34 @@
-"""核心计算模块包"""
-
-from .arithmetic import ArithmeticCalculator
-from .scientific import ScientificCalculator
-from .unit_converter import UnitConverter
-from .base_converter import BaseConverter
-
-__all__ = [
-    'ArithmeticCalculator',
-    'ScientificCalculator',
-    'UnitConverter',
-    'BaseConverter'
-]
\ No newline at end of file
+"""核心计算模块包
+
+包中的类和函数在第一次访问时才导入对应的子模块（模块级 __getattr__），
+导入本包不会加载用不到的计算器，也不会因为向量化模块而导入NumPy。
+"""
+
+import importlib
+
+# 公开名称 -> 定义它的子模块
+_LAZY_ATTRIBUTES = {
+    'ArithmeticCalculator': 'arithmetic',
+    'ScientificCalculator': 'scientific',
+    'UnitConverter': 'unit_converter',
+    'BaseConverter': 'base_converter',
+    'VectorizedExpression': 'vectorized',
+    'compile_vectorized': 'vectorized',
+    'IncrementalEvaluator': 'incremental',
+    'DecimalContext': 'decimal_context',
+    'ProgrammerCalculator': 'programmer'
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+def __getattr__(name):
+    """第一次访问公开名称时导入对应的子模块，并缓存到包的命名空间"""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,9 +1,12 @@
-import re
-import ast
+from .expression_cache import ExpressionCache
+from .expression_parser import compile_expression
 
 class ArithmeticCalculator:
     """算术运算计算器类，提供基本的数学运算功能"""
     
+    # 已编译表达式的LRU缓存，所有实例共享
+    _expression_cache = ExpressionCache(maxsize=256)
+    
     @staticmethod
     def add(a, b):
         """加法运算"""
@@ -51,85 +54,136 @@ class ArithmeticCalculator:
         return 1 / a
     
     @staticmethod
-    def factorial(n):
-        """阶乘运算"""
-        if not isinstance(n, int) or n < 0:
-            raise ValueError("阶乘只能计算非负整数")
-        if n == 0 or n == 1:
-            return 1
-        result = 1
-        for i in range(2, n + 1):
-            result *= i
-        return result
+    def factorial(n, max_digits=None):
+        """阶乘运算
+        
+        小的n查表，大的n用二分乘积，见 calculator.core.factorial。
+        
+        Args:
+            n: 非负整数
+            max_digits: 结果的位数上限；设置后先估算位数，超过上限时报错而不开始计算
+            
+        Returns:
+            n!
+            
+        Raises:
+            ValueError: n不是非负整数，或结果位数超过上限
+        """
+        from .factorial import factorial
+        return factorial(n, max_digits)
     
     @staticmethod
-    def evaluate_expression(expression):
+    def evaluate_expression(expression, auto_close=False):
         """计算带括号的表达式
         
+        相同的表达式字符串只在第一次计算时做解析，编译得到的字节码
+        保存在LRU缓存中，之后直接由栈式虚拟机执行。
+        
         Args:
-            expression: 字符串形式的数学表达式，支持+、-、*、/、()
+            expression: 字符串形式的数学表达式，支持+、-、*、/、×、÷、()以及隐式乘法
+            auto_close: 是否自动补全未闭合的括号
             
         Returns:
             计算结果
             
+        Raises:
+            ValueError: 表达式无效或包含不支持的操作；语法错误为
+                ExpressionSyntaxError，其position属性为出错位置
+        """
+        return ArithmeticCalculator._run_expression(expression, auto_close, None)
+    
+    @staticmethod
+    def evaluate_exact(expression, auto_close=False):
+        """以精确有理数计算表达式
+        
+        数字由文本直接转换为 fractions.Fraction，加减乘除都没有舍入误差，
+        例如 0.1+0.2 的结果正好是 Fraction(3, 10)。结果可用
+        calculator.core.exact.format_fraction 显示为分数或按精度舍入的小数。
+        
+        Args:
+            expression: 字符串形式的数学表达式，语法与 evaluate_expression 相同
+            auto_close: 是否自动补全未闭合的括号
+            
+        Returns:
+            Fraction 类型的计算结果
+            
         Raises:
             ValueError: 表达式无效或包含不支持的操作
         """
-        # 验证表达式只包含允许的字符
-        if not re.match(r'^[0-9\s\+\-\*/\.\(\)]*$', expression):
-            raise ValueError("表达式包含不支持的字符")
+        # fractions 只在使用精确模式时导入
+        from .exact import EXACT_NUMBER
+        return ArithmeticCalculator._run_expression(expression, auto_close, EXACT_NUMBER)
+    
+    @staticmethod
+    def evaluate_decimal(expression, auto_close=False, precision=28):
+        """以十进制高精度计算表达式
         
-        # 检查括号是否匹配
-        open_brackets = expression.count('(')
-        close_brackets = expression.count(')')
-        if open_brackets != close_brackets:
-            raise ValueError("括号不匹配")
+        数字由文本直接转换为 decimal.Decimal，每一步运算都在当前线程的局部
+        上下文中舍入到precision位有效数字，见 calculator.core.decimal_context。
         
-        try:
-            # 使用ast.literal_eval计算表达式 - 更安全的方式
-            # 先将表达式转换为可安全计算的形式
-            # 替换乘法符号以避免解释为元组
-            expression = expression.replace('*', '*')
+        Args:
+            expression: 字符串形式的数学表达式，语法与 evaluate_expression 相同
+            auto_close: 是否自动补全未闭合的括号
+            precision: 有效数字位数
             
-            # 定义安全的计算函数
-            def safe_eval(node):
-                if isinstance(node, ast.Constant):
-                    return node.value
-                elif isinstance(node, ast.BinOp):
-                    left = safe_eval(node.left)
-                    right = safe_eval(node.right)
-                    if isinstance(node.op, ast.Add):
-                        return left + right
-                    elif isinstance(node.op, ast.Sub):
-                        return left - right
-                    elif isinstance(node.op, ast.Mult):
-                        return left * right
-                    elif isinstance(node.op, ast.Div):
-                        if right == 0:
-                            raise ValueError("除数不能为零")
-                        return left / right
-                    else:
-                        raise ValueError(f"不支持的操作符: {type(node.op).__name__}")
-                elif isinstance(node, ast.UnaryOp):
-                    operand = safe_eval(node.operand)
-                    if isinstance(node.op, ast.USub):
-                        return -operand
-                    elif isinstance(node.op, ast.UAdd):
-                        return operand
-                    else:
-                        raise ValueError(f"不支持的一元操作符: {type(node.op).__name__}")
-                else:
-                    raise ValueError(f"不支持的表达式节点: {type(node).__name__}")
+        Returns:
+            Decimal 类型的计算结果
             
-            # 解析表达式
-            tree = ast.parse(expression, mode='eval')
-            # 计算表达式
-            result = safe_eval(tree.body)
+        Raises:
+            ValueError: 表达式无效、精度无效或计算错误
+        """
+        # decimal 只在使用十进制模式时导入
+        from .decimal_context import get_decimal_context
+        return get_decimal_context(precision).evaluate(expression, auto_close)
+    
+    @staticmethod
+    def _run_expression(expression, auto_close, number):
+        """编译（或从缓存取出）并执行表达式
+        
+        Args:
+            expression: 表达式字符串
+            auto_close: 是否自动补全未闭合的括号
+            number: 数字常量的数值类型，None表示int/float
             
-            return result
-        except SyntaxError:
-            raise ValueError("表达式语法错误")
+        Returns:
+            计算结果
+        """
+        compiled = ArithmeticCalculator._expression_cache.get_or_compile(
+            (expression, auto_close, number), ArithmeticCalculator._compile_expression
+        )
+        try:
+            return compiled.run()
+        except ValueError:
+            raise
         except Exception as e:
-            if isinstance(e, ValueError):
-                raise
-            raise ValueError(f"计算错误: {str(e)}")
\ No newline at end of file
+            raise ValueError(f"计算错误: {str(e)}")
+    
+    @staticmethod
+    def expression_cache_info():
+        """获取表达式缓存的统计信息
+        
+        Returns:
+            包含hits、misses、evictions、size、maxsize的字典
+        """
+        return ArithmeticCalculator._expression_cache.info()
+    
+    @staticmethod
+    def clear_expression_cache():
+        """清空表达式缓存"""
+        ArithmeticCalculator._expression_cache.clear()
+    
+    @staticmethod
+    def _compile_expression(key):
+        """将表达式编译为字节码
+        
+        Args:
+            key: (表达式字符串, 是否自动补全括号, 数值类型) 元组
+            
+        Returns:
+            CompiledExpression对象
+            
+        Raises:
+            ExpressionSyntaxError: 表达式语法错误
+        """
+        expression, auto_close, number = key
+        return compile_expression(expression, auto_close=auto_close, number=number)
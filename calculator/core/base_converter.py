@@ -1,3 +1,8 @@
+from .radix import SUPPORTED_BASES, base_to_int, group_digits, int_to_base
+
+# 常用进制的中文名称，其他进制显示为“N进制”
+_BASE_NAMES = {2: "二进制", 8: "八进制", 10: "十进制", 16: "十六进制"}
+
 class BaseConverter:
     """进制转换器类，提供不同进制之间的数值转换功能"""
     
@@ -11,21 +16,7 @@ class BaseConverter:
         Returns:
             二进制字符串
         """
-        if decimal_num == 0:
-            return "0"
-        
-        # 处理负数
-        is_negative = decimal_num < 0
-        decimal_num = abs(decimal_num)
-        
-        result = []
-        while decimal_num > 0:
-            result.append(str(decimal_num % 2))
-            decimal_num = decimal_num // 2
-        
-        if is_negative:
-            return "-" + "".join(reversed(result))
-        return "".join(reversed(result))
+        return int_to_base(decimal_num, 2)
     
     @staticmethod
     def decimal_to_octal(decimal_num):
@@ -37,21 +28,7 @@ class BaseConverter:
         Returns:
             八进制字符串
         """
-        if decimal_num == 0:
-            return "0"
-        
-        # 处理负数
-        is_negative = decimal_num < 0
-        decimal_num = abs(decimal_num)
-        
-        result = []
-        while decimal_num > 0:
-            result.append(str(decimal_num % 8))
-            decimal_num = decimal_num // 8
-        
-        if is_negative:
-            return "-" + "".join(reversed(result))
-        return "".join(reversed(result))
+        return int_to_base(decimal_num, 8)
     
     @staticmethod
     def decimal_to_hexadecimal(decimal_num):
@@ -63,22 +40,7 @@ class BaseConverter:
         Returns:
             十六进制字符串
         """
-        if decimal_num == 0:
-            return "0"
-        
-        # 处理负数
-        is_negative = decimal_num < 0
-        decimal_num = abs(decimal_num)
-        
-        hex_chars = "0123456789ABCDEF"
-        result = []
-        while decimal_num > 0:
-            result.append(hex_chars[decimal_num % 16])
-            decimal_num = decimal_num // 16
-        
-        if is_negative:
-            return "-" + "".join(reversed(result))
-        return "".join(reversed(result))
+        return int_to_base(decimal_num, 16)
     
     @staticmethod
     def binary_to_decimal(binary_str):
@@ -126,36 +88,93 @@ class BaseConverter:
             raise ValueError("无效的十六进制字符串")
     
     @staticmethod
-    def convert(number_str, from_base, to_base):
+    def convert(number_str, from_base, to_base, group_size=0, separator=" ", max_fraction_digits=None):
         """通用进制转换函数
         
         Args:
-            number_str: 数字字符串
-            from_base: 源进制 (2, 8, 10, 16)
-            to_base: 目标进制 (2, 8, 10, 16)
+            number_str: 数字字符串，36进制以内字母不区分大小写，数字间可以有空格；
+                可以带小数点（如 "1A.8"），小数部分可以用括号表示循环节（如 "0.(3)"）；
+                整数和小数都接受 int() 的 0b、0o、0x 前缀和数字之间的下划线
+            from_base: 源进制，2到36或62
+            to_base: 目标进制，2到36或62
+            group_size: 结果的整数部分从右向左每多少位分为一组，0表示不分组
+            separator: 分组的分隔符
+            max_fraction_digits: 结果最多的小数位数，为None时使用默认值（64位）
+        
+        Returns:
+            转换后的数字字符串；循环小数的循环节放在括号中，如十进制 0.1 的二进制为
+            "0.0(0011)"，小数位数超过上限时截断并以 "..." 结尾
+            
+        Raises:
+            ValueError: 进制无效或数字字符串无效
+        """
+        if "." in number_str:
+            from .radix_fraction import DEFAULT_FRACTION_DIGITS, convert_fraction
+            if max_fraction_digits is None:
+                max_fraction_digits = DEFAULT_FRACTION_DIGITS
+            return convert_fraction(number_str, from_base, to_base, max_fraction_digits, group_size, separator)
+        # 转换为整数，再转换为目标进制；十进制的输入输出都不受 int()/str() 的长度限制
+        result = int_to_base(base_to_int(number_str, from_base), to_base)
+        if group_size:
+            result = group_digits(result, group_size, separator)
+        return result
+    
+    @staticmethod
+    def convert_many(numbers, from_base, to_base, group_size=0, separator=" ", max_fraction_digits=None):
+        """批量转换多个数字（如测量日志的各行），单条出错不中断整批
+        
+        Args:
+            numbers: 数字字符串的可迭代对象，空白行被跳过
+            from_base、to_base、group_size、separator、max_fraction_digits: 见 convert
         
         Returns:
-            转换后的数字字符串
+            ConversionResult 列表，每条包含序号（从1开始）、输入、结果和错误信息
+            
+        Raises:
+            ValueError: 进制或小数位数上限无效
         """
-        # 验证进制范围
-        if from_base not in [2, 8, 10, 16] or to_base not in [2, 8, 10, 16]:
-            raise ValueError("进制必须是2、8、10或16")
+        from .radix_fraction import DEFAULT_FRACTION_DIGITS, convert_many
+        if max_fraction_digits is None:
+            max_fraction_digits = DEFAULT_FRACTION_DIGITS
+        return list(convert_many(numbers, from_base, to_base, max_fraction_digits, group_size, separator))
+    
+    @staticmethod
+    def float_bits(value, format_name='float64'):
+        """查看数值按IEEE-754 float32/float64存储时的位模式
         
-        # 转换为十进制
-        try:
-            decimal_num = int(number_str, from_base)
-        except ValueError:
-            raise ValueError(f"无效的{from_base}进制数字字符串")
-        
-        # 从十进制转换为目标进制
-        if to_base == 2:
-            return BaseConverter.decimal_to_binary(decimal_num)
-        elif to_base == 8:
-            return BaseConverter.decimal_to_octal(decimal_num)
-        elif to_base == 10:
-            return str(decimal_num)
-        elif to_base == 16:
-            return BaseConverter.decimal_to_hexadecimal(decimal_num)
+        Args:
+            value: 数值或十进制数字文本
+            format_name: 'float32' 或 'float64'
+        
+        Returns:
+            FloatBits，包含16进制和分组的2进制位模式、符号、阶码、尾数字段和精确的十进制值
+            
+        Raises:
+            ValueError: 格式名或数值无效，或数值超出 float32 的范围
+        """
+        from .radix_fraction import float_bits
+        return float_bits(value, format_name)
+    
+    @staticmethod
+    def supported_bases():
+        """获取支持的全部进制
+        
+        Returns:
+            进制列表：2到36以及62
+        """
+        return list(SUPPORTED_BASES)
+    
+    @staticmethod
+    def base_name(base):
+        """获取进制的显示名称，如 "十六进制 (16)"、"36进制 (36)"
+        
+        Args:
+            base: 进制
+        
+        Returns:
+            显示名称
+        """
+        return f"{_BASE_NAMES.get(base, f'{base}进制')} ({base})"
     
     @staticmethod
     def validate_number(number_str, base):
@@ -169,7 +188,11 @@ class BaseConverter:
             bool: 是否有效
         """
         try:
-            int(number_str, base)
+            if "." in number_str:
+                from .radix_fraction import parse_fraction
+                parse_fraction(number_str, base)
+            else:
+                base_to_int(number_str, base)
             return True
         except ValueError:
             return False
\ No newline at end of file
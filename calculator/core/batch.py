@@ -0,0 +1,151 @@
+"""流式批量计算模块
+
+用生成器流水线逐行读取表达式（文本文件、标准输入或CSV的某一列）、
+逐条计算并逐条产出结果，内存占用与输入规模无关。单行出错不会中断
+整个批次：错误信息随结果一起产出，由调用者写入单独的错误通道。
+
+指定 workers 时按块把表达式分发到进程池，同一时间最多有 workers*2 个块
+在途，结果按输入顺序产出。
+"""
+
+import csv
+from collections import deque, namedtuple
+from itertools import islice
+
+from .arithmetic import ArithmeticCalculator
+
+# 一条计算结果：行号（从1开始）、表达式、结果（出错时为None）、错误信息（成功时为None）
+BatchResult = namedtuple('BatchResult', ['line', 'expression', 'value', 'error'])
+
+
+def read_lines(stream):
+    """逐行读取表达式，跳过空行
+
+    Args:
+        stream: 文本流
+
+    Yields:
+        (行号, 表达式) 元组
+    """
+    for line_number, line in enumerate(stream, 1):
+        expression = line.strip()
+        if expression:
+            yield line_number, expression
+
+
+def read_csv_column(stream, column, has_header=True):
+    """从CSV的某一列读取表达式，跳过空单元格
+
+    Args:
+        stream: 文本流
+        column: 列名（需要表头）或从0开始的列号
+        has_header: 第一行是否为表头
+
+    Yields:
+        (行号, 表达式) 元组
+
+    Raises:
+        ValueError: 列名不存在
+    """
+    reader = csv.reader(stream)
+    index = column
+    if has_header:
+        header = next(reader, None)
+        if header is None:
+            return
+        if not isinstance(column, int):
+            if column not in header:
+                raise ValueError(f"CSV中没有列: {column}")
+            index = header.index(column)
+    elif not isinstance(column, int):
+        raise ValueError("没有表头时只能用列号指定列")
+
+    # 表头占第1行
+    for line_number, row in enumerate(reader, 2 if has_header else 1):
+        if index < len(row):
+            expression = row[index].strip()
+            if expression:
+                yield line_number, expression
+
+
+def _evaluator(exact, decimal_precision):
+    """按数值模式选择计算函数"""
+    if exact:
+        return ArithmeticCalculator.evaluate_exact
+    if decimal_precision is not None:
+        # 每个线程（和每个工作进程）使用自己的 decimal 上下文，互不影响
+        return lambda expression: ArithmeticCalculator.evaluate_decimal(expression, precision=decimal_precision)
+    return ArithmeticCalculator.evaluate_expression
+
+
+def evaluate_items(items, exact=False, decimal_precision=None):
+    """在当前进程中逐条计算
+
+    Args:
+        items: (行号, 表达式) 的可迭代对象
+        exact: 是否以精确有理数（Fraction）计算
+        decimal_precision: 以指定有效数字位数的 Decimal 计算，为None时不使用
+
+    Yields:
+        BatchResult
+    """
+    evaluate = _evaluator(exact, decimal_precision)
+    for line_number, expression in items:
+        try:
+            yield BatchResult(line_number, expression, evaluate(expression), None)
+        except ValueError as e:
+            yield BatchResult(line_number, expression, None, str(e))
+
+
+def _evaluate_chunk(chunk, exact=False, decimal_precision=None):
+    """进程池中执行的任务：计算一个块，返回结果列表"""
+    return list(evaluate_items(chunk, exact, decimal_precision))
+
+
+def _chunks(items, chunk_size):
+    """把可迭代对象切分为列表块"""
+    iterator = iter(items)
+    while True:
+        chunk = list(islice(iterator, chunk_size))
+        if not chunk:
+            return
+        yield chunk
+
+
+def evaluate_stream(items, workers=1, chunk_size=1000, exact=False, decimal_precision=None):
+    """流式计算表达式
+
+    Args:
+        items: (行号, 表达式) 的可迭代对象，如 read_lines 或 read_csv_column 的结果
+        workers: 工作进程数，小于等于1时在当前进程中计算
+        chunk_size: 分发到工作进程的每块表达式数量
+        exact: 是否以精确有理数（Fraction）计算
+        decimal_precision: 以指定有效数字位数的 Decimal 计算，为None时不使用
+
+    Yields:
+        按输入顺序排列的 BatchResult
+
+    Raises:
+        ValueError: 参数无效
+    """
+    if chunk_size < 1:
+        raise ValueError("块大小必须大于0")
+    if exact and decimal_precision is not None:
+        raise ValueError("精确分数模式和十进制模式不能同时使用")
+    if workers is None or workers <= 1:
+        yield from evaluate_items(items, exact, decimal_precision)
+        return
+
+    # 进程池只在需要时导入
+    from concurrent.futures import ProcessPoolExecutor
+
+    max_in_flight = workers * 2
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        in_flight = deque()
+        for chunk in _chunks(items, chunk_size):
+            in_flight.append(executor.submit(_evaluate_chunk, chunk, exact, decimal_precision))
+            # 在途的块达到上限时先产出最早的块，保证顺序和内存上限
+            if len(in_flight) >= max_in_flight:
+                yield from in_flight.popleft().result()
+        while in_flight:
+            yield from in_flight.popleft().result()
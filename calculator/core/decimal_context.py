@@ -0,0 +1,465 @@
+"""十进制高精度计算模块
+
+DecimalContext 以 decimal.Decimal 按指定的有效数字位数计算表达式和科学函数：
+
+    - 四则运算直接由字节码虚拟机在 Decimal 上执行（C实现的 libmpdec），
+      数字由文本直接转换为 Decimal，不经过二进制浮点数
+    - exp、ln、log10、sqrt 使用 Decimal 自带的正确舍入实现
+    - sin、cos、atan 等 decimal 模块没有的函数用泰勒级数计算：先做参数约简，
+      再在多出几位保护位数的精度下求和，最后舍入到要求的位数
+    - π、e 等常数按精度缓存，同一精度只计算一次
+
+每个线程使用自己的 decimal.Context 副本（保存在 threading.local 中），表达式
+在 decimal.localcontext 中计算：不修改调用者的上下文，多个线程（如并行的
+批量计算）之间也不共享上下文的状态标志等可变状态。
+"""
+
+import decimal
+import threading
+from decimal import Decimal
+from functools import lru_cache
+
+# 默认有效数字位数，与 decimal 模块的默认上下文一致
+DEFAULT_PRECISION = 28
+
+# 级数求和与常数计算额外使用的保护位数
+_GUARD_DIGITS = 10
+
+_TRAPS = [decimal.DivisionByZero, decimal.InvalidOperation, decimal.Overflow]
+
+
+def parse_decimal(text):
+    """把解析器校验过的数字文本转换为 Decimal（精确转换，不做舍入）"""
+    return Decimal(text)
+
+
+@lru_cache(maxsize=32)
+def _pi(digits):
+    """π，保留 digits 位有效数字（用整数运算的 Machin 公式计算）"""
+    scale = 10 ** (digits + _GUARD_DIGITS)
+
+    def arctan_inverse(x):
+        # scale * atan(1/x)
+        power = total = scale // x
+        x_squared = x * x
+        n = 3
+        sign = -1
+        while power:
+            power //= x_squared
+            total += sign * (power // n)
+            sign = -sign
+            n += 2
+        return total
+
+    pi_scaled = 4 * (4 * arctan_inverse(5) - arctan_inverse(239))
+    with decimal.localcontext(decimal.Context(prec=digits)):
+        return +Decimal(pi_scaled).scaleb(-(digits + _GUARD_DIGITS))
+
+
+@lru_cache(maxsize=32)
+def _e(digits):
+    """自然对数的底e，保留 digits 位有效数字"""
+    return Decimal(1).exp(decimal.Context(prec=digits))
+
+
+def _sin_series(x):
+    """sin 的泰勒级数，在当前上下文的精度下求和，适用于 |x| 较小的情况"""
+    x_squared = x * x
+    term = total = x
+    n = 1
+    previous = None
+    while total != previous:
+        previous = total
+        term = -term * x_squared / ((n + 1) * (n + 2))
+        total += term
+        n += 2
+    return total
+
+
+def _cos_series(x):
+    """cos 的泰勒级数，在当前上下文的精度下求和，适用于 |x| 较小的情况"""
+    x_squared = x * x
+    term = total = Decimal(1)
+    n = 0
+    previous = None
+    while total != previous:
+        previous = total
+        term = -term * x_squared / ((n + 1) * (n + 2))
+        total += term
+        n += 2
+    return total
+
+
+def _atan_series(x):
+    """atan 的泰勒级数 x - x³/3 + x⁵/5 - ...，适用于 |x| 较小的情况"""
+    x_squared = x * x
+    power = total = x
+    n = 1
+    previous = None
+    while total != previous:
+        previous = total
+        power = -power * x_squared
+        n += 2
+        total += power / n
+    return total
+
+
+def _atan(x):
+    """反正切，在当前上下文的精度下计算，结果不做最终舍入"""
+    sign = -1 if x < 0 else 1
+    x = abs(x)
+    # |x|>1 时 atan(x) = π/2 - atan(1/x)
+    invert = x > 1
+    if invert:
+        x = 1 / x
+    # 倍角约简 atan(x) = 2·atan(x / (1 + sqrt(1 + x²)))，使级数快速收敛
+    halvings = 0
+    while x > Decimal("0.1"):
+        x = x / (1 + (1 + x * x).sqrt())
+        halvings += 1
+    value = _atan_series(x) * (2 ** halvings)
+    if invert:
+        value = _pi(decimal.getcontext().prec) / 2 - value
+    return sign * value
+
+
+def _asin(x):
+    """反正弦（|x| ≤ 1），在当前上下文的精度下计算，结果不做最终舍入"""
+    if abs(x) == 1:
+        return x * _pi(decimal.getcontext().prec) / 2
+    return _atan(x / (1 - x * x).sqrt())
+
+
+class DecimalContext:
+    """十进制高精度计算上下文
+
+    提供与 ArithmeticCalculator.evaluate_expression 相同语法的表达式计算，以及与
+    ScientificCalculator 同名的科学函数，可以在十进制模式下代替 ScientificCalculator。
+
+    用法：
+        context = DecimalContext(50)
+        context.evaluate("1/3")   # Decimal('0.33333333333333333333333333333333333333333333333333')
+        context.sin(1)
+    """
+
+    def __init__(self, precision=DEFAULT_PRECISION):
+        """初始化上下文
+
+        Args:
+            precision: 有效数字位数
+
+        Raises:
+            ValueError: 精度不是正整数
+        """
+        if not isinstance(precision, int) or isinstance(precision, bool) or precision < 1:
+            raise ValueError("精度必须是正整数")
+        self.precision = precision
+        # 模板上下文，每个线程第一次使用时复制一份
+        self._template = decimal.Context(prec=precision, rounding=decimal.ROUND_HALF_EVEN, traps=_TRAPS)
+        self._thread = threading.local()
+
+    def __repr__(self):
+        return f"DecimalContext(precision={self.precision})"
+
+    @property
+    def _context(self):
+        """当前线程的上下文"""
+        context = getattr(self._thread, 'context', None)
+        if context is None:
+            context = self._thread.context = self._template.copy()
+        return context
+
+    def localcontext(self):
+        """以本上下文（当前线程的副本）作为当前 decimal 上下文的上下文管理器
+
+        用法：
+            with context.localcontext():
+                Decimal(1) / 3   # 按 context.precision 位舍入
+        """
+        return decimal.localcontext(self._context)
+
+    def _working(self, extra_digits):
+        """精度增加 extra_digits 位的上下文，用于级数求和等中间计算"""
+        return decimal.Context(prec=self.precision + extra_digits, rounding=decimal.ROUND_HALF_EVEN, traps=_TRAPS)
+
+    def round(self, value):
+        """按本上下文的精度舍入"""
+        return self._context.plus(value)
+
+    def to_decimal(self, value):
+        """把 int、float、str 或 Decimal 转换为 Decimal
+
+        float 按其十进制表示转换（0.1 转换为 Decimal('0.1')），避免把二进制误差带入计算。
+        """
+        if isinstance(value, Decimal):
+            return value
+        if isinstance(value, float):
+            return Decimal(repr(value))
+        return Decimal(value)
+
+    # ---- 表达式与四则运算 ----
+
+    def evaluate(self, expression, auto_close=False):
+        """计算表达式
+
+        Args:
+            expression: 字符串形式的数学表达式，语法与 ArithmeticCalculator.evaluate_expression 相同
+            auto_close: 是否自动补全未闭合的括号
+
+        Returns:
+            Decimal 类型的计算结果，每一步运算都舍入到本上下文的精度
+
+        Raises:
+            ValueError: 表达式无效、除数为零或结果溢出
+        """
+        # 延迟导入，避免与 arithmetic 模块循环导入
+        from .arithmetic import ArithmeticCalculator
+        with self.localcontext():
+            return +ArithmeticCalculator._run_expression(expression, auto_close, parse_decimal)
+
+    def add(self, a, b):
+        """加法运算"""
+        return self._context.add(self.to_decimal(a), self.to_decimal(b))
+
+    def subtract(self, a, b):
+        """减法运算"""
+        return self._context.subtract(self.to_decimal(a), self.to_decimal(b))
+
+    def multiply(self, a, b):
+        """乘法运算"""
+        return self._context.multiply(self.to_decimal(a), self.to_decimal(b))
+
+    def divide(self, a, b):
+        """除法运算"""
+        b = self.to_decimal(b)
+        if b == 0:
+            raise ValueError("除数不能为零")
+        return self._context.divide(self.to_decimal(a), b)
+
+    def power(self, a, b):
+        """幂运算
+
+        Raises:
+            ValueError: 零做负数次幂、负数做非整数次幂，或结果溢出、不是有限数
+        """
+        a = self.to_decimal(a)
+        b = self.to_decimal(b)
+        # decimal 对零的负数次幂不发出 DivisionByZero 信号，而是返回 Infinity
+        if a == 0 and b < 0:
+            raise ValueError("零不能做负数次幂运算")
+        try:
+            result = self._context.power(a, b)
+        except decimal.InvalidOperation:
+            raise ValueError("负数不能做非整数次幂运算")
+        except decimal.Overflow:
+            raise ValueError("计算结果溢出")
+        if not result.is_finite():
+            raise ValueError("计算结果溢出")
+        return result
+
+    def square_root(self, a):
+        """平方根运算"""
+        a = self.to_decimal(a)
+        if a < 0:
+            raise ValueError("不能对负数求平方根")
+        return self._context.sqrt(a)
+
+    def cube_root(self, a):
+        """立方根运算，负数的立方根为负数"""
+        a = self.to_decimal(a)
+        if a == 0:
+            return Decimal(0)
+        working = self._working(_GUARD_DIGITS)
+        root = working.exp(working.divide(working.ln(abs(a)), 3))
+        # 一次牛顿迭代修正 exp/ln 引入的误差
+        root = working.divide(working.add(working.multiply(2, root), working.divide(abs(a), working.multiply(root, root))), 3)
+        return self.round(root if a > 0 else root.copy_negate())
+
+    # ---- 科学函数 ----
+
+    def pi(self):
+        """返回圆周率π"""
+        return _pi(self.precision)
+
+    def e(self):
+        """返回自然对数的底e"""
+        return _e(self.precision)
+
+    def radians(self, degrees):
+        """角度转弧度"""
+        working = self._working(_GUARD_DIGITS)
+        return self.round(working.divide(working.multiply(self.to_decimal(degrees), _pi(working.prec)), 180))
+
+    def degrees(self, radians):
+        """弧度转角度"""
+        working = self._working(_GUARD_DIGITS)
+        return self.round(working.divide(working.multiply(self.to_decimal(radians), 180), _pi(working.prec)))
+
+    def _reduced_angle(self, x, radians):
+        """把角度约简到 [-π/4, π/4]
+
+        Returns:
+            (约简后的角度, 象限k, 工作上下文)，原角度 = 约简后的角度 + k·π/2（模2π）
+        """
+        x = self.to_decimal(x)
+        # 参数越大，约简时需要的π位数越多
+        extra = _GUARD_DIGITS + max(0, x.adjusted())
+        working = self._working(extra)
+        with decimal.localcontext(working):
+            pi = _pi(working.prec)
+            if not radians:
+                x = x * pi / 180
+            half_pi = pi / 2
+            k = int((x / half_pi).to_integral_value(rounding=decimal.ROUND_HALF_EVEN))
+            reduced = x - k * half_pi
+        return reduced, k % 4, working
+
+    def sin(self, x, radians=True):
+        """正弦函数
+
+        Args:
+            x: 角度或弧度值
+            radians: True表示输入为弧度，False表示输入为角度
+        """
+        reduced, quadrant, working = self._reduced_angle(x, radians)
+        with decimal.localcontext(working):
+            if quadrant == 0:
+                value = _sin_series(reduced)
+            elif quadrant == 1:
+                value = _cos_series(reduced)
+            elif quadrant == 2:
+                value = -_sin_series(reduced)
+            else:
+                value = -_cos_series(reduced)
+        return self.round(value)
+
+    def cos(self, x, radians=True):
+        """余弦函数
+
+        Args:
+            x: 角度或弧度值
+            radians: True表示输入为弧度，False表示输入为角度
+        """
+        reduced, quadrant, working = self._reduced_angle(x, radians)
+        with decimal.localcontext(working):
+            if quadrant == 0:
+                value = _cos_series(reduced)
+            elif quadrant == 1:
+                value = -_sin_series(reduced)
+            elif quadrant == 2:
+                value = -_cos_series(reduced)
+            else:
+                value = _sin_series(reduced)
+        return self.round(value)
+
+    def tan(self, x, radians=True):
+        """正切函数
+
+        Args:
+            x: 角度或弧度值
+            radians: True表示输入为弧度，False表示输入为角度
+        """
+        reduced, quadrant, working = self._reduced_angle(x, radians)
+        with decimal.localcontext(working):
+            sin_value = _sin_series(reduced)
+            cos_value = _cos_series(reduced)
+            if quadrant % 2:
+                sin_value, cos_value = cos_value, -sin_value
+            # 约简后余弦在本精度下为零，即角度为90度的奇数倍
+            if abs(cos_value) < Decimal(1).scaleb(-self.precision):
+                raise ValueError("正切函数在90度的奇数倍处无定义")
+            value = sin_value / cos_value
+        return self.round(value)
+
+    def atan(self, x):
+        """反正切函数，返回弧度值"""
+        x = self.to_decimal(x)
+        working = self._working(_GUARD_DIGITS)
+        with decimal.localcontext(working):
+            value = _atan(x)
+        return self.round(value)
+
+    def asin(self, x):
+        """反正弦函数，返回弧度值"""
+        x = self.to_decimal(x)
+        if x < -1 or x > 1:
+            raise ValueError("反正弦函数的输入值必须在[-1, 1]范围内")
+        working = self._working(_GUARD_DIGITS)
+        with decimal.localcontext(working):
+            value = _asin(x)
+        return self.round(value)
+
+    def acos(self, x):
+        """反余弦函数，返回弧度值"""
+        x = self.to_decimal(x)
+        if x < -1 or x > 1:
+            raise ValueError("反余弦函数的输入值必须在[-1, 1]范围内")
+        working = self._working(_GUARD_DIGITS)
+        with decimal.localcontext(working):
+            value = _pi(working.prec) / 2 - _asin(x)
+        return self.round(value)
+
+    def log(self, x, base=None):
+        """对数函数
+
+        Args:
+            x: 输入值
+            base: 底数，默认为自然对数（e）
+        """
+        x = self.to_decimal(x)
+        if x <= 0:
+            raise ValueError("对数函数的输入值必须大于零")
+        if base is None:
+            return self._context.ln(x)
+        base = self.to_decimal(base)
+        if base == 10:
+            return self._context.log10(x)
+        if base <= 0 or base == 1:
+            raise ValueError("对数的底数必须大于零且不等于1")
+        working = self._working(_GUARD_DIGITS)
+        return self.round(working.divide(working.ln(x), working.ln(base)))
+
+    def log10(self, x):
+        """常用对数（以10为底）"""
+        x = self.to_decimal(x)
+        if x <= 0:
+            raise ValueError("常用对数的输入值必须大于零")
+        return self._context.log10(x)
+
+    def exp(self, x):
+        """指数函数（e的x次方）"""
+        try:
+            return self._context.exp(self.to_decimal(x))
+        except decimal.Overflow:
+            raise ValueError("计算结果溢出")
+
+
+@lru_cache(maxsize=16)
+def get_decimal_context(precision=DEFAULT_PRECISION):
+    """获取指定精度的共享上下文，同一精度只创建一次
+
+    Args:
+        precision: 有效数字位数
+
+    Returns:
+        DecimalContext 对象
+    """
+    return DecimalContext(precision)
+
+
+def format_decimal(value):
+    """格式化十进制模式的结果：去掉末尾的0，数量级适中时不使用科学计数法
+
+    Args:
+        value: Decimal
+
+    Returns:
+        结果字符串
+    """
+    # 按数值本身的位数去掉末尾的0，不能用默认上下文（会舍入到28位）
+    value = value.normalize(decimal.Context(prec=max(1, len(value.as_tuple().digits))))
+    if value == 0:
+        return "0"
+    if -20 <= value.adjusted() < 40:
+        return format(value, 'f')
+    return str(value)
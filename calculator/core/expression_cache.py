@@ -0,0 +1,82 @@
+"""表达式编译缓存模块"""
+
+import threading
+from collections import OrderedDict
+
+
+class ExpressionCache:
+    """有界LRU缓存，保存已编译的表达式，并统计命中、未命中和淘汰次数"""
+
+    def __init__(self, maxsize=256):
+        """初始化缓存
+
+        Args:
+            maxsize: 最多保存的已编译表达式数量
+        """
+        if not isinstance(maxsize, int) or maxsize <= 0:
+            raise ValueError("缓存容量必须是正整数")
+        self.maxsize = maxsize
+        self._entries = OrderedDict()
+        # 预览计算可能在工作线程中进行，读写缓存需要加锁
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def get_or_compile(self, key, compiler):
+        """获取已编译的表达式，不存在时调用compiler编译并放入缓存
+
+        Args:
+            key: 缓存键（通常是表达式字符串）
+            compiler: 接收key并返回编译结果的函数，编译失败时应抛出异常
+
+        Returns:
+            编译结果
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return entry
+            self.misses += 1
+
+        # 编译在锁外进行，避免长表达式阻塞其他线程；编译失败的表达式不缓存
+        entry = compiler(key)
+
+        with self._lock:
+            self._entries[key] = entry
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return entry
+
+    def clear(self):
+        """清空缓存并重置统计"""
+        with self._lock:
+            self._entries.clear()
+            self.hits = 0
+            self.misses = 0
+            self.evictions = 0
+
+    def info(self):
+        """获取缓存统计信息
+
+        Returns:
+            包含hits、misses、evictions、size、maxsize的字典
+        """
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(self._entries),
+                "maxsize": self.maxsize
+            }
+
+    def __len__(self):
+        return len(self._entries)
+
+    def __contains__(self, key):
+        return key in self._entries
@@ -0,0 +1,457 @@
+"""表达式词法分析与语法分析模块
+
+提供一个单遍的分词器和基于绑定力（Pratt）的运算符优先级解析器，
+直接把表达式编译为栈式虚拟机的字节码（见 expression_vm），取代 ast.parse。
+
+支持的语法：
+    - 数字：整数和小数（如 12、3.5、.5、2.）
+    - 运算符：+、-、*、/，以及显示用的 ×、÷
+    - 一元正负号：-3、+(2)、2*-3
+    - 括号，以及隐式乘法：2(3+4)、(1+2)(3+4)、(1+2)3
+    - 可选的自动补全未闭合括号
+    - 可选的命名变量（如 (a+b)*c/2），编译时给定变量表
+    - 可选的数值类型：默认整数为 int、小数为 float，也可以把数字文本
+      交给指定的类型（如 fractions.Fraction）转换，实现精确计算
+
+程序员模式的表达式由 compile_programmer_expression 编译，在上述语法之外支持
+位运算（& | ^ ~ << >>、循环移位 rol/ror、取余 %）和2、8、16进制的整数。
+"""
+
+import re
+import string
+
+from .expression_vm import (
+    BINARY_OPCODES, OP_ADD, OP_AND, OP_DIV, OP_LOAD, OP_MOD, OP_MUL, OP_NEG, OP_NOT, OP_OR,
+    OP_PUSH, OP_ROL, OP_ROR, OP_SHL, OP_SHR, OP_SUB, OP_XOR, CompiledExpression, new_code_buffer
+)
+
+# 可以出现在数字片段中的字符
+_NUMBER_CHARS = frozenset('0123456789.')
+
+# 变量名的首字符，以及启用变量时可以出现在单词片段中的字符
+_NAME_START_CHARS = frozenset(string.ascii_letters + '_')
+_WORD_CHARS = _NUMBER_CHARS | _NAME_START_CHARS
+
+# 词法单元类型
+NUMBER = 'number'
+NAME = 'name'
+OPERATOR = 'operator'
+LPAREN = '('
+RPAREN = ')'
+
+# 显示符号到运算符的映射
+_OPERATOR_ALIASES = {
+    '+': '+',
+    '-': '-',
+    '*': '*',
+    '/': '/',
+    '×': '*',
+    '÷': '/'
+}
+
+# 二元运算符的左绑定力；同级运算符左结合
+BINARY_BINDING_POWER = {
+    '+': 10,
+    '-': 10,
+    '*': 20,
+    '/': 20
+}
+
+# 一元前缀运算符的绑定力，高于所有二元运算符
+PREFIX_BINDING_POWER = 30
+
+# 运算符字符到运算符栈元素 (绑定力, 指令, 位置) 的映射；指令为 (操作码, 操作数)，
+# 二元运算符不需要记录位置
+_BINARY_OPERATORS = {
+    char: (BINARY_BINDING_POWER[op], (BINARY_OPCODES[op], 0), None)
+    for char, op in _OPERATOR_ALIASES.items()
+}
+_MULTIPLY = _BINARY_OPERATORS['*']
+_NEGATE = (OP_NEG, 0)
+
+
+class ExpressionSyntaxError(ValueError):
+    """表达式语法错误，记录出错位置（从0开始的字符下标）"""
+
+    def __init__(self, reason, position):
+        super().__init__(f"{reason}（第{position + 1}个字符）")
+        self.reason = reason
+        self.position = position
+
+
+def parse_number(text, position, number=None):
+    """将数字片段转换为数值
+
+    Args:
+        text: 已去除首尾空白的数字片段
+        position: 片段在表达式中的位置，用于报错
+        number: 数值类型，接收数字文本；为None时整数转换为int、小数转换为float
+
+    Returns:
+        int、float 或 number 类型的数值
+    """
+    if text.isascii():
+        if text.isdigit():
+            return int(text) if number is None else number(text)
+        integer_part, dot, fraction_part = text.partition('.')
+        digits = integer_part + fraction_part
+        if dot and digits.isdigit() and '.' not in fraction_part:
+            return float(text) if number is None else number(text)
+    _raise_number_error(text, position)
+
+
+def _raise_number_error(text, position):
+    """定位数字片段中第一个非法字符并抛出错误"""
+    seen_dot = False
+    for offset, char in enumerate(text):
+        if char == '.':
+            if seen_dot:
+                raise ExpressionSyntaxError("数字格式错误", position + offset)
+            seen_dot = True
+        elif not ('0' <= char <= '9'):
+            if char.isspace():
+                raise ExpressionSyntaxError("缺少运算符", position + offset)
+            raise ExpressionSyntaxError("表达式包含不支持的字符", position + offset)
+    raise ExpressionSyntaxError("数字格式错误", position)
+
+
+def _word_token(text, position, number, names):
+    """把数字或变量名片段转换为词法单元"""
+    if names and text[0] in _NAME_START_CHARS:
+        return (NAME, text, position)
+    return (NUMBER, parse_number(text, position, number), position)
+
+
+def tokenize(expression, start=0, number=None, names=False):
+    """将表达式切分为词法单元
+
+    Args:
+        expression: 表达式字符串
+        start: 开始分词的位置，返回的位置仍以整个表达式为基准
+        number: 数字的数值类型，见 parse_number
+        names: 是否识别变量名；为False时字母是不支持的字符
+
+    Yields:
+        (类型, 值, 位置) 元组；运算符的值已规范化为 +、-、*、/，变量名的值为名称文本
+
+    Raises:
+        ExpressionSyntaxError: 包含不支持的字符或数字格式错误
+    """
+    word_chars = _WORD_CHARS if names else _NUMBER_CHARS
+    word_start = -1
+    for position, char in enumerate(expression[start:], start):
+        if char in word_chars:
+            if word_start < 0:
+                word_start = position
+            continue
+        if word_start >= 0:
+            yield _word_token(expression[word_start:position], word_start, number, names)
+            word_start = -1
+        operator = _OPERATOR_ALIASES.get(char)
+        if operator is not None:
+            yield (OPERATOR, operator, position)
+        elif char == '(' or char == ')':
+            yield (char, char, position)
+        elif not char.isspace():
+            raise ExpressionSyntaxError("表达式包含不支持的字符", position)
+    if word_start >= 0:
+        yield _word_token(expression[word_start:], word_start, number, names)
+
+
+def compile_expression(expression, auto_close=False, variables=None, number=None):
+    """将表达式编译为字节码
+
+    解析器逐个消费 tokenize 产生的词法单元，分词与解析在同一遍扫描中完成。
+    解析器使用 Pratt 风格的绑定力表决定运算符优先级，但用显式的运算符栈
+    代替递归，因此括号嵌套深度不受 Python 递归深度限制。
+
+    Args:
+        expression: 表达式字符串
+        auto_close: 是否在末尾自动补全未闭合的左括号
+        variables: 允许使用的变量名序列；为None时表达式中不能出现变量。
+            变量按此顺序编号，执行时按相同顺序传入变量值
+        number: 数字常量的数值类型，接收数字文本，如 fractions.Fraction；
+            为None时整数为int、小数为float
+
+    Returns:
+        CompiledExpression 对象
+
+    Raises:
+        ExpressionSyntaxError: 表达式语法错误，包含出错位置
+    """
+    code = new_code_buffer()
+    emit = code.extend
+    constants = []
+    add_constant = constants.append
+    # 运算符栈元素: (绑定力, 指令, 位置)；左括号的绑定力为0、指令为None
+    stack = []
+    push = stack.append
+    pop = stack.pop
+    binary = _BINARY_OPERATORS
+    if variables is None:
+        variable_index = None
+    else:
+        variables = tuple(variables)
+        variable_index = {name: index for index, name in enumerate(variables)}
+    expect_operand = True
+    # 上一个词法单元是否为右括号（用于识别 (1+2)3 这样的隐式乘法）
+    after_rparen = False
+
+    for kind, value, position in tokenize(expression, number=number, names=variable_index is not None):
+        if kind == NUMBER or kind == NAME:
+            if not expect_operand:
+                if not after_rparen:
+                    raise ExpressionSyntaxError("缺少运算符", position)
+                # 隐式乘法：(1+2)3
+                while stack and stack[-1][0] >= _MULTIPLY[0]:
+                    emit(pop()[1])
+                push(_MULTIPLY)
+            if kind == NAME:
+                index = variable_index.get(value)
+                if index is None:
+                    raise ExpressionSyntaxError(f"未定义的变量: {value}", position)
+                emit((OP_LOAD, index))
+            else:
+                emit((OP_PUSH, len(constants)))
+                add_constant(value)
+            expect_operand = False
+            after_rparen = False
+        elif kind == OPERATOR:
+            if expect_operand:
+                # 一元负号入栈，一元正号不产生指令
+                if value == '-':
+                    push((PREFIX_BINDING_POWER, _NEGATE, position))
+                elif value != '+':
+                    raise ExpressionSyntaxError("缺少操作数", position)
+                continue
+            entry = binary[value]
+            power = entry[0]
+            while stack and stack[-1][0] >= power:
+                emit(pop()[1])
+            push(entry)
+            expect_operand = True
+            after_rparen = False
+        elif kind == LPAREN:
+            if not expect_operand:
+                # 隐式乘法：2(3) 或 (1)(2)
+                while stack and stack[-1][0] >= _MULTIPLY[0]:
+                    emit(pop()[1])
+                push(_MULTIPLY)
+                expect_operand = True
+                after_rparen = False
+            push((0, None, position))
+        else:
+            if expect_operand:
+                raise ExpressionSyntaxError("缺少操作数", position)
+            while True:
+                if not stack:
+                    raise ExpressionSyntaxError("括号不匹配", position)
+                instruction = pop()[1]
+                if instruction is None:
+                    break
+                emit(instruction)
+            after_rparen = True
+
+    if expect_operand:
+        if not expression.strip():
+            raise ExpressionSyntaxError("表达式为空", len(expression))
+        raise ExpressionSyntaxError("表达式不完整", len(expression))
+
+    while stack:
+        _, instruction, position = pop()
+        if instruction is None:
+            if not auto_close:
+                raise ExpressionSyntaxError("括号不匹配", position)
+            continue
+        emit(instruction)
+
+    return CompiledExpression(code, constants, expression, variables or ())
+
+
+# 程序员模式的二元运算符 -> (绑定力, 操作码)。绑定力参照C语言：
+# 位或 < 异或 < 位与 < 移位 < 加减 < 乘除取余；单词形式不区分大小写
+PROGRAMMER_BINARY_OPERATORS = {
+    '|': (4, OP_OR), 'or': (4, OP_OR),
+    '^': (5, OP_XOR), 'xor': (5, OP_XOR),
+    '&': (6, OP_AND), 'and': (6, OP_AND),
+    '<<': (8, OP_SHL), 'shl': (8, OP_SHL),
+    '>>': (8, OP_SHR), 'shr': (8, OP_SHR),
+    'rol': (8, OP_ROL), 'ror': (8, OP_ROR),
+    '+': (10, OP_ADD), '-': (10, OP_SUB),
+    '*': (20, OP_MUL), '×': (20, OP_MUL),
+    '/': (20, OP_DIV), '÷': (20, OP_DIV),
+    '%': (20, OP_MOD), 'mod': (20, OP_MOD)
+}
+
+# 程序员模式的一元前缀运算符 -> 操作码（一元正号不产生指令）
+PROGRAMMER_PREFIX_OPERATORS = {
+    '-': OP_NEG,
+    '~': OP_NOT,
+    'not': OP_NOT,
+    '+': None
+}
+
+# 程序员模式的词法单元：单词（数字或单词形式的运算符）、符号运算符和括号
+_PROGRAMMER_TOKEN = re.compile(r"\s*(?:([0-9A-Za-z_.]+)|(<<|>>|[-+*/×÷%&|^~()]))")
+
+# 整数前缀 -> 进制
+_INTEGER_PREFIXES = {'0x': 16, '0o': 8, '0b': 2}
+
+
+def parse_integer(text, position, base=10):
+    """将程序员模式的数字片段转换为整数
+
+    Args:
+        text: 数字片段，可以带 0x、0o、0b 前缀（此时忽略 base；16进制下没有 0b 前缀），
+            数字间可以有下划线
+        position: 片段在表达式中的位置，用于报错
+        base: 没有前缀时的进制
+
+    Returns:
+        非负整数
+
+    Raises:
+        ExpressionSyntaxError: 不是该进制的有效整数
+    """
+    prefix_base = _INTEGER_PREFIXES.get(text[:2].lower())
+    # 16进制中 b 是数字，0b11 是十六进制数 B11 而不是二进制前缀
+    if prefix_base == 2 and base == 16:
+        prefix_base = None
+    digits = text[2:] if prefix_base else text
+    if '.' in digits:
+        raise ExpressionSyntaxError("程序员模式只支持整数", position + text.index('.'))
+    try:
+        if not digits or not digits[0].isalnum():
+            raise ValueError
+        return int(digits, prefix_base or base)
+    except ValueError:
+        raise ExpressionSyntaxError(f"无效的{prefix_base or base}进制整数: {text}", position) from None
+
+
+def tokenize_programmer(expression, base=10):
+    """将程序员模式的表达式切分为词法单元
+
+    Args:
+        expression: 表达式字符串
+        base: 没有前缀的数字的进制
+
+    Yields:
+        (类型, 值, 位置) 元组；数字的值为整数，运算符的值为小写的运算符文本
+
+    Raises:
+        ExpressionSyntaxError: 包含不支持的字符或数字格式错误
+    """
+    position = 0
+    end = len(expression.rstrip())
+    while position < end:
+        match = _PROGRAMMER_TOKEN.match(expression, position)
+        if match is None:
+            offset = len(expression) - len(expression[position:].lstrip())
+            raise ExpressionSyntaxError("表达式包含不支持的字符", offset)
+        word, symbol = match.groups()
+        start = match.start(1) if word is not None else match.start(2)
+        if word is not None:
+            lowered = word.lower()
+            if lowered in PROGRAMMER_BINARY_OPERATORS or lowered in PROGRAMMER_PREFIX_OPERATORS:
+                yield (OPERATOR, lowered, start)
+            else:
+                yield (NUMBER, parse_integer(word, start, base), start)
+        elif symbol in '()':
+            yield (symbol, symbol, start)
+        else:
+            yield (OPERATOR, symbol, start)
+        position = match.end()
+
+
+def compile_programmer_expression(expression, base=10, auto_close=False):
+    """将程序员模式的表达式编译为字节码
+
+    与 compile_expression 使用相同的显式运算符栈，数字都是整数。
+    字节码只包含整数运算和位运算，由 calculator.core.programmer 按字长执行。
+
+    Args:
+        expression: 表达式字符串，如 "(0xFF & ~x) << 4" 中的 x 需替换为数字
+        base: 没有前缀的数字的进制（2、8、10、16）
+        auto_close: 是否在末尾自动补全未闭合的左括号
+
+    Returns:
+        CompiledExpression 对象
+
+    Raises:
+        ExpressionSyntaxError: 表达式语法错误，包含出错位置
+    """
+    code = new_code_buffer()
+    emit = code.extend
+    constants = []
+    # 运算符栈元素: (绑定力, 指令, 位置)；左括号的绑定力为0、指令为None
+    stack = []
+    push = stack.append
+    pop = stack.pop
+    multiply = (PROGRAMMER_BINARY_OPERATORS['*'][0], (OP_MUL, 0), None)
+    expect_operand = True
+    after_rparen = False
+
+    for kind, value, position in tokenize_programmer(expression, base):
+        if kind == NUMBER:
+            if not expect_operand:
+                if not after_rparen:
+                    raise ExpressionSyntaxError("缺少运算符", position)
+                # 隐式乘法：(1+2)3
+                while stack and stack[-1][0] >= multiply[0]:
+                    emit(pop()[1])
+                push(multiply)
+            emit((OP_PUSH, len(constants)))
+            constants.append(value)
+            expect_operand = False
+            after_rparen = False
+        elif kind == OPERATOR:
+            if expect_operand:
+                if value not in PROGRAMMER_PREFIX_OPERATORS:
+                    raise ExpressionSyntaxError("缺少操作数", position)
+                opcode = PROGRAMMER_PREFIX_OPERATORS[value]
+                if opcode is not None:
+                    push((PREFIX_BINDING_POWER, (opcode, 0), position))
+                continue
+            if value not in PROGRAMMER_BINARY_OPERATORS:
+                raise ExpressionSyntaxError("缺少运算符", position)
+            power, opcode = PROGRAMMER_BINARY_OPERATORS[value]
+            while stack and stack[-1][0] >= power:
+                emit(pop()[1])
+            push((power, (opcode, 0), None))
+            expect_operand = True
+            after_rparen = False
+        elif kind == LPAREN:
+            if not expect_operand:
+                # 隐式乘法：2(3) 或 (1)(2)
+                while stack and stack[-1][0] >= multiply[0]:
+                    emit(pop()[1])
+                push(multiply)
+                expect_operand = True
+                after_rparen = False
+            push((0, None, position))
+        else:
+            if expect_operand:
+                raise ExpressionSyntaxError("缺少操作数", position)
+            while True:
+                if not stack:
+                    raise ExpressionSyntaxError("括号不匹配", position)
+                instruction = pop()[1]
+                if instruction is None:
+                    break
+                emit(instruction)
+            after_rparen = True
+
+    if expect_operand:
+        if not expression.strip():
+            raise ExpressionSyntaxError("表达式为空", len(expression))
+        raise ExpressionSyntaxError("表达式不完整", len(expression))
+
+    while stack:
+        _, instruction, position = pop()
+        if instruction is None:
+            if not auto_close:
+                raise ExpressionSyntaxError("括号不匹配", position)
+            continue
+        emit(instruction)
+
+    return CompiledExpression(code, constants, expression)
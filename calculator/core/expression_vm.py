@@ -0,0 +1,150 @@
+"""表达式字节码与栈式虚拟机模块
+
+解析器把表达式编译为扁平的字节码：指令和操作数成对存放在 array 缓冲区中，
+常量单独保存在常量池里。虚拟机用一个非递归的循环执行字节码，
+因此执行耗时与括号嵌套深度无关，也不会触发递归深度限制。
+"""
+
+from array import array
+
+# 操作码
+OP_PUSH = 0  # 操作数为常量池下标
+OP_NEG = 1
+OP_ADD = 2
+OP_SUB = 3
+OP_MUL = 4
+OP_DIV = 5
+OP_LOAD = 6  # 操作数为变量下标
+# 以下操作码只出现在程序员模式的字节码中，由 calculator.core.programmer 按字长执行
+OP_MOD = 7
+OP_AND = 8
+OP_OR = 9
+OP_XOR = 10
+OP_NOT = 11
+OP_SHL = 12
+OP_SHR = 13
+OP_ROL = 14
+OP_ROR = 15
+
+# 二元运算符到操作码的映射
+BINARY_OPCODES = {
+    '+': OP_ADD,
+    '-': OP_SUB,
+    '*': OP_MUL,
+    '/': OP_DIV
+}
+
+# 操作码的名称，用于反汇编
+OPCODE_NAMES = {
+    OP_PUSH: 'PUSH',
+    OP_NEG: 'NEG',
+    OP_ADD: 'ADD',
+    OP_SUB: 'SUB',
+    OP_MUL: 'MUL',
+    OP_DIV: 'DIV',
+    OP_LOAD: 'LOAD',
+    OP_MOD: 'MOD',
+    OP_AND: 'AND',
+    OP_OR: 'OR',
+    OP_XOR: 'XOR',
+    OP_NOT: 'NOT',
+    OP_SHL: 'SHL',
+    OP_SHR: 'SHR',
+    OP_ROL: 'ROL',
+    OP_ROR: 'ROR'
+}
+
+
+class CompiledExpression:
+    """编译后的表达式
+
+    Attributes:
+        code: array('l')，按 (操作码, 操作数) 成对存放的指令
+        constants: 常量池
+        source: 原始表达式字符串
+        variables: 变量名元组，LOAD 指令的操作数是其中的下标
+    """
+
+    __slots__ = ('code', 'constants', 'source', 'variables')
+
+    def __init__(self, code, constants, source="", variables=()):
+        self.code = code
+        self.constants = tuple(constants)
+        self.source = source
+        self.variables = tuple(variables)
+
+    def __len__(self):
+        """指令条数"""
+        return len(self.code) // 2
+
+    def __eq__(self, other):
+        if not isinstance(other, CompiledExpression):
+            return NotImplemented
+        return (self.code == other.code and self.constants == other.constants
+                and self.variables == other.variables)
+
+    def __repr__(self):
+        return f"CompiledExpression({self.source!r}, {len(self)} instructions)"
+
+    def run(self, values=()):
+        """执行字节码
+
+        Args:
+            values: 变量值序列，顺序与 variables 一致
+
+        Returns:
+            计算结果
+
+        Raises:
+            ValueError: 除数为零，或字节码包含只能在程序员模式中执行的位运算
+        """
+        constants = self.constants
+        stack = []
+        push = stack.append
+        pop = stack.pop
+        instructions = iter(self.code)
+        # 每次从同一个迭代器中取出两个元素，即 (操作码, 操作数)
+        for op, arg in zip(instructions, instructions):
+            if op == OP_PUSH:
+                push(constants[arg])
+            elif op == OP_LOAD:
+                push(values[arg])
+            elif op == OP_NEG:
+                stack[-1] = -stack[-1]
+            else:
+                right = pop()
+                if op == OP_ADD:
+                    stack[-1] = stack[-1] + right
+                elif op == OP_SUB:
+                    stack[-1] = stack[-1] - right
+                elif op == OP_MUL:
+                    stack[-1] = stack[-1] * right
+                elif op == OP_DIV:
+                    if right == 0:
+                        raise ValueError("除数不能为零")
+                    stack[-1] = stack[-1] / right
+                else:
+                    raise ValueError("位运算只能在程序员模式中计算")
+        return stack[0]
+
+    def disassemble(self):
+        """反汇编为可读的指令列表
+
+        Returns:
+            (操作码名称, 操作数) 元组组成的列表，PUSH 的操作数为常量值，LOAD 的操作数为变量名
+        """
+        result = []
+        instructions = iter(self.code)
+        for op, arg in zip(instructions, instructions):
+            if op == OP_PUSH:
+                result.append((OPCODE_NAMES[op], self.constants[arg]))
+            elif op == OP_LOAD:
+                result.append((OPCODE_NAMES[op], self.variables[arg]))
+            else:
+                result.append((OPCODE_NAMES[op], None))
+        return result
+
+
+def new_code_buffer():
+    """创建空的指令缓冲区"""
+    return array('l')
@@ -0,0 +1,182 @@
+"""阶乘计算模块
+
+精确值：n 不超过 170 时直接查预先算好的表（170! 是双精度浮点数能表示的最大阶乘），
+更大的 n 交给 math.factorial。它是C实现的二分乘积（把 1..n 的奇数部分按区间
+递归对半相乘，再整体左移2的幂次），让每次乘法的两个因子位数相近，
+比逐个累乘的循环快得多（n=10^5 时约快15倍）。
+
+估算：只需要数量级时不必算出精确值。factorial_log10 用 math.lgamma 计算 log10(n!)；
+factorial_digits 和 factorial_scientific 需要比浮点数更多的有效数字，
+用Decimal按所需精度计算Stirling级数，得到结果的位数和科学计数法形式，耗时与 n 的位数有关而与 n 的大小基本无关。
+"""
+
+import math
+from fractions import Fraction
+from functools import lru_cache
+from itertools import accumulate
+
+# 查表的上限：0! 到 170!
+SMALL_FACTORIAL_LIMIT = 170
+
+_SMALL_FACTORIALS = (1,) + tuple(accumulate(range(1, SMALL_FACTORIAL_LIMIT + 1), lambda a, b: a * b))
+
+# 超过这个值时 float(n) 不再精确，lgamma 的结果也失去意义，改用Stirling级数
+_LGAMMA_LIMIT = 2 ** 53
+
+_LN10 = math.log(10)
+
+# ln(2π) 的前50位，Stirling级数只需要它的小数部分精确到所需的位数
+_LN_2PI = "1.8378770664093454835606594728112352797227949472756"
+
+# factorial_scientific 的尾数最多的有效数字位数（受 _LN_2PI 的位数限制）
+MAX_SIGNIFICANT_DIGITS = 30
+
+
+@lru_cache(maxsize=None)
+def _stirling_coefficient(k):
+    """Stirling级数第 k 项的系数 B₂ₖ/(2k(2k-1))，Bₙ 为伯努利数（Akiyama–Tanigawa算法）"""
+    row = []
+    for m in range(2 * k + 1):
+        row.append(Fraction(1, m + 1))
+        for j in range(m, 0, -1):
+            row[j - 1] = j * (row[j - 1] - row[j])
+    return row[0] / (2 * k * (2 * k - 1))
+
+
+def _check_argument(n):
+    """检查阶乘的参数是否为非负整数
+
+    Raises:
+        ValueError: 参数不是非负整数
+    """
+    if not isinstance(n, int) or n < 0:
+        raise ValueError("阶乘只能计算非负整数")
+
+
+def _stirling_log10(n, fraction_digits):
+    """用Stirling级数以Decimal计算 log10(n!) 的整数部分和小数部分
+
+    ln n! ≈ n·ln n - n + ln(2πn)/2 + Σ B₂ₖ/(2k(2k-1)n²ᵏ⁻¹)，
+    修正项 1/(12n) - 1/(360n³) + 1/(1260n⁵) - ... 一直加到小于所需精度为止
+    （n > 170 时每项至少缩小约 170² 倍，40位精度只需不到10项）。
+    整数部分有多少位就多给多少位精度，保证小数部分（决定尾数）仍有 fraction_digits 位是准确的。
+
+    Args:
+        n: 大于 SMALL_FACTORIAL_LIMIT 的整数
+        fraction_digits: 结果小数部分需要的准确位数，不超过40（受 _LN_2PI 的位数限制）
+
+    Returns:
+        (整数部分int, 小数部分Decimal) 元组
+    """
+    from decimal import Context, Decimal
+    context = Context(prec=2 * len(str(n)) + fraction_digits + 5)
+    d = context.create_decimal(n)
+    ln_n = context.ln(d)
+    ln_factorial = context.subtract(context.multiply(d, ln_n), d)
+    ln_factorial = context.add(ln_factorial, context.divide(context.add(Decimal(_LN_2PI), ln_n), 2))
+    tolerance = Decimal(10) ** -(fraction_digits + 3)
+    k = 1
+    while True:
+        coefficient = _stirling_coefficient(k)
+        term = context.divide(coefficient.numerator, coefficient.denominator * n ** (2 * k - 1))
+        ln_factorial = context.add(ln_factorial, term)
+        if abs(term) < tolerance:
+            break
+        k += 1
+    integer_part, fraction = context.divmod(context.divide(ln_factorial, context.ln(10)), 1)
+    return int(integer_part), fraction
+
+
+def factorial(n, max_digits=None):
+    """计算 n 的精确阶乘
+
+    Args:
+        n: 非负整数
+        max_digits: 结果的位数上限；为None时不限制。设置后先估算结果位数，
+            超过上限时直接报错而不开始计算
+
+    Returns:
+        n!（int）
+
+    Raises:
+        ValueError: n 不是非负整数，或结果位数超过上限
+    """
+    _check_argument(n)
+    if n <= SMALL_FACTORIAL_LIMIT:
+        return _SMALL_FACTORIALS[n]
+    if max_digits is not None:
+        digits = factorial_digits(n)
+        if digits > max_digits:
+            raise ValueError(f"{n}! 约有 {digits} 位，超过上限 {max_digits} 位")
+    return math.factorial(n)
+
+
+def factorial_log10(n):
+    """计算 log10(n!)，不计算阶乘本身
+
+    Args:
+        n: 非负整数
+
+    Returns:
+        float。n 不超过 170 时由精确值计算，更大时由 lgamma 计算，
+        n 达到 2^53 后由Stirling级数计算
+
+    Raises:
+        ValueError: n 不是非负整数，或结果超出浮点数范围
+    """
+    _check_argument(n)
+    if n <= SMALL_FACTORIAL_LIMIT:
+        return math.log10(_SMALL_FACTORIALS[n])
+    if n < _LGAMMA_LIMIT:
+        return math.lgamma(n + 1) / _LN10
+    integer_part, fraction = _stirling_log10(n, 17)
+    try:
+        return float(integer_part) + float(fraction)
+    except OverflowError:
+        raise ValueError("阶乘的位数超出浮点数的表示范围")
+
+
+def factorial_digits(n):
+    """计算 n! 的十进制位数，不计算阶乘本身
+
+    Args:
+        n: 非负整数
+
+    Returns:
+        位数。n 不超过 170 时查表，更大时由Stirling级数按足够的精度计算
+
+    Raises:
+        ValueError: n 不是非负整数
+    """
+    _check_argument(n)
+    if n <= SMALL_FACTORIAL_LIMIT:
+        return len(str(_SMALL_FACTORIALS[n]))
+    return _stirling_log10(n, 20)[0] + 1
+
+
+def factorial_scientific(n, significant_digits=12):
+    """以科学计数法表示 n! 的近似值，如 factorial_scientific(1000) 为 "4.02387260077e+2567"
+
+    Args:
+        n: 非负整数
+        significant_digits: 尾数的有效数字位数，1到 MAX_SIGNIFICANT_DIGITS（30）
+
+    Returns:
+        科学计数法字符串，尾数四舍五入到 significant_digits 位
+
+    Raises:
+        ValueError: n 不是非负整数，或有效数字位数超出范围
+    """
+    _check_argument(n)
+    if not isinstance(significant_digits, int) or not 1 <= significant_digits <= MAX_SIGNIFICANT_DIGITS:
+        raise ValueError(f"有效数字位数必须是1到{MAX_SIGNIFICANT_DIGITS}之间的整数")
+    if n <= SMALL_FACTORIAL_LIMIT:
+        return f"{float(_SMALL_FACTORIALS[n]):.{significant_digits - 1}e}"
+    from decimal import Context
+    exponent, fraction = _stirling_log10(n, significant_digits + 10)
+    context = Context(prec=significant_digits)
+    mantissa = context.power(10, fraction)
+    # 尾数舍入后可能进位为10
+    if mantissa >= 10:
+        mantissa, exponent = context.divide(mantissa, 10), exponent + 1
+    return f"{mantissa:.{significant_digits - 1}f}e+{exponent}"
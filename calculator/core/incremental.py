@@ -0,0 +1,196 @@
+"""增量表达式求值模块
+
+实时预览时输入框的文本每次只在末尾附近变化。IncrementalEvaluator 在每个
+词法单元之前保存一次解析状态（检查点），文本变化时只回退到第一个受影响的
+词法单元，从那里重新分词和求值，未变化的前缀不再重复处理。
+
+解析状态由不可变的链表（嵌套元组）组成，保存检查点只需保存引用，
+因此在末尾追加数字或运算符的均摊代价为 O(1)，与表达式长度无关。
+运算优先级、隐式乘法和自动补全括号的规则与 expression_parser 一致。
+"""
+
+from .expression_parser import (
+    BINARY_BINDING_POWER, LPAREN, NUMBER, OPERATOR, PREFIX_BINDING_POWER, RPAREN,
+    ExpressionSyntaxError, tokenize
+)
+
+# 解析状态: (数值栈, 运算符栈, 是否期待操作数, 上一个词法单元是否为右括号)
+# 数值栈与运算符栈都是 (栈顶, 其余部分) 形式的不可变链表，空栈为 None
+_INITIAL_STATE = (None, None, True, False)
+
+# 运算符栈元素: (绑定力, 运算符)；左括号的绑定力为0
+_LPAREN_ENTRY = (0, LPAREN)
+_NEGATE_ENTRY = (PREFIX_BINDING_POWER, 'neg')
+_MULTIPLY_ENTRY = (BINARY_BINDING_POWER['*'], '*')
+
+
+class IncrementalEvaluator:
+    """可增量更新的表达式求值器
+
+    用法：
+        evaluator = IncrementalEvaluator()
+        evaluator.update("12+3")    # 15
+        evaluator.update("12+34")   # 只重新处理最后一个数字，返回46
+    """
+
+    def __init__(self, number=None):
+        """初始化求值器
+
+        Args:
+            number: 数字的数值类型，如 fractions.Fraction；为None时整数为int、小数为float
+        """
+        self.number = number
+        self._text = ""
+        # 检查点: (词法单元起始位置, 处理该词法单元之前的解析状态)
+        self._checkpoints = []
+        self._state = _INITIAL_STATE
+        # 处理到末尾时遇到的错误，None 表示没有错误
+        self._error = None
+
+    def reset(self):
+        """清空所有状态"""
+        self.__init__(self.number)
+
+    @property
+    def text(self):
+        """最近一次求值的文本"""
+        return self._text
+
+    def update(self, text):
+        """更新文本并求值
+
+        自动补全未闭合的括号；表达式不完整（如以运算符结尾）时视为错误。
+
+        Args:
+            text: 新的表达式文本
+
+        Returns:
+            计算结果
+
+        Raises:
+            ValueError: 表达式无效、不完整或除数为零
+        """
+        if text != self._text:
+            self._advance(text)
+        if self._error is not None:
+            raise self._error
+        try:
+            return _finish(self._state, len(text))
+        except ArithmeticError as e:
+            raise ValueError(f"计算错误: {str(e)}")
+
+    def _advance(self, text):
+        """回退到受影响的检查点，并处理新文本的剩余部分"""
+        prefix = _common_prefix_length(self._text, text)
+        checkpoints = self._checkpoints
+        # 起始于公共前缀之内的最后一个词法单元可能被延长（例如数字后追加数字），
+        # 因此从它之前的状态开始重新处理
+        while checkpoints and checkpoints[-1][0] >= prefix:
+            checkpoints.pop()
+        if checkpoints:
+            resume, state = checkpoints.pop()
+        else:
+            resume, state = 0, _INITIAL_STATE
+
+        self._text = text
+        self._error = None
+        try:
+            for kind, value, position in tokenize(text, resume, self.number):
+                checkpoints.append((position, state))
+                state = _step(state, kind, value, position)
+        except ValueError as e:
+            self._error = e
+        except ArithmeticError as e:
+            self._error = ValueError(f"计算错误: {str(e)}")
+        self._state = state
+
+
+def _common_prefix_length(old, new):
+    """两个字符串公共前缀的长度"""
+    if new.startswith(old):
+        return len(old)
+    # 二分查找，比较由字符串切片在C层完成
+    low, high = 0, min(len(old), len(new))
+    while low < high:
+        middle = (low + high + 1) // 2
+        if old[:middle] == new[:middle]:
+            low = middle
+        else:
+            high = middle - 1
+    return low
+
+
+def _apply(values, operator):
+    """对数值栈应用一个运算符，返回新的数值栈"""
+    right, values = values
+    if operator == 'neg':
+        return (-right, values)
+    left, values = values
+    if operator == '+':
+        return (left + right, values)
+    if operator == '-':
+        return (left - right, values)
+    if operator == '*':
+        return (left * right, values)
+    if right == 0:
+        raise ValueError("除数不能为零")
+    return (left / right, values)
+
+
+def _reduce(values, ops, power):
+    """弹出并应用绑定力不低于power的运算符"""
+    while ops is not None and ops[0][0] >= power:
+        values = _apply(values, ops[0][1])
+        ops = ops[1]
+    return values, ops
+
+
+def _step(state, kind, value, position):
+    """处理一个词法单元，返回新的解析状态"""
+    values, ops, expect_operand, after_rparen = state
+
+    if expect_operand:
+        if kind == NUMBER:
+            return ((value, values), ops, False, False)
+        if kind == LPAREN:
+            return (values, (_LPAREN_ENTRY, ops), True, False)
+        if kind == OPERATOR and value == '-':
+            return (values, (_NEGATE_ENTRY, ops), True, False)
+        if kind == OPERATOR and value == '+':
+            return state
+        raise ExpressionSyntaxError("缺少操作数", position)
+
+    if kind == OPERATOR:
+        power = BINARY_BINDING_POWER[value]
+        values, ops = _reduce(values, ops, power)
+        return (values, ((power, value), ops), True, False)
+    if kind == RPAREN:
+        while True:
+            if ops is None:
+                raise ExpressionSyntaxError("括号不匹配", position)
+            entry, ops = ops
+            if entry is _LPAREN_ENTRY:
+                break
+            values = _apply(values, entry[1])
+        return (values, ops, False, True)
+    if kind == LPAREN:
+        # 隐式乘法：2(3) 或 (1)(2)
+        values, ops = _reduce(values, ops, _MULTIPLY_ENTRY[0])
+        return (values, (_LPAREN_ENTRY, (_MULTIPLY_ENTRY, ops)), True, False)
+    if after_rparen:
+        # 隐式乘法：(1+2)3
+        values, ops = _reduce(values, ops, _MULTIPLY_ENTRY[0])
+        return ((value, values), (_MULTIPLY_ENTRY, ops), False, False)
+    raise ExpressionSyntaxError("缺少运算符", position)
+
+
+def _finish(state, length):
+    """自动补全括号并归约剩余的运算符，不修改传入的状态"""
+    values, ops, expect_operand, _ = state
+    if expect_operand:
+        raise ExpressionSyntaxError("表达式不完整", length)
+    while ops is not None:
+        entry, ops = ops
+        if entry is not _LPAREN_ENTRY:
+            values = _apply(values, entry[1])
+    return values[0]
@@ -0,0 +1,187 @@
+"""程序员模式计算引擎
+
+按固定字长（8、16、32、64、128位）计算整数表达式，结果是字长内的二进制位模式
+（0 到 2^字长-1 的整数）。有符号模式以二进制补码解释位模式：最高位为1表示负数，
+除法、取余、右移和移位位数按有符号值计算。每条指令的结果都用掩码截断到字长，
+与固定宽度的硬件整数一样回绕。
+
+表达式语法见 calculator.core.expression_parser.compile_programmer_expression。
+"""
+
+from .expression_cache import ExpressionCache
+from .expression_parser import compile_programmer_expression
+from .expression_vm import (
+    OP_ADD, OP_AND, OP_DIV, OP_MOD, OP_MUL, OP_NEG, OP_NOT, OP_OR, OP_PUSH, OP_ROL, OP_ROR,
+    OP_SHL, OP_SHR, OP_SUB, OP_XOR
+)
+from .radix import group_digits
+
+WORD_SIZES = (8, 16, 32, 64, 128)
+
+# 程序员模式的输入进制
+INPUT_BASES = (2, 8, 10, 16)
+
+
+class ProgrammerCalculator:
+    """固定字长的整数和位运算计算器
+
+    Attributes:
+        word_size: 字长（位数）
+        signed: 是否以二进制补码解释为有符号数
+        mask: 字长内全为1的掩码
+    """
+
+    # 已编译表达式的LRU缓存，所有实例共享（编译结果与字长无关）
+    _expression_cache = ExpressionCache(maxsize=256)
+
+    def __init__(self, word_size=64, signed=True):
+        """初始化计算器
+
+        Args:
+            word_size: 字长，8、16、32、64、128之一
+            signed: 是否为有符号数
+
+        Raises:
+            ValueError: 字长无效
+        """
+        if word_size not in WORD_SIZES:
+            raise ValueError("字长必须是8、16、32、64或128位")
+        self.word_size = word_size
+        self.signed = signed
+        self.mask = (1 << word_size) - 1
+
+    def wrap(self, value):
+        """把任意整数截断为字长内的位模式，负数取二进制补码
+
+        Args:
+            value: 整数
+
+        Returns:
+            0 到 mask 之间的整数
+        """
+        return value & self.mask
+
+    def to_signed(self, value):
+        """按二进制补码把位模式解释为有符号整数
+
+        Args:
+            value: 位模式
+
+        Returns:
+            -2^(字长-1) 到 2^(字长-1)-1 之间的整数
+        """
+        value &= self.mask
+        return value - (1 << self.word_size) if value >> (self.word_size - 1) else value
+
+    def value_of(self, value):
+        """位模式按当前符号设置表示的整数：有符号模式为补码值，否则为无符号值"""
+        return self.to_signed(value) if self.signed else value & self.mask
+
+    def evaluate(self, expression, base=10, auto_close=False):
+        """计算程序员模式的表达式
+
+        Args:
+            expression: 表达式字符串，支持 + - * / % & | ^ ~ << >> rol ror 和括号
+            base: 没有 0x、0o、0b 前缀的数字的进制（2、8、10、16）
+            auto_close: 是否自动补全未闭合的括号
+
+        Returns:
+            结果的位模式（0 到 mask 之间的整数）
+
+        Raises:
+            ValueError: 表达式无效、数字超出字长、除数为零或移位位数为负数
+        """
+        if base not in INPUT_BASES:
+            raise ValueError("程序员模式的输入进制必须是2、8、10或16")
+        compiled = ProgrammerCalculator._expression_cache.get_or_compile(
+            (expression, base, auto_close), ProgrammerCalculator._compile_expression
+        )
+        return self._run(compiled)
+
+    @staticmethod
+    def _compile_expression(key):
+        """将 (表达式, 进制, 是否自动补全括号) 编译为字节码"""
+        expression, base, auto_close = key
+        return compile_programmer_expression(expression, base=base, auto_close=auto_close)
+
+    def _run(self, compiled):
+        """按字长执行字节码，每条指令的结果都截断为字长内的位模式"""
+        bits = self.word_size
+        mask = self.mask
+        signed = self.signed
+        value_of = self.value_of
+        constants = compiled.constants
+        stack = []
+        push = stack.append
+        pop = stack.pop
+        instructions = iter(compiled.code)
+        for op, arg in zip(instructions, instructions):
+            if op == OP_PUSH:
+                value = constants[arg]
+                if value > mask:
+                    raise ValueError(f"数值超出{bits}位字长的范围")
+                push(value)
+            elif op == OP_NEG:
+                stack[-1] = -stack[-1] & mask
+            elif op == OP_NOT:
+                stack[-1] ^= mask
+            else:
+                right = pop()
+                left = stack[-1]
+                if op == OP_ADD:
+                    result = (left + right) & mask
+                elif op == OP_SUB:
+                    result = (left - right) & mask
+                elif op == OP_MUL:
+                    result = (left * right) & mask
+                elif op == OP_AND:
+                    result = left & right
+                elif op == OP_OR:
+                    result = left | right
+                elif op == OP_XOR:
+                    result = left ^ right
+                elif op == OP_DIV or op == OP_MOD:
+                    dividend, divisor = value_of(left), value_of(right)
+                    if divisor == 0:
+                        raise ValueError("除数不能为零")
+                    # 与C语言一致：商向零取整，余数与被除数同号
+                    quotient = abs(dividend) // abs(divisor)
+                    if (dividend < 0) != (divisor < 0):
+                        quotient = -quotient
+                    result = (quotient if op == OP_DIV else dividend - quotient * divisor) & mask
+                else:
+                    count = value_of(right)
+                    if count < 0:
+                        raise ValueError("移位位数不能为负数")
+                    if op == OP_SHL:
+                        result = (left << count) & mask if count < bits else 0
+                    elif op == OP_SHR:
+                        # 有符号数算术右移（补符号位），无符号数逻辑右移
+                        result = (value_of(left) >> count) & mask if signed else left >> count
+                    else:
+                        count %= bits
+                        if op == OP_ROR:
+                            count = (bits - count) % bits
+                        result = ((left << count) | (left >> (bits - count))) & mask
+                stack[-1] = result
+        return stack[0]
+
+    def views(self, value):
+        """同一个位模式在各进制下的显示
+
+        位模式只计算一次，各进制的文本直接由 format() 得到，不经过字符串的再次解析。
+
+        Args:
+            value: 位模式（超出字长的部分被截断，负数取补码）
+
+        Returns:
+            {进制: 文本} 字典：16进制和2进制按字长补足前导0并每4位一组，
+            8进制为位模式的八进制值，10进制为按符号设置解释的整数
+        """
+        value &= self.mask
+        return {
+            16: group_digits(format(value, f"0{self.word_size // 4}X"), 4),
+            10: str(self.value_of(value)),
+            8: format(value, "o"),
+            2: group_digits(format(value, f"0{self.word_size}b"), 4)
+        }
@@ -0,0 +1,287 @@
+"""大整数进制转换引擎
+
+整数与数字字符串之间的转换，支持2到36进制和62进制（数字、大写字母、小写字母），
+复杂度都低于逐位转换：
+
+- 2、8、16进制的输出由 format() 完成，输入由 int(text, base) 完成，
+  两者都是按位分组的线性算法；
+- 其他进制的输出先把整数转换为 decimal.Decimal：按二进制位对半拆分（移位和
+  按位与几乎没有开销），两半分别转换后以 高位×2^k+低位 合并。Decimal 的大数
+  乘法使用数论变换、除法使用牛顿迭代，都比 int 的平方复杂度算法快得多。
+  10进制直接输出这个 Decimal（100万位时比 str() 快约30倍，也不受 str()
+  默认 4300 位的长度限制），其余进制再在 Decimal 上递归地用 base^k 对半整除；
+- 非2的幂进制的输入递归地对半解析后以 高位×base^k+低位 合并（int 乘法是
+  Karatsuba算法）。
+
+k 总是叶子宽度乘以2的幂，各层用到的幂很少，缓存后供之后的调用复用。
+递归到叶子后，输出按每次两位查表（digit_table 为每个进制生成一次并缓存）；
+36进制以内的输入交给 int()，不区分大小写，62进制的输入按字符查表。
+"""
+
+from functools import lru_cache
+
+DIGITS = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"
+
+# 62进制的数字：大写字母表示10到35，小写字母表示36到61
+BASE62_DIGITS = DIGITS + "abcdefghijklmnopqrstuvwxyz"
+
+SUPPORTED_BASES = tuple(range(2, 37)) + (62,)
+
+# int(text, base) 支持的最大进制，也是输入不区分大小写的最大进制
+_INT_MAX_BASE = 36
+
+# 按位分组的进制及 format() 的格式符
+_FORMAT_CODES = {2: 'b', 8: 'o', 16: 'X'}
+
+# 递归到这个位数以下时直接转换（远低于 int()/str() 的 4300 位限制）
+_LEAF_DIGITS = 1000
+
+# 整数与 Decimal 互相转换时，二进制位数在这个值以下的直接转换
+_DECIMAL_LEAF_BITS = 3000
+
+
+def _check_base(base):
+    """检查进制是否在支持范围内
+
+    Raises:
+        ValueError: 进制无效
+    """
+    if not isinstance(base, int) or base not in SUPPORTED_BASES:
+        raise ValueError("进制必须是2到36之间的整数或62")
+
+
+@lru_cache(maxsize=None)
+def digit_table(base):
+    """进制的数字查找表，第一次用到某个进制时生成并缓存
+
+    Args:
+        base: 进制
+
+    Returns:
+        (pairs, values) 元组：pairs[i] 是数值 i（0 ≤ i < base²）的两位数字字符串，
+        输出时每次查一对数字；values 把数字字符映射为数值，36进制以内
+        同时包含小写字母，输入不区分大小写
+    """
+    alphabet = BASE62_DIGITS[:base]
+    pairs = tuple(high + low for high in alphabet for low in alphabet)
+    values = {char: value for value, char in enumerate(alphabet)}
+    if base <= _INT_MAX_BASE:
+        values.update({char.lower(): value for char, value in list(values.items())})
+    return pairs, values
+
+
+@lru_cache(maxsize=128)
+def _power(base, exponent):
+    """base 的 exponent 次幂，各层递归共用"""
+    return base ** exponent
+
+
+@lru_cache(maxsize=1)
+def _decimal_context():
+    """精度足够大、乘法和加法都不会舍入的 Decimal 上下文"""
+    import decimal
+    return decimal.Context(prec=decimal.MAX_PREC, Emax=decimal.MAX_EMAX, Emin=decimal.MIN_EMIN)
+
+
+@lru_cache(maxsize=128)
+def _decimal_power(base, exponent):
+    """base 的 exponent 次幂的 Decimal 值，各层递归共用"""
+    from decimal import Decimal
+    if exponent * base.bit_length() <= _DECIMAL_LEAF_BITS:
+        return Decimal(base ** exponent)
+    half = exponent // 2
+    return _decimal_context().multiply(_decimal_power(base, half), _decimal_power(base, exponent - half))
+
+
+def _to_decimal(value):
+    """把非负整数转换为 Decimal：按二进制位对半拆分，以 高位×2^k+低位 合并"""
+    from decimal import Decimal
+    context = _decimal_context()
+
+    def convert(value, bits):
+        if bits <= _DECIMAL_LEAF_BITS:
+            return Decimal(value)
+        half = bits // 2
+        high = convert(value >> half, bits - half)
+        low = convert(value & ((1 << half) - 1), half)
+        return context.add(context.multiply(high, _decimal_power(2, half)), low)
+
+    return convert(value, value.bit_length())
+
+
+@lru_cache(maxsize=None)
+def _word_chunk(base):
+    """不超过 2^60 的最大 (base²)^k，返回 ((base²)^k, k)；叶子先按它分段，每段在机器字长内转换"""
+    square = base * base
+    power, width = square, 1
+    while power * square < 1 << 60:
+        power, width = power * square, width + 1
+    return power, width
+
+
+def _leaf_digits(value, base):
+    """把小于 base^_LEAF_DIGITS 的非负整数转换为字符串，每次查表得到两位"""
+    if value == 0:
+        return "0"
+    pairs = digit_table(base)[0]
+    square = base * base
+    chunk, width = _word_chunk(base)
+    parts = []
+    while value:
+        value, word = divmod(value, chunk)
+        for _ in range(width):
+            word, pair = divmod(word, square)
+            parts.append(pairs[pair])
+    return "".join(reversed(parts)).lstrip("0")
+
+
+def _to_string(value, base):
+    """非负整数的任意进制字符串，在 Decimal 上用缓存的幂递归对半整除"""
+    if value < _power(base, _LEAF_DIGITS):
+        return _leaf_digits(value, base)
+    context = _decimal_context()
+    value = _to_decimal(value)
+    width = _LEAF_DIGITS
+    while _decimal_power(base, width) <= value:
+        width *= 2
+
+    def convert(value, width):
+        # 返回恰好 width 位（左侧补0）的字符串
+        if width <= _LEAF_DIGITS:
+            return _leaf_digits(int(value), base).rjust(width, "0")
+        half = width // 2
+        high, low = context.divmod(value, _decimal_power(base, half))
+        return convert(high, width - half) + convert(low, half)
+
+    return convert(value, width).lstrip("0")
+
+
+def int_to_base(value, base):
+    """把整数转换为指定进制的字符串
+
+    Args:
+        value: 整数，负数输出以 - 开头
+        base: 进制，2到36或62；36进制以内大于9的数字用大写字母表示，
+            62进制见 BASE62_DIGITS
+
+    Returns:
+        数字字符串，没有前缀，如 int_to_base(255, 16) 为 "FF"
+
+    Raises:
+        ValueError: 进制无效
+    """
+    _check_base(base)
+    if value < 0:
+        return "-" + int_to_base(-value, base)
+    format_code = _FORMAT_CODES.get(base)
+    if format_code:
+        return format(value, format_code)
+    if base == 10:
+        return str(value) if value.bit_length() <= _DECIMAL_LEAF_BITS else str(_to_decimal(value))
+    return _to_string(value, base)
+
+
+def _parse_leaf(digits, base):
+    """把不超过 _LEAF_DIGITS 位、只含字母和数字的字符串转换为整数"""
+    if base <= _INT_MAX_BASE:
+        return int(digits, base)
+    values = digit_table(base)[1]
+    width = 2 * _word_chunk(base)[1]
+    value = 0
+    try:
+        for start in range(0, len(digits), width):
+            piece = digits[start:start + width]
+            word = 0
+            for char in piece:
+                word = word * base + values[char]
+            value = value * _power(base, len(piece)) + word
+    except KeyError:
+        raise ValueError(f"无效的{base}进制数字") from None
+    return value
+
+
+def _parse_digits(digits, base):
+    """递归对半解析只含数字字符的字符串，宽度取叶子宽度乘以2的幂以复用缓存的幂"""
+    width = _LEAF_DIGITS
+    while width < len(digits):
+        width *= 2
+
+    def parse(digits, width):
+        if width <= _LEAF_DIGITS:
+            return _parse_leaf(digits, base)
+        half = width // 2
+        if len(digits) <= half:
+            return parse(digits, half)
+        return parse(digits[:-half], width - half) * _power(base, half) + parse(digits[-half:], half)
+
+    return parse(digits, width)
+
+
+def base_to_int(text, base):
+    """把指定进制的数字字符串转换为整数
+
+    与 int(text, base) 接受相同的写法（前后空白、正负号、数字间的下划线，
+    以及2、8、16进制的 0b、0o、0x 前缀），但不受 int() 对非2的幂进制
+    4300 位的长度限制，长字符串的解析也更快。数字之间还可以有空格，
+    分组显示的结果（见 group_digits）可以直接再次转换。
+
+    Args:
+        text: 数字字符串，36进制以内字母不区分大小写
+        base: 进制，2到36或62
+
+    Returns:
+        整数
+
+    Raises:
+        ValueError: 进制无效，或字符串不是该进制的有效数字
+    """
+    _check_base(base)
+    error = ValueError(f"无效的{base}进制数字字符串")
+    if " " in text.strip():
+        text = "".join(text.split())
+    # 2的幂进制和较短的字符串直接交给 int()
+    if base <= _INT_MAX_BASE and (base & (base - 1) == 0 or len(text) <= _LEAF_DIGITS):
+        try:
+            return int(text, base)
+        except ValueError:
+            raise error from None
+
+    digits = text.strip()
+    negative = digits.startswith("-")
+    if digits[:1] in ("-", "+"):
+        digits = digits[1:]
+    if "_" in digits:
+        if digits.startswith("_") or digits.endswith("_") or "__" in digits:
+            raise error
+        digits = digits.replace("_", "")
+    # 先整体检查字符，分段解析时 int() 再检查每一位是否小于进制
+    if not digits or not digits.isascii() or not digits.isalnum():
+        raise error
+    try:
+        value = _parse_digits(digits, base)
+    except ValueError:
+        raise error from None
+    return -value if negative else value
+
+
+def group_digits(text, size, separator=" "):
+    """从右向左每 size 位插入一个分隔符
+
+    Args:
+        text: int_to_base 输出的数字字符串，负号不参与分组
+        size: 每组的位数
+        separator: 分隔符
+
+    Returns:
+        分组后的字符串，如 group_digits("-11110000", 4) 为 "-1111 0000"
+
+    Raises:
+        ValueError: 每组位数不是正整数
+    """
+    if not isinstance(size, int) or size < 1:
+        raise ValueError("分组位数必须是正整数")
+    sign = "-" if text.startswith("-") else ""
+    digits = text[len(sign):]
+    head = len(digits) % size or size
+    groups = [digits[:head]] + [digits[start:start + size] for start in range(head, len(digits), size)]
+    return sign + separator.join(groups)
@@ -0,0 +1,350 @@
+"""带小数点的进制转换和IEEE-754浮点数位模式
+
+数字文本（如10进制的 0.1、16进制的 1A.8）解析为 fractions.Fraction，没有舍入误差。
+小数部分还可以用括号表示循环节，如 0.1(6) 即 1/6。
+
+输出时把分数化简为 p/q，先按位数判断展开方式：q 中与进制公共的因子决定不循环部分的
+位数 k（反复除去 gcd(q, base) 的次数），其余因子 q' 为1时小数恰好 k 位结束，
+否则从第 k 位之后开始循环。不循环部分用一次整数除法整体得到；循环部分逐位长除，
+余数回到循环开始时的余数即找到循环节，只需保存一个余数。位数超过上限时截断并以 ... 结尾。
+
+float_bits 用 struct 得到 float32/float64 的位模式，以及符号、阶码、尾数字段
+和浮点数的精确十进制值。
+"""
+
+import math
+import re
+import struct
+from collections import namedtuple
+from fractions import Fraction
+
+from .radix import BASE62_DIGITS, SUPPORTED_BASES, base_to_int, digit_table, group_digits, int_to_base
+
+# 默认最多输出的小数位数（包括循环节）
+DEFAULT_FRACTION_DIGITS = 64
+
+# 格式名 -> (struct 的浮点格式, 同宽度的整数格式, 阶码位数, 尾数位数)
+FLOAT_FORMATS = {
+    'float32': ('>f', '>I', 8, 23),
+    'float64': ('>d', '>Q', 11, 52)
+}
+
+# 浮点数的位模式：格式名、位模式整数、16进制文本、按 符号 阶码 尾数 分组的2进制文本、
+# 符号位、阶码字段（含偏移量）、尾数字段、类别、浮点数值、精确的十进制值
+FloatBits = namedtuple(
+    'FloatBits',
+    ['format', 'bits', 'hex', 'binary', 'sign', 'exponent', 'mantissa', 'kind', 'value', 'exact']
+)
+
+# 一条批量转换的结果：序号（从1开始）、输入、结果（出错时为None）、错误信息（成功时为None）
+ConversionResult = namedtuple('ConversionResult', ['line', 'text', 'value', 'error'])
+
+# 与 int() 一致的进制前缀
+_PREFIXES = {2: "0b", 8: "0o", 16: "0x"}
+
+# 整数部分、小数部分和括号中的循环节
+_NUMBER = re.compile(r'([^.()]*)(?:\.([^.()]*)(?:\(([^.()]+)\))?)?')
+
+
+def _check_base(base):
+    """检查进制是否在 radix 支持的范围内
+
+    Raises:
+        ValueError: 进制无效
+    """
+    if not isinstance(base, int) or base not in SUPPORTED_BASES:
+        raise ValueError("进制必须是2到36之间的整数或62")
+
+
+def _check_fraction_digits(max_digits):
+    """检查小数位数上限
+
+    Raises:
+        ValueError: 上限不是非负整数
+    """
+    if not isinstance(max_digits, int) or max_digits < 0:
+        raise ValueError("小数位数上限必须是非负整数")
+
+
+def parse_fraction(text, base):
+    """把带小数点的数字文本解析为精确的分数
+
+    Args:
+        text: 数字文本，如 "-1A.8"、".5"、"0.1(6)"（括号中为循环节）；
+            36进制以内字母不区分大小写，空白被忽略。与 base_to_int 一样接受
+            2、8、16进制的 0b、0o、0x 前缀和数字之间的单个下划线（如 "0x1_F.8"）
+        base: 进制，2到36或62
+
+    Returns:
+        Fraction
+
+    Raises:
+        ValueError: 进制无效，或文本不是该进制的有效数字
+    """
+    _check_base(base)
+    error = ValueError(f"无效的{base}进制数字字符串")
+    digits = "".join(text.split())
+    negative = digits.startswith("-")
+    if digits[:1] in ("-", "+"):
+        digits = digits[1:]
+    prefix = _PREFIXES.get(base)
+    if prefix and digits[:2].lower() == prefix:
+        # 与 int() 一样，前缀之后可以紧跟一个下划线
+        digits = digits[2:]
+        if digits.startswith("_"):
+            digits = digits[1:]
+        if not digits or digits[0] in ".(":
+            raise error
+    match = _NUMBER.fullmatch(digits)
+    if match is None:
+        raise error
+    parts = []
+    for part in match.groups(default=""):
+        if "_" in part:
+            if part.startswith("_") or part.endswith("_") or "__" in part:
+                raise error
+            part = part.replace("_", "")
+        parts.append(part)
+    integer_digits, fraction_digits, repeating_digits = parts
+    if not (integer_digits or fraction_digits or repeating_digits):
+        raise error
+    # 逐个字符检查是否为该进制的数字（前缀和下划线已在上面去掉）
+    values = digit_table(base)[1]
+    if not set(integer_digits + fraction_digits + repeating_digits) <= values.keys():
+        raise error
+
+    scale = base ** len(fraction_digits)
+    numerator = base_to_int(integer_digits, base) * scale if integer_digits else 0
+    if fraction_digits:
+        numerator += base_to_int(fraction_digits, base)
+    value = Fraction(numerator, scale)
+    if repeating_digits:
+        value += Fraction(base_to_int(repeating_digits, base), scale * (base ** len(repeating_digits) - 1))
+    return -value if negative else value
+
+
+def _fraction_digits(remainder, denominator, base, max_digits):
+    """小于1的分数 remainder/denominator 的小数部分
+
+    Returns:
+        (不循环部分, 循环节, 是否被截断) 元组；有限小数的循环节为空字符串
+    """
+    # 不循环部分的位数：从分母中反复除去与进制的公约数，直到与进制互质
+    prefix_length = 0
+    coprime = denominator
+    while (common := math.gcd(coprime, base)) > 1:
+        coprime //= common
+        prefix_length += 1
+
+    # 不循环部分用一次整数除法得到
+    length = min(prefix_length, max_digits)
+    scale = base ** length
+    prefix, remainder = divmod(remainder * scale, denominator)
+    prefix = int_to_base(prefix, base).rjust(length, "0") if length else ""
+    if length < prefix_length:
+        return prefix, "", True
+    if coprime == 1:
+        return prefix, "", False
+
+    # 循环部分逐位长除，余数回到循环开始时的值即为一个完整的循环节
+    alphabet = BASE62_DIGITS
+    start = remainder
+    period = []
+    for _ in range(max_digits - length):
+        digit, remainder = divmod(remainder * base, denominator)
+        period.append(alphabet[digit])
+        if remainder == start:
+            return prefix, "".join(period), False
+    return prefix + "".join(period), "", True
+
+
+def fraction_to_base(value, base, max_digits=DEFAULT_FRACTION_DIGITS):
+    """把精确的数值转换为指定进制的带小数点文本
+
+    Args:
+        value: int、Fraction、Decimal 或 float（按浮点数的精确值转换）
+        base: 进制，2到36或62
+        max_digits: 最多输出的小数位数（包括循环节），超过时截断
+
+    Returns:
+        数字文本：有限小数直接输出，如 "1A.8"；循环小数的循环节放在括号中，
+        如 1/6 的10进制为 "0.1(6)"；位数超过上限时截断并以 "..." 结尾
+
+    Raises:
+        ValueError: 进制或位数上限无效，或数值为无穷大、NaN
+    """
+    _check_base(base)
+    _check_fraction_digits(max_digits)
+    try:
+        value = Fraction(value)
+    except (OverflowError, ValueError):
+        raise ValueError("无穷大和NaN不能转换进制") from None
+    sign = "-" if value < 0 else ""
+    integer_part, remainder = divmod(abs(value.numerator), value.denominator)
+    text = sign + int_to_base(integer_part, base)
+    if remainder == 0:
+        return text
+    prefix, period, truncated = _fraction_digits(remainder, value.denominator, base, max_digits)
+    if period:
+        return f"{text}.{prefix}({period})"
+    if not truncated:
+        return f"{text}.{prefix}"
+    return f"{text}.{prefix}..." if prefix else f"{text}..."
+
+
+def convert_fraction(text, from_base, to_base, max_digits=DEFAULT_FRACTION_DIGITS, group_size=0, separator=" "):
+    """带小数点的数字在进制之间转换
+
+    Args:
+        text: 源进制的数字文本，见 parse_fraction
+        from_base: 源进制，2到36或62
+        to_base: 目标进制，2到36或62
+        max_digits: 最多输出的小数位数，见 fraction_to_base
+        group_size: 整数部分从右向左每多少位分为一组，0表示不分组
+        separator: 分组的分隔符
+
+    Returns:
+        目标进制的数字文本
+
+    Raises:
+        ValueError: 进制、位数上限或数字文本无效
+    """
+    result = fraction_to_base(parse_fraction(text, from_base), to_base, max_digits)
+    if group_size:
+        integer_part, point, fraction_part = result.partition(".")
+        result = group_digits(integer_part, group_size, separator) + point + fraction_part
+    return result
+
+
+def convert_many(numbers, from_base, to_base, max_digits=DEFAULT_FRACTION_DIGITS, group_size=0, separator=" "):
+    """逐条转换多个数字，单条出错不中断整批
+
+    Args:
+        numbers: 数字文本的可迭代对象，如日志文件的各行；空白行被跳过
+        from_base、to_base、max_digits、group_size、separator: 见 convert_fraction
+
+    Yields:
+        按输入顺序排列的 ConversionResult，序号为该条在输入中的位置
+
+    Raises:
+        ValueError: 进制或位数上限无效（在开始转换前检查）
+    """
+    _check_base(from_base)
+    _check_base(to_base)
+    _check_fraction_digits(max_digits)
+    for line, text in enumerate(numbers, 1):
+        text = text.strip()
+        if not text:
+            continue
+        try:
+            yield ConversionResult(line, text, convert_fraction(text, from_base, to_base, max_digits,
+                                                                group_size, separator), None)
+        except ValueError as e:
+            yield ConversionResult(line, text, None, str(e))
+
+
+def _float_format(format_name):
+    """查找浮点数格式
+
+    Raises:
+        ValueError: 格式名无效
+    """
+    try:
+        return FLOAT_FORMATS[format_name]
+    except KeyError:
+        raise ValueError("浮点数格式必须是float32或float64") from None
+
+
+def _describe_bits(bits, format_name):
+    """由位模式整数得到 FloatBits"""
+    float_code, int_code, exponent_bits, mantissa_bits = FLOAT_FORMATS[format_name]
+    value = struct.unpack(float_code, struct.pack(int_code, bits))[0]
+    sign = bits >> (exponent_bits + mantissa_bits)
+    exponent = (bits >> mantissa_bits) & ((1 << exponent_bits) - 1)
+    mantissa = bits & ((1 << mantissa_bits) - 1)
+    if exponent == (1 << exponent_bits) - 1:
+        kind = "NaN" if mantissa else "无穷大"
+    elif exponent == 0:
+        kind = "非规格化数" if mantissa else "零"
+    else:
+        kind = "规格化数"
+    if math.isfinite(value):
+        from decimal import Decimal
+        # Decimal(float) 是浮点数的精确值；float32 的值扩展为双精度时不变
+        exact = str(Decimal(value))
+    else:
+        exact = repr(value)
+    width = 1 + exponent_bits + mantissa_bits
+    return FloatBits(
+        format_name, bits, format(bits, f"0{width // 4}X"),
+        f"{sign} {exponent:0{exponent_bits}b} {mantissa:0{mantissa_bits}b}",
+        sign, exponent, mantissa, kind, value, exact
+    )
+
+
+def _is_finite_input(value):
+    """输入本身是否为有限值（float() 溢出为无穷大之前）"""
+    if isinstance(value, str):
+        text = value.strip().lower()
+        return "inf" not in text and "nan" not in text
+    is_finite = getattr(value, 'is_finite', None)  # Decimal
+    if is_finite is not None:
+        return is_finite()
+    return not isinstance(value, float)
+
+
+def float_bits(value, format_name='float64'):
+    """查看数值按IEEE-754存储时的位模式
+
+    Args:
+        value: 数值，或 float() 能解析的文本（如 "0.1"、"-inf"、"1e-40"）；
+            float32 按就近舍入（偶数优先）到单精度
+        format_name: 'float32' 或 'float64'
+
+    Returns:
+        FloatBits，如 float_bits(0.1) 的 hex 为 "3FB999999999999A"，
+        exact 为 "0.1000000000000000055511151231257827021181583404541015625"
+
+    Raises:
+        ValueError: 格式名无效、文本不是数字，或有限的数值超出该格式的范围
+            （如 "1e400"，不会静默变为无穷大）
+    """
+    float_code, int_code = _float_format(format_name)[:2]
+    try:
+        number = float(value)
+    except (TypeError, ValueError):
+        raise ValueError(f"无效的数字: {value}") from None
+    except OverflowError:
+        raise ValueError(f"数值超出{format_name}的范围") from None
+    if not math.isfinite(number) and _is_finite_input(value):
+        raise ValueError(f"数值超出{format_name}的范围")
+    try:
+        packed = struct.pack(float_code, number)
+    except OverflowError:
+        raise ValueError(f"数值超出{format_name}的范围") from None
+    return _describe_bits(struct.unpack(int_code, packed)[0], format_name)
+
+
+def float_from_bits(bits, format_name='float64'):
+    """由位模式还原浮点数
+
+    Args:
+        bits: 位模式整数，或16进制文本（可以有 0x 前缀）
+        format_name: 'float32' 或 'float64'
+
+    Returns:
+        FloatBits
+
+    Raises:
+        ValueError: 格式名无效，或位模式不是该格式宽度内的非负整数
+    """
+    exponent_bits, mantissa_bits = _float_format(format_name)[2:]
+    width = 1 + exponent_bits + mantissa_bits
+    if isinstance(bits, str):
+        try:
+            bits = int("".join(bits.split()), 16)
+        except ValueError:
+            raise ValueError(f"无效的16进制位模式: {bits}") from None
+    if not isinstance(bits, int) or not 0 <= bits < 1 << width:
+        raise ValueError(f"{format_name}的位模式必须是{width}位的非负整数")
+    return _describe_bits(bits, format_name)
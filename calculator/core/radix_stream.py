@@ -0,0 +1,191 @@
+"""2的幂进制之间的流式转换
+
+2、4、8、16、32进制的每一位都对应固定数量的二进制位，只要每段的二进制位数
+同时是两种进制每位位数的整数倍，各段就可以独立转换后直接拼接，不必把整个数
+读入内存。数字是右对齐的，所以先扫描一遍统计数字个数，让第一段取余下的
+不足一整段的部分，之后每段都是整段。
+
+文件通过 mmap 读取，输入中的空白（如十六进制转储的换行）被忽略。
+内存占用只与每段的大小有关，与文件大小无关。
+"""
+
+import base64
+import math
+import mmap
+
+from .radix import digit_table
+
+POWER_OF_TWO_BASES = (2, 4, 8, 16, 32)
+
+# 默认每段的输入数字个数
+DEFAULT_CHUNK_DIGITS = 1 << 20
+
+# 输入中忽略的空白字符
+_WHITESPACE = b" \t\r\n\v\f"
+
+# format() 直接支持的目标进制
+_FORMAT_CODES = {2: 'b', 8: 'o', 16: 'X'}
+
+# 16进制的每一位对应两位4进制数字
+_HEX_TO_BASE4 = str.maketrans({
+    digit: f"{value // 4}{value % 4}" for value, digit in enumerate("0123456789abcdef")
+})
+
+# base64.b32encode 的字母表（RFC 4648）换成与 int(text, 32) 一致的 0-9A-V
+_B32_TO_DIGITS = bytes.maketrans(b"ABCDEFGHIJKLMNOPQRSTUVWXYZ234567", b"0123456789ABCDEFGHIJKLMNOPQRSTUV")
+
+
+def _bits_per_digit(base):
+    """2的幂进制每一位对应的二进制位数
+
+    Raises:
+        ValueError: 不是支持流式转换的进制
+    """
+    if base not in POWER_OF_TWO_BASES:
+        raise ValueError("流式转换只支持2、4、8、16、32进制")
+    return base.bit_length() - 1
+
+
+def _valid_digits(base):
+    """进制中合法的数字字符（含小写字母），用于 bytes.translate 删除后检查是否有剩余"""
+    return "".join(digit_table(base)[1]).encode('ascii')
+
+
+def _format_digits(value, base, width):
+    """把整数转换为恰好 width 位（左侧补0）的2的幂进制字符串"""
+    code = _FORMAT_CODES.get(base)
+    if code:
+        return format(value, f"0{width}{code}")
+    if base == 4:
+        text = format(value, f"0{(width + 1) // 2}x").translate(_HEX_TO_BASE4)
+    else:
+        # 32进制：每5字节对应8位数字，借用 base64.b32encode 后换成 0-9A-V 字母表
+        length = (width * 5 + 39) // 40 * 5
+        text = base64.b32encode(value.to_bytes(length, 'big')).translate(_B32_TO_DIGITS).decode('ascii')
+    return text[-width:]
+
+
+def _digit_blocks(data, block_size):
+    """按块读取输入并删除空白，每块是只含数字字符的bytes
+
+    读取 mmap 时块的起点按页对齐，读完的页通过 madvise 从进程的映射中释放，
+    常驻内存不会随已读取的文件大小增长（页面仍留在系统的文件缓存中）。
+    """
+    release = getattr(data, 'madvise', None) if hasattr(mmap, 'MADV_DONTNEED') else None
+    if release is not None:
+        block_size = -(-block_size // mmap.ALLOCATIONGRANULARITY) * mmap.ALLOCATIONGRANULARITY
+    for start in range(0, len(data), block_size):
+        block = data[start:start + block_size].translate(None, _WHITESPACE)
+        if release is not None:
+            release(mmap.MADV_DONTNEED, start, min(block_size, len(data) - start))
+        if block:
+            yield block
+
+
+def iter_convert(data, from_base, to_base, chunk_digits=DEFAULT_CHUNK_DIGITS, preserve_width=False):
+    """把2的幂进制的数字流式转换为另一种2的幂进制
+
+    Args:
+        data: 数字文本，bytes、mmap 等支持切片的字节序列，也可以是 str；空白被忽略
+        from_base: 源进制，2、4、8、16、32之一，字母不区分大小写
+        to_base: 目标进制，2、4、8、16、32之一，字母为大写
+        chunk_digits: 每段大约包含的输入数字个数，决定内存占用
+        preserve_width: 为True时保留前导0，输出位数由输入的总位数决定
+            （如16进制的 "0F" 转换为 "00001111"）；默认去掉前导0
+
+    Yields:
+        输出的各段字符串，依次拼接即为完整结果
+
+    Raises:
+        ValueError: 进制不支持、输入为空或包含无效的数字
+    """
+    from_bits = _bits_per_digit(from_base)
+    to_bits = _bits_per_digit(to_base)
+    if isinstance(data, str):
+        try:
+            data = data.encode('ascii')
+        except UnicodeEncodeError:
+            raise ValueError(f"无效的{from_base}进制数字") from None
+
+    # 每段的二进制位数是两种进制位数（以及32进制编码用到的字节）的公倍数
+    unit_bits = math.lcm(from_bits, to_bits, 8)
+    chunk_bits = max(unit_bits, chunk_digits * from_bits // unit_bits * unit_bits)
+    block_size = chunk_bits // from_bits
+
+    total_digits = sum(len(block) for block in _digit_blocks(data, block_size))
+    if total_digits == 0:
+        raise ValueError("输入中没有数字")
+    wanted_bits = total_digits * from_bits % chunk_bits or chunk_bits
+
+    valid = _valid_digits(from_base)
+    leading_zeros = not preserve_width
+    consumed = 0
+    pending = b""
+    for block in _digit_blocks(data, block_size):
+        pending += block
+        while len(pending) * from_bits >= wanted_bits:
+            count = wanted_bits // from_bits
+            digits, pending = pending[:count], pending[count:]
+            invalid = digits.translate(None, valid)
+            if invalid:
+                position = consumed + digits.index(invalid[:1]) + 1
+                raise ValueError(f"无效的{from_base}进制数字（第{position}位）")
+            text = _format_digits(int(digits, from_base), to_base, -(-wanted_bits // to_bits))
+            consumed += count
+            wanted_bits = chunk_bits
+            if leading_zeros:
+                text = text.lstrip("0")
+                if not text:
+                    continue
+                leading_zeros = False
+            yield text
+    if leading_zeros:
+        yield "0"
+
+
+def iter_convert_file(path, from_base, to_base, chunk_digits=DEFAULT_CHUNK_DIGITS, preserve_width=False):
+    """通过 mmap 读取文件，流式转换其中的数字，参数和结果见 iter_convert
+
+    Raises:
+        ValueError: 进制不支持、文件为空或包含无效的数字
+        OSError: 文件无法读取
+    """
+    with open(path, 'rb') as file:
+        if file.seek(0, 2) == 0:
+            raise ValueError("输入中没有数字")
+        with mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ) as data:
+            yield from iter_convert(data, from_base, to_base, chunk_digits, preserve_width)
+
+
+def convert_file(input_path, output, from_base, to_base, chunk_digits=DEFAULT_CHUNK_DIGITS,
+                 preserve_width=False):
+    """流式转换文件中的数字并逐段写出
+
+    Args:
+        input_path: 输入文件路径
+        output: 输出文件路径，或有 write 方法的文本流
+        from_base: 源进制，2、4、8、16、32之一
+        to_base: 目标进制，2、4、8、16、32之一
+        chunk_digits: 每段大约包含的输入数字个数
+        preserve_width: 是否保留前导0
+
+    Returns:
+        写出的数字个数
+
+    Raises:
+        ValueError: 进制不支持、文件为空或包含无效的数字；此时输出文件中可能已有部分结果
+        OSError: 文件无法读写
+    """
+    if hasattr(output, 'write'):
+        return _write_all(iter_convert_file(input_path, from_base, to_base, chunk_digits, preserve_width), output)
+    with open(output, 'w', encoding='ascii', newline='') as stream:
+        return _write_all(iter_convert_file(input_path, from_base, to_base, chunk_digits, preserve_width), stream)
+
+
+def _write_all(pieces, stream):
+    """把各段写入文本流，返回写出的字符数"""
+    written = 0
+    for piece in pieces:
+        stream.write(piece)
+        written += len(piece)
+    return written
@@ -100,6 +100,22 @@ class ScientificCalculator:
         """返回自然对数的底e"""
         return math.e
     
+    @staticmethod
+    def decimal_context(precision=28):
+        """获取十进制高精度计算上下文
+        
+        返回的 DecimalContext 提供与本类同名的方法（sin、cos、log、exp等），
+        参数和结果为 decimal.Decimal，按precision位有效数字计算。
+        
+        Args:
+            precision: 有效数字位数
+        
+        Returns:
+            DecimalContext 对象，同一精度共享同一个对象
+        """
+        from .decimal_context import get_decimal_context
+        return get_decimal_context(precision)
+    
     @staticmethod
     def radians(degrees):
         """角度转弧度"""
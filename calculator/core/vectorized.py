@@ -0,0 +1,165 @@
+"""向量化批量计算模块
+
+把带命名变量的表达式（如 (a+b)*c/2）只编译一次，然后对整列数据批量求值。
+安装了 NumPy 时，每条字节码指令对应一次数组运算；否则退化为对 array.array
+等序列逐行执行已编译的字节码，同样不需要逐行解析表达式。
+
+除数为零的处理与标量计算一致：标量计算会抛出 ValueError 的行，
+在结果中为 NaN，并在错误掩码中标记为 True。
+"""
+
+import math
+import re
+from array import array
+from itertools import repeat
+
+from .expression_parser import compile_expression
+from .expression_vm import OP_ADD, OP_DIV, OP_LOAD, OP_MUL, OP_NEG, OP_PUSH, OP_SUB
+
+try:
+    import numpy as np
+except ImportError:  # NumPy是可选依赖
+    np = None
+
+# 用于从表达式中推断变量名
+_NAME_RE = re.compile(r'[A-Za-z_][A-Za-z0-9_]*')
+
+
+class VectorizedExpression:
+    """编译一次、按列批量求值的表达式"""
+
+    def __init__(self, expression, variables=None):
+        """编译表达式
+
+        Args:
+            expression: 带变量的表达式字符串，支持+、-、*、/、×、÷、()和隐式乘法
+            variables: 变量名序列；为None时按在表达式中首次出现的顺序推断
+
+        Raises:
+            ValueError: 表达式语法错误或使用了未定义的变量
+        """
+        if variables is None:
+            variables = list(dict.fromkeys(_NAME_RE.findall(expression)))
+        self.compiled = compile_expression(expression, variables=variables)
+        self.variables = self.compiled.variables
+
+    def __repr__(self):
+        return f"VectorizedExpression({self.compiled.source!r}, variables={self.variables})"
+
+    def evaluate(self, data=None, use_numpy=None, **columns):
+        """对整列数据求值
+
+        Args:
+            data: 变量名到列数据的映射，可与关键字参数混用
+            use_numpy: 是否使用NumPy；为None时自动选择
+            **columns: 变量名到列数据的映射；列数据可以是NumPy数组、
+                array.array、列表或单个数值（对所有行广播）
+
+        Returns:
+            (结果, 错误掩码) 元组。使用NumPy时两者都是ndarray；否则结果为
+            array('d')，错误掩码为array('b')。出错的行结果为NaN。
+
+        Raises:
+            ValueError: 缺少变量、列长度不一致，或要求使用NumPy但未安装
+        """
+        if data:
+            columns = {**data, **columns}
+        missing = [name for name in self.variables if name not in columns]
+        if missing:
+            raise ValueError(f"缺少变量: {', '.join(missing)}")
+        values = [columns[name] for name in self.variables]
+
+        if use_numpy is None:
+            use_numpy = np is not None
+        elif use_numpy and np is None:
+            raise ValueError("未安装NumPy")
+
+        if use_numpy:
+            return self._evaluate_numpy(values)
+        return self._evaluate_rows(values)
+
+    def _evaluate_numpy(self, values):
+        """用NumPy数组运算逐条执行字节码"""
+        arrays = [np.asarray(value) for value in values]
+        shape = np.broadcast_shapes(*(a.shape for a in arrays)) if arrays else ()
+        errors = np.zeros(shape, dtype=bool)
+        constants = self.compiled.constants
+        stack = []
+        push = stack.append
+        pop = stack.pop
+        instructions = iter(self.compiled.code)
+
+        with np.errstate(divide='ignore', invalid='ignore', over='ignore'):
+            for op, arg in zip(instructions, instructions):
+                if op == OP_PUSH:
+                    push(constants[arg])
+                elif op == OP_LOAD:
+                    push(arrays[arg])
+                elif op == OP_NEG:
+                    stack[-1] = np.negative(stack[-1])
+                else:
+                    right = pop()
+                    left = stack[-1]
+                    if op == OP_ADD:
+                        stack[-1] = np.add(left, right)
+                    elif op == OP_SUB:
+                        stack[-1] = np.subtract(left, right)
+                    elif op == OP_MUL:
+                        stack[-1] = np.multiply(left, right)
+                    elif op == OP_DIV:
+                        zero = np.equal(right, 0)
+                        if zero.any():
+                            errors = errors | zero
+                            right = np.where(zero, 1, right)
+                        stack[-1] = np.true_divide(left, right)
+
+        result = np.broadcast_to(np.asarray(stack[0]), shape)
+        if errors.any():
+            result = np.where(errors, np.nan, result)
+        else:
+            result = result.copy()
+        return result, errors
+
+    def _evaluate_rows(self, values):
+        """没有NumPy时逐行执行已编译的字节码"""
+        length = None
+        iterables = []
+        for name, value in zip(self.variables, values):
+            if isinstance(value, (int, float)):
+                iterables.append(repeat(value))
+                continue
+            if length is None:
+                length = len(value)
+            elif len(value) != length:
+                raise ValueError(f"列长度不一致: {name}")
+            iterables.append(value)
+        if length is None:
+            length = 1
+
+        run = self.compiled.run
+        results = array('d')
+        errors = array('b')
+        append_result = results.append
+        append_error = errors.append
+        nan = math.nan
+        for row in zip(range(length), *iterables):
+            try:
+                append_result(run(row[1:]))
+                append_error(0)
+            except (ValueError, ArithmeticError):
+                append_result(nan)
+                append_error(1)
+        return results, errors
+
+
+def compile_vectorized(expression, variables=None):
+    """编译带变量的表达式，用于批量求值
+
+    Args:
+        expression: 带变量的表达式字符串
+        variables: 变量名序列；为None时自动推断
+
+    Returns:
+        VectorizedExpression 对象
+    """
+    return VectorizedExpression(expression, variables)
@@ -1,9 +1,30 @@
-"""数据存储模块包"""
+"""数据存储模块包
 
-from .history_manager import HistoryManager
-from .config_manager import ConfigManager
+包中的类和函数在第一次访问时才导入对应的子模块（模块级 __getattr__），
+只用配置管理器时不会加载历史记录存储用到的 sqlite3、datetime 等模块。
+"""
 
-__all__ = [
-    'HistoryManager',
-    'ConfigManager'
-]
\ No newline at end of file
+import importlib
+
+# 公开名称 -> 定义它的子模块
+_LAZY_ATTRIBUTES = {
+    'HistoryManager': 'history_manager',
+    'HistoryLog': 'history_log',
+    'ConfigManager': 'config_manager',
+    'BackgroundWriter': 'persistence',
+    'atomic_write': 'persistence'
+}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+def __getattr__(name):
+    """第一次访问公开名称时导入对应的子模块，并缓存到包的命名空间"""
+    module_name = _LAZY_ATTRIBUTES.get(name)
+    if module_name is None:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    value = getattr(importlib.import_module(f'.{module_name}', __name__), name)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    return sorted(set(globals()) | set(__all__))
@@ -1,14 +1,47 @@
+import copy
 import json
 import os
+import threading
+import time
+from contextlib import contextmanager
+
+from .persistence import BackgroundWriter
 
 class ConfigManager:
-    """配置管理器类，负责用户偏好设置的保存和加载"""
+    """配置管理器类，负责用户偏好设置的保存和加载
+    
+    解析后的配置缓存在内存中，读取配置只是字典查找；只有配置文件的
+    修改时间或大小变化时才重新解析（文件状态最多每 reload_interval 秒检查一次）。
+    进程内应通过 ConfigManager.shared() 共享同一个实例。
+    """
+    
+    # 进程内共享的实例（配置文件名 -> 实例）
+    _instances = {}
+    _instances_lock = threading.Lock()
+    
+    @classmethod
+    def shared(cls, config_file="calculator_config.json"):
+        """获取进程内共享的配置管理器实例
+        
+        Args:
+            config_file: 配置文件路径
+        
+        Returns:
+            ConfigManager 实例，同一配置文件只创建一次
+        """
+        with cls._instances_lock:
+            instance = cls._instances.get(config_file)
+            if instance is None:
+                instance = cls(config_file)
+                cls._instances[config_file] = instance
+            return instance
     
-    def __init__(self, config_file="calculator_config.json"):
+    def __init__(self, config_file="calculator_config.json", reload_interval=1.0):
         """初始化配置管理器
         
         Args:
             config_file: 配置文件路径
+            reload_interval: 检查配置文件是否被外部修改的最小间隔（秒）
         """
         # 获取用户数据目录
         self.config_dir = os.path.join(os.path.expanduser("~"), ".python_calculator")
@@ -23,37 +56,103 @@ class ConfigManager:
             "auto_save": True,  # 是否自动保存
             "recent_tabs": [],  # 最近使用的选项卡
             "window_size": {"width": 450, "height": 600},  # 窗口大小
-            "precision": 10,  # 计算精度（小数位数）
+            "precision": 10,  # 计算精度：精确分数模式为显示的小数位数，十进制模式为有效数字位数
+            "number_mode": "float",  # 数值模式：float（浮点数）、fraction（精确分数）或decimal（十进制高精度）
+            "fraction_display": "fraction",  # 精确模式的结果显示：fraction（分数）或decimal（按精度舍入的小数）
             "angle_unit": "radians"  # 角度单位：radians或degrees
         }
         
+        # 内存中的配置缓存及其对应的文件状态 (修改时间, 大小)
+        self.reload_interval = reload_interval
+        self._lock = threading.RLock()
+        self._config = None
+        self._file_state = None
+        self._next_check = 0.0
+        # 内存中的配置是否比文件新（有尚未写完的修改）
+        self._dirty = False
+        # 批量修改的嵌套深度，以及批量修改期间是否有修改
+        self._batch_depth = 0
+        self._batch_dirty = False
+        # 配置文件由共享的后台写入器写入，_write_generation 用于识别最近一次写入
+        self.writer = BackgroundWriter.shared()
+        self._write_generation = 0
+        
         # 确保配置目录存在
         if not os.path.exists(self.config_dir):
             os.makedirs(self.config_dir)
         
-        # 如果配置文件不存在，创建默认配置文件
+        # 如果配置文件不存在，立即创建默认配置文件
         if not os.path.exists(self.config_file):
             self.save_config(self.default_config)
+            self.writer.flush(self.config_file)
+    
+    def _stat_config_file(self):
+        """获取配置文件的 (修改时间, 大小)，文件不存在时返回None"""
+        try:
+            stat = os.stat(self.config_file)
+        except OSError:
+            return None
+        return (stat.st_mtime_ns, stat.st_size)
+    
+    def _cached_config(self):
+        """获取缓存的配置字典，文件被外部修改后重新解析
+        
+        Returns:
+            缓存的配置字典（调用者不应修改）
+        """
+        now = time.monotonic()
+        if self._config is not None and (self._dirty or now < self._next_check):
+            return self._config
+        
+        with self._lock:
+            self._next_check = now + self.reload_interval
+            file_state = self._stat_config_file()
+            if self._config is not None and file_state == self._file_state:
+                return self._config
+            
+            try:
+                with open(self.config_file, 'r', encoding='utf-8') as f:
+                    config = json.load(f)
+                    
+                    # 合并默认配置，确保所有必要的键都存在
+                    for key, value in self.default_config.items():
+                        if key not in config:
+                            config[key] = copy.deepcopy(value)
+            except Exception as e:
+                print(f"加载配置失败: {e}")
+                config = copy.deepcopy(self.default_config)
+            
+            self._config = config
+            self._file_state = file_state
+            return config
     
     def load_config(self):
         """加载配置
         
         Returns:
-            配置字典
+            配置字典（副本，修改后需调用 save_config 保存）
+        """
+        return copy.deepcopy(self._cached_config())
+    
+    @contextmanager
+    def batch(self):
+        """批量修改配置，退出时只写入一次文件
+        
+        用法：
+            with config_manager.batch():
+                config_manager.set_theme("dark")
+                config_manager.set_window_size(800, 600)
         """
+        with self._lock:
+            self._batch_depth += 1
         try:
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                config = json.load(f)
-                
-                # 合并默认配置，确保所有必要的键都存在
-                for key, value in self.default_config.items():
-                    if key not in config:
-                        config[key] = value
-                
-                return config
-        except Exception as e:
-            print(f"加载配置失败: {e}")
-            return self.default_config
+            yield self
+        finally:
+            with self._lock:
+                self._batch_depth -= 1
+                if self._batch_depth == 0 and self._batch_dirty:
+                    self._batch_dirty = False
+                    self._write_config(self._config)
     
     def save_config(self, config):
         """保存配置
@@ -77,15 +176,54 @@ class ConfigManager:
                         merged_config[key] = default_value
                 else:
                     merged_config[key] = default_value
+            # 缓存不与调用者的字典或默认配置共享可变的值
+            merged_config = copy.deepcopy(merged_config)
             
-            with open(self.config_file, 'w', encoding='utf-8') as f:
-                json.dump(merged_config, f, ensure_ascii=False, indent=2)
-            
-            return True
+            with self._lock:
+                self._config = merged_config
+                # 批量修改期间只更新内存中的配置，退出batch时统一写入
+                if self._batch_depth:
+                    self._dirty = True
+                    self._batch_dirty = True
+                    return True
+                return self._write_config(merged_config)
         except Exception as e:
             print(f"保存配置失败: {e}")
             return False
     
+    def _write_config(self, config):
+        """提交配置写入，由后台写入器原子地写入文件，调用线程不等待磁盘I/O
+        
+        写入完成前内存中的配置比文件新，此期间不会从文件重新加载。
+        
+        Args:
+            config: 已验证的配置字典，提交后不再修改
+        
+        Returns:
+            是否成功提交
+        """
+        with self._lock:
+            self._dirty = True
+            self._write_generation += 1
+            generation = self._write_generation
+        
+        def on_written():
+            # 只有最近一次提交写完后，文件才与内存中的配置一致
+            with self._lock:
+                if generation == self._write_generation and not self._batch_dirty:
+                    self._dirty = False
+                    self._file_state = self._stat_config_file()
+        
+        def on_failed(error):
+            # 写入失败后不再认为有写入在进行，恢复按文件变化重新加载；
+            # 文件未被外部修改时仍使用内存中的配置，下一次修改会再次尝试写入
+            with self._lock:
+                if generation == self._write_generation and not self._batch_dirty:
+                    self._dirty = False
+        
+        self.writer.write_json(self.config_file, config, callback=on_written, error_callback=on_failed)
+        return True
+    
     def get_config_value(self, key, default=None):
         """获取单个配置值
         
@@ -94,10 +232,16 @@ class ConfigManager:
             default: 默认值
         
         Returns:
-            配置值或默认值
+            配置值或默认值；字典和列表返回副本，修改后需调用 set_config_value 保存
         """
-        config = self.load_config()
-        return config.get(key, default if default is not None else self.default_config.get(key))
+        config = self._cached_config()
+        if key in config:
+            value = config[key]
+        elif default is not None:
+            return default
+        else:
+            value = self.default_config.get(key)
+        return copy.deepcopy(value) if isinstance(value, (dict, list)) else value
     
     def set_config_value(self, key, value):
         """设置单个配置值
@@ -109,9 +253,10 @@ class ConfigManager:
         Returns:
             是否成功
         """
-        config = self.load_config()
-        config[key] = value
-        return self.save_config(config)
+        with self._lock:
+            config = dict(self._cached_config())
+            config[key] = value
+            return self.save_config(config)
     
     def reset_config(self):
         """重置配置为默认值
@@ -210,6 +355,72 @@ class ConfigManager:
             return False
         return self.set_config_value("angle_unit", unit)
     
+    def get_precision(self):
+        """获取计算精度
+        
+        Returns:
+            小数位数
+        """
+        return self.get_config_value("precision")
+    
+    def set_precision(self, precision):
+        """设置计算精度
+        
+        Args:
+            precision: 小数位数 (0-100)
+        
+        Returns:
+            是否成功
+        """
+        if not isinstance(precision, int) or isinstance(precision, bool) or precision < 0 or precision > 100:
+            print("无效的精度")
+            return False
+        return self.set_config_value("precision", precision)
+    
+    def get_number_mode(self):
+        """获取数值模式
+        
+        Returns:
+            数值模式 (float、fraction 或 decimal)
+        """
+        return self.get_config_value("number_mode")
+    
+    def set_number_mode(self, mode):
+        """设置数值模式
+        
+        Args:
+            mode: 数值模式 (float、fraction 或 decimal)
+        
+        Returns:
+            是否成功
+        """
+        if mode not in ["float", "fraction", "decimal"]:
+            print("无效的数值模式")
+            return False
+        return self.set_config_value("number_mode", mode)
+    
+    def get_fraction_display(self):
+        """获取精确模式的结果显示方式
+        
+        Returns:
+            显示方式 (fraction 或 decimal)
+        """
+        return self.get_config_value("fraction_display")
+    
+    def set_fraction_display(self, display):
+        """设置精确模式的结果显示方式
+        
+        Args:
+            display: 显示方式 (fraction 或 decimal)
+        
+        Returns:
+            是否成功
+        """
+        if display not in ["fraction", "decimal"]:
+            print("无效的显示方式")
+            return False
+        return self.set_config_value("fraction_display", display)
+    
     def should_remember_history(self):
         """是否记住历史记录
         
@@ -0,0 +1,229 @@
+import re
+import sqlite3
+import threading
+
+# FTS5默认分词器（unicode61）中的一个词：连续的字母和数字
+_FTS_TOKEN = re.compile(r"[^\W_]+")
+
+class HistoryDatabase:
+    """基于SQLite的历史记录存储
+
+    使用WAL日志模式，追加记录不会阻塞读取；时间戳上建有索引，按日期范围查询
+    是一次索引范围扫描；表达式和结果另建FTS5全文索引，按文本搜索不必逐条比较。
+    只依赖标准库sqlite3。
+    """
+
+    def __init__(self, db_file, max_items=100, compact_threshold=None):
+        """初始化数据库
+
+        Args:
+            db_file: 数据库文件路径
+            max_items: 保留的最大记录数量，为None时不限制
+            compact_threshold: 记录数超过该值时删除最旧的记录，默认为max_items的两倍
+        """
+        self.db_file = db_file
+        self.max_items = max_items
+        if max_items is None:
+            self.compact_threshold = None
+        else:
+            self.compact_threshold = compact_threshold or max_items * 2
+        self._lock = threading.RLock()
+        self._conn = sqlite3.connect(db_file, check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self.has_fts = self._create_schema()
+        self._count = self._conn.execute("SELECT COUNT(*) FROM history").fetchone()[0]
+
+    def _create_schema(self):
+        """创建表、索引和全文索引，返回是否支持FTS5"""
+        with self._conn:
+            self._conn.execute(
+                "CREATE TABLE IF NOT EXISTS history ("
+                "id INTEGER PRIMARY KEY, expression TEXT NOT NULL, result, timestamp TEXT NOT NULL)"
+            )
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_history_timestamp ON history(timestamp)"
+            )
+        try:
+            with self._conn:
+                # 外部内容表：全文索引只保存倒排表，数据仍在history表中，由触发器同步
+                self._conn.execute(
+                    "CREATE VIRTUAL TABLE IF NOT EXISTS history_fts USING fts5("
+                    "expression, result, content='history', content_rowid='id')"
+                )
+                self._conn.execute(
+                    "CREATE TRIGGER IF NOT EXISTS history_fts_insert AFTER INSERT ON history BEGIN "
+                    "INSERT INTO history_fts(rowid, expression, result) "
+                    "VALUES (new.id, new.expression, new.result); END"
+                )
+                self._conn.execute(
+                    "CREATE TRIGGER IF NOT EXISTS history_fts_delete AFTER DELETE ON history BEGIN "
+                    "INSERT INTO history_fts(history_fts, rowid, expression, result) "
+                    "VALUES ('delete', old.id, old.expression, old.result); END"
+                )
+            return True
+        except sqlite3.OperationalError:
+            # SQLite编译时未启用FTS5，文本搜索退化为LIKE扫描
+            return False
+
+    def __len__(self):
+        """记录数量"""
+        return self._count
+
+    def close(self):
+        """关闭数据库连接"""
+        with self._lock:
+            self._conn.close()
+
+    def append(self, item):
+        """追加一条记录
+
+        Args:
+            item: 历史记录字典，包含expression、result和timestamp
+        """
+        self.append_many([item])
+
+    def append_many(self, items):
+        """在一个事务中追加多条记录
+
+        Args:
+            items: 历史记录字典的可迭代对象
+        """
+        rows = [
+            (item.get('expression', ''), item.get('result', ''), item.get('timestamp', ''))
+            for item in items
+        ]
+        with self._lock:
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT INTO history (expression, result, timestamp) VALUES (?, ?, ?)", rows
+                )
+            self._count += len(rows)
+            if self.compact_threshold is not None and self._count > self.compact_threshold:
+                self.compact()
+
+    def compact(self):
+        """删除最旧的记录，只保留最新的 max_items 条"""
+        if self.max_items is None:
+            return
+        with self._lock:
+            with self._conn:
+                self._conn.execute(
+                    "DELETE FROM history WHERE id NOT IN "
+                    "(SELECT id FROM history ORDER BY timestamp DESC, id DESC LIMIT ?)",
+                    (self.max_items,)
+                )
+            self._count = self._conn.execute("SELECT COUNT(*) FROM history").fetchone()[0]
+
+    def rewrite(self, items):
+        """用给定的记录替换全部记录
+
+        Args:
+            items: 历史记录列表（最新的在前）
+        """
+        if self.max_items is not None:
+            items = items[:self.max_items]
+        with self._lock:
+            with self._conn:
+                self._conn.execute("DELETE FROM history")
+                self._conn.executemany(
+                    "INSERT INTO history (expression, result, timestamp) VALUES (?, ?, ?)",
+                    [(item.get('expression', ''), item.get('result', ''), item.get('timestamp', ''))
+                     for item in reversed(items)]
+                )
+            self._count = len(items)
+
+    def clear(self):
+        """删除全部记录"""
+        with self._lock:
+            with self._conn:
+                self._conn.execute("DELETE FROM history")
+            self._count = 0
+
+    def read(self, start=0, count=None):
+        """按从新到旧的顺序读取一页记录
+
+        Args:
+            start: 起始位置，0表示最新的记录
+            count: 读取数量，为None时读取到保留范围的末尾
+
+        Returns:
+            历史记录列表（最新的在前）
+        """
+        if self.max_items is not None:
+            available = max(0, self.max_items - start)
+            count = available if count is None else min(count, available)
+        limit = -1 if count is None else count
+        return self._query(
+            "SELECT expression, result, timestamp FROM history "
+            "ORDER BY timestamp DESC, id DESC LIMIT ? OFFSET ?",
+            (limit, start)
+        )
+
+    def query_by_date(self, start_date=None, end_date=None):
+        """按时间范围查询记录（包含边界），使用时间戳索引
+
+        Args:
+            start_date: 开始时间（datetime），为None时不限制
+            end_date: 结束时间（datetime），为None时不限制
+
+        Returns:
+            历史记录列表（最新的在前）
+        """
+        conditions = []
+        params = []
+        # 时间戳以ISO格式保存，字符串顺序与时间顺序一致
+        if start_date:
+            conditions.append("timestamp >= ?")
+            params.append(start_date.isoformat())
+        if end_date:
+            conditions.append("timestamp <= ?")
+            params.append(end_date.isoformat())
+        where = f"WHERE {' AND '.join(conditions)} " if conditions else ""
+        return self._query(
+            f"SELECT expression, result, timestamp FROM history {where}"
+            "ORDER BY timestamp DESC, id DESC",
+            params
+        )
+
+    def search(self, text, limit=None):
+        """按表达式或结果中的文本搜索记录
+
+        支持FTS5时按词前缀搜索：文本中的词依次是记录中相邻词的前缀，最后一个词按前缀匹配
+        （如 "sin" 匹配 "sin(30)"，"3" 匹配 "3*3" 和 "sin(30)" 但不匹配 "23"）。
+        不支持FTS5，或文本中没有字母和数字（如空字符串、只有运算符的 "+"）时，
+        按子串匹配，与json/jsonl存储的搜索一致。
+
+        Args:
+            text: 要搜索的文本
+            limit: 最多返回的记录数，为None时不限制
+
+        Returns:
+            历史记录列表（最新的在前）
+        """
+        limit = -1 if limit is None else limit
+        if self.has_fts and _FTS_TOKEN.search(text):
+            # 作为短语查询，避免用户输入中的运算符被解释为FTS5语法
+            phrase = '"' + text.replace('"', '""') + '"*'
+            return self._query(
+                "SELECT h.expression, h.result, h.timestamp FROM history_fts "
+                "JOIN history AS h ON h.id = history_fts.rowid "
+                "WHERE history_fts MATCH ? ORDER BY h.timestamp DESC, h.id DESC LIMIT ?",
+                (phrase, limit)
+            )
+        pattern = "%" + text.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        return self._query(
+            "SELECT expression, result, timestamp FROM history "
+            "WHERE expression LIKE ? ESCAPE '\\' OR CAST(result AS TEXT) LIKE ? ESCAPE '\\' "
+            "ORDER BY timestamp DESC, id DESC LIMIT ?",
+            (pattern, pattern, limit)
+        )
+
+    def _query(self, sql, params):
+        """执行查询并转换为历史记录字典列表"""
+        with self._lock:
+            rows = self._conn.execute(sql, params).fetchall()
+        return [
+            {'expression': expression, 'result': result, 'timestamp': timestamp}
+            for expression, result, timestamp in rows
+        ]
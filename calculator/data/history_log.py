@@ -0,0 +1,242 @@
+import json
+import os
+import threading
+from array import array
+from contextlib import contextmanager
+
+try:
+    import fcntl
+except ImportError:  # Windows
+    fcntl = None
+    import msvcrt
+
+from .persistence import atomic_write
+
+
+@contextmanager
+def _process_lock(path):
+    """跨进程的排他锁，锁住 path 文件直到退出上下文
+
+    多个进程（如同时运行的命令行 --save-history）追加同一个日志时，
+    用它保证偏移量的计算、日志和索引的写入不会交错。
+    """
+    with open(path, 'a+b') as f:
+        if fcntl is not None:
+            fcntl.flock(f, fcntl.LOCK_EX)
+        else:
+            f.seek(0)
+            msvcrt.locking(f.fileno(), msvcrt.LK_LOCK, 1)
+        try:
+            yield
+        finally:
+            if fcntl is None:
+                f.seek(0)
+                msvcrt.locking(f.fileno(), msvcrt.LK_UNLCK, 1)
+
+
+class HistoryLog:
+    """追加写入的JSONL历史记录日志
+
+    每条历史记录占日志文件中的一行JSON，添加记录只需在文件末尾追加一行，
+    并在旁路索引文件中追加该行的起始偏移（8字节），耗时与历史记录总数无关。
+    读取时通过索引直接定位到需要的行，不必解析整个文件。
+    日志中的记录超过保留数量的一定倍数时自动压缩，只保留最新的记录。
+    写入时持有旁路锁文件（同名加 .lock 后缀）上的跨进程锁，并在日志被其他进程
+    修改过时重新加载索引，多个进程可以追加同一个日志。
+    """
+
+    # 索引文件中每个偏移量的类型（无符号64位整数）
+    OFFSET_TYPECODE = 'Q'
+
+    def __init__(self, log_file, max_items=100, compact_threshold=None):
+        """初始化历史记录日志
+
+        Args:
+            log_file: 日志文件路径，索引文件为同名加 .idx 后缀
+            max_items: 保留的最大记录数量，为None时不限制（也不压缩）
+            compact_threshold: 日志中的记录数超过该值时压缩，默认为max_items的两倍
+        """
+        self.log_file = log_file
+        self.index_file = log_file + ".idx"
+        self.lock_file = log_file + ".lock"
+        self.max_items = max_items
+        if max_items is None:
+            self.compact_threshold = None
+        else:
+            self.compact_threshold = compact_threshold or max_items * 2
+        self._lock = threading.RLock()
+        self._offsets = array(self.OFFSET_TYPECODE)
+        self._size = 0  # 日志文件的有效长度
+
+        # 确保日志文件存在
+        with _process_lock(self.lock_file):
+            if not os.path.exists(self.log_file):
+                open(self.log_file, 'ab').close()
+            self._load_index()
+
+    def __len__(self):
+        """可见的记录数量（不超过保留数量）"""
+        if self.max_items is None:
+            return len(self._offsets)
+        return min(len(self._offsets), self.max_items)
+
+    def append(self, item):
+        """追加一条记录
+
+        Args:
+            item: 历史记录字典
+        """
+        line = (json.dumps(item, ensure_ascii=False, separators=(',', ':')) + "\n").encode('utf-8')
+        with self._lock, _process_lock(self.lock_file):
+            self._refresh()
+            # 偏移量取自文件的实际末尾，而不是加载时记录的长度
+            with open(self.log_file, 'ab') as f:
+                offset = f.tell()
+                f.write(line)
+            with open(self.index_file, 'ab') as f:
+                array(self.OFFSET_TYPECODE, [offset]).tofile(f)
+            self._offsets.append(offset)
+            self._size = offset + len(line)
+
+            if self.compact_threshold is not None and len(self._offsets) > self.compact_threshold:
+                self._compact()
+
+    def read(self, start=0, count=None):
+        """按从新到旧的顺序读取一页记录
+
+        Args:
+            start: 起始位置，0表示最新的记录
+            count: 读取数量，为None时读取到保留范围的末尾
+
+        Returns:
+            历史记录列表（最新的在前）
+        """
+        with self._lock:
+            if os.path.getsize(self.log_file) != self._size:
+                with _process_lock(self.lock_file):
+                    self._refresh()
+            total = len(self)
+            stop = total if count is None else min(total, start + count)
+            if start >= stop:
+                return []
+
+            # 第i条（从新到旧）记录对应索引中的倒数第i+1个偏移；
+            # 需要的行在文件中是连续的，一次读出后按行拆分
+            offsets = self._offsets
+            first = len(offsets) - stop
+            last = len(offsets) - start
+            begin = offsets[first]
+            end = offsets[last] if last < len(offsets) else self._size
+            with open(self.log_file, 'rb') as f:
+                f.seek(begin)
+                data = f.read(end - begin)
+
+        # 按字节拆分行：JSON字符串中的换行已被转义，而解码后的splitlines还会在U+2028等字符处断行
+        items = [json.loads(line) for line in data.splitlines()]
+        items.reverse()
+        return items
+
+    def rewrite(self, items):
+        """用给定的记录替换整个日志
+
+        Args:
+            items: 历史记录列表（最新的在前）
+        """
+        items = items[:self.max_items]
+        lines = [
+            (json.dumps(item, ensure_ascii=False, separators=(',', ':')) + "\n").encode('utf-8')
+            for item in reversed(items)
+        ]
+        offsets = array(self.OFFSET_TYPECODE)
+        position = 0
+        for line in lines:
+            offsets.append(position)
+            position += len(line)
+        with self._lock, _process_lock(self.lock_file):
+            self._replace(b"".join(lines), offsets)
+
+    def compact(self):
+        """压缩日志，只保留最新的 max_items 条记录"""
+        with self._lock, _process_lock(self.lock_file):
+            self._refresh()
+            self._compact()
+
+    def clear(self):
+        """清空日志和索引"""
+        with self._lock, _process_lock(self.lock_file):
+            self._replace(b"", array(self.OFFSET_TYPECODE))
+
+    def _compact(self):
+        """压缩日志，调用者需持有线程锁和进程锁"""
+        if self.max_items is None or len(self._offsets) <= self.max_items:
+            return
+        keep = self._offsets[-self.max_items:]
+        begin = keep[0]
+        with open(self.log_file, 'rb') as f:
+            f.seek(begin)
+            data = f.read(self._size - begin)
+        offsets = array(self.OFFSET_TYPECODE, (offset - begin for offset in keep))
+        self._replace(data, offsets)
+
+    def _refresh(self):
+        """日志的长度与加载时不同（被其他进程追加或压缩过）时重新加载索引
+
+        调用者需持有进程锁。
+        """
+        if os.path.getsize(self.log_file) != self._size:
+            self._load_index()
+
+    def _replace(self, data, offsets):
+        """原子地替换日志和索引文件内容"""
+        # 先替换索引再替换日志：中途失败时两者不一致，下次加载会重建索引
+        atomic_write(self.index_file, offsets.tobytes())
+        atomic_write(self.log_file, data)
+        self._offsets = offsets
+        self._size = len(data)
+
+    def _load_index(self):
+        """加载索引文件，索引缺失或与日志不一致时重建"""
+        size = os.path.getsize(self.log_file)
+        offsets = array(self.OFFSET_TYPECODE)
+        try:
+            with open(self.index_file, 'rb') as f:
+                offsets.frombytes(f.read())
+        except (OSError, ValueError):
+            offsets = None
+
+        if offsets is not None and self._index_matches(offsets, size):
+            self._offsets = offsets
+            self._size = size
+        else:
+            self._rebuild_index()
+
+    def _index_matches(self, offsets, size):
+        """检查索引是否与日志一致：最后一个偏移处的行应恰好结束于文件末尾"""
+        if not offsets:
+            return size == 0
+        if offsets[0] != 0 or offsets[-1] >= size:
+            return False
+        with open(self.log_file, 'rb') as f:
+            f.seek(offsets[-1])
+            line = f.readline()
+        return line.endswith(b"\n") and offsets[-1] + len(line) == size
+
+    def _rebuild_index(self):
+        """扫描日志重建索引，丢弃末尾不完整的行和损坏的行"""
+        valid = []
+        with open(self.log_file, 'rb') as f:
+            for line in f:
+                if not line.endswith(b"\n"):
+                    break
+                try:
+                    json.loads(line)
+                except ValueError:
+                    continue
+                valid.append(line)
+
+        offsets = array(self.OFFSET_TYPECODE)
+        position = 0
+        for line in valid:
+            offsets.append(position)
+            position += len(line)
+        self._replace(b"".join(valid), offsets)
@@ -1,16 +1,32 @@
+import copy
 import json
 import os
 from datetime import datetime
 
+from .history_log import HistoryLog
+from .persistence import BackgroundWriter, atomic_write
+
 class HistoryManager:
     """历史记录管理器类，负责计算历史的本地存储和读取"""
     
-    def __init__(self, history_file="calculator_history.json"):
+    def __init__(self, history_file="calculator_history.json", storage="json", max_items=100):
         """初始化历史记录管理器
         
         Args:
             history_file: 历史记录文件路径
+            storage: 存储模式，json为整个文件保存一个JSON数组；
+                jsonl为每条记录追加一行JSON，添加记录时不重写整个文件；
+                sqlite为SQLite数据库，按日期和文本查询走索引
+            max_items: 保留的最大历史记录数量，为None时不限制
+        
+        Raises:
+            ValueError: 不支持的存储模式
         """
+        if storage not in ("json", "jsonl", "sqlite"):
+            raise ValueError(f"不支持的存储模式: {storage}")
+        self.storage = storage
+        self.max_items = max_items
+        
         # 获取用户数据目录
         self.history_dir = os.path.join(os.path.expanduser("~"), ".python_calculator")
         self.history_file = os.path.join(self.history_dir, history_file)
@@ -19,10 +35,26 @@ class HistoryManager:
         if not os.path.exists(self.history_dir):
             os.makedirs(self.history_dir)
         
+        # jsonl和sqlite模式下的存储对象，二者提供相同的读写方法
+        self.log = None
+        if storage == "jsonl":
+            # 追加写入的日志文件使用 .jsonl 扩展名，与JSON数组文件区分
+            self.history_file = os.path.splitext(self.history_file)[0] + ".jsonl"
+            self.log = HistoryLog(self.history_file, max_items=max_items)
+            return
+        if storage == "sqlite":
+            # 只有sqlite模式才导入sqlite3，json和jsonl模式不承担它的导入开销
+            from .history_db import HistoryDatabase
+            self.history_file = os.path.splitext(self.history_file)[0] + ".db"
+            self.log = HistoryDatabase(self.history_file, max_items=max_items)
+            return
+        
+        # json模式下的写入由共享的后台写入器完成，调用线程不等待磁盘I/O
+        self.writer = BackgroundWriter.shared()
+        
         # 如果历史记录文件不存在，创建一个空文件
         if not os.path.exists(self.history_file):
-            with open(self.history_file, 'w', encoding='utf-8') as f:
-                json.dump([], f, ensure_ascii=False, indent=2)
+            atomic_write(self.history_file, b"[]")
     
     def save_history(self, history_items):
         """保存历史记录
@@ -55,12 +87,16 @@ class HistoryManager:
             unique_history.sort(key=lambda x: x.get('timestamp', ''), reverse=True)
             
             # 限制历史记录数量
-            if len(unique_history) > 100:
-                unique_history = unique_history[:100]
+            if self.max_items is not None and len(unique_history) > self.max_items:
+                unique_history = unique_history[:self.max_items]
+            
+            # jsonl和sqlite模式下整体重写存储
+            if self.log is not None:
+                self.log.rewrite(unique_history)
+                return True
             
-            # 保存到文件
-            with open(self.history_file, 'w', encoding='utf-8') as f:
-                json.dump(unique_history, f, ensure_ascii=False, indent=2)
+            # 提交到后台写入器，短时间内的多次保存只写入最后一次
+            self.writer.write_json(self.history_file, unique_history)
             
             return True
         except Exception as e:
@@ -74,6 +110,12 @@ class HistoryManager:
             历史记录列表
         """
         try:
+            if self.log is not None:
+                return self.log.read()
+            # 尚未写入文件的保存优先于文件内容
+            pending = self.writer.pending(self.history_file)
+            if pending is not None:
+                return copy.deepcopy(pending)
             with open(self.history_file, 'r', encoding='utf-8') as f:
                 return json.load(f)
         except Exception as e:
@@ -93,6 +135,15 @@ class HistoryManager:
             'timestamp': datetime.now().isoformat()
         }
         
+        # jsonl和sqlite模式下只追加一条，超过保留数量时由存储定期压缩
+        if self.log is not None:
+            try:
+                self.log.append(history_item)
+                return True
+            except Exception as e:
+                print(f"保存历史记录失败: {e}")
+                return False
+        
         # 加载现有历史记录
         existing_history = self.load_history()
         
@@ -100,8 +151,8 @@ class HistoryManager:
         existing_history.insert(0, history_item)
         
         # 限制历史记录数量
-        if len(existing_history) > 100:
-            existing_history = existing_history[:100]
+        if self.max_items is not None and len(existing_history) > self.max_items:
+            existing_history = existing_history[:self.max_items]
         
         # 保存更新后的历史记录
         return self.save_history(existing_history)
@@ -113,8 +164,10 @@ class HistoryManager:
             是否成功
         """
         try:
-            with open(self.history_file, 'w', encoding='utf-8') as f:
-                json.dump([], f, ensure_ascii=False, indent=2)
+            if self.log is not None:
+                self.log.clear()
+                return True
+            self.writer.write_json(self.history_file, [])
             return True
         except Exception as e:
             print(f"清空历史记录失败: {e}")
@@ -130,6 +183,14 @@ class HistoryManager:
         Returns:
             过滤后的历史记录列表
         """
+        # sqlite模式下直接使用时间戳索引查询
+        if self.storage == "sqlite":
+            try:
+                return self.log.query_by_date(start_date, end_date)
+            except Exception as e:
+                print(f"查询历史记录失败: {e}")
+                return []
+        
         all_history = self.load_history()
         
         if not start_date and not end_date:
@@ -148,6 +209,30 @@ class HistoryManager:
         
         return filtered_history
     
+    def search_history(self, text, limit=None):
+        """按表达式或结果中的文本搜索历史记录
+        
+        Args:
+            text: 要搜索的文本
+            limit: 最多返回的记录数，为None时不限制
+        
+        Returns:
+            匹配的历史记录列表（最新的在前）
+        """
+        # sqlite模式下使用全文索引
+        if self.storage == "sqlite":
+            try:
+                return self.log.search(text, limit)
+            except Exception as e:
+                print(f"搜索历史记录失败: {e}")
+                return []
+        
+        matched = [
+            item for item in self.load_history()
+            if text in str(item.get('expression', '')) or text in str(item.get('result', ''))
+        ]
+        return matched if limit is None else matched[:limit]
+    
     def export_history(self, export_file, format="json"):
         """导出历史记录
         
@@ -0,0 +1,243 @@
+import atexit
+import json
+import os
+import stat
+import tempfile
+import threading
+import time
+
+def atomic_write(path, data):
+    """原子地写入文件：先写临时文件并fsync，再用os.replace替换目标文件
+
+    写入过程中崩溃时，目标文件要么是旧内容，要么是完整的新内容，不会出现半截的文件。
+
+    Args:
+        path: 目标文件路径
+        data: 要写入的字节串
+    """
+    directory = os.path.dirname(os.path.abspath(path))
+    fd, temp_file = tempfile.mkstemp(prefix="." + os.path.basename(path) + ".", suffix=".tmp", dir=directory)
+    try:
+        with os.fdopen(fd, 'wb') as f:
+            f.write(data)
+            f.flush()
+            os.fsync(f.fileno())
+        # 临时文件默认权限为0600，保留目标文件原有的权限
+        try:
+            os.chmod(temp_file, stat.S_IMODE(os.stat(path).st_mode))
+        except OSError:
+            pass
+        os.replace(temp_file, path)
+    except BaseException:
+        try:
+            os.unlink(temp_file)
+        except OSError:
+            pass
+        raise
+
+
+class _PendingWrite:
+    """等待写入的文件内容"""
+
+    __slots__ = ('data', 'serializer', 'callbacks', 'error_callbacks', 'deadline')
+
+    def __init__(self, data, serializer, deadline):
+        self.data = data
+        self.serializer = serializer
+        self.callbacks = []
+        self.error_callbacks = []
+        self.deadline = deadline
+
+    def add_callbacks(self, callback, error_callback):
+        """登记写入成功和失败时调用的函数（可以为None）"""
+        if callback is not None:
+            self.callbacks.append(callback)
+        if error_callback is not None:
+            self.error_callbacks.append(error_callback)
+
+
+class BackgroundWriter:
+    """后台文件写入器
+
+    所有写入由一个后台线程完成，调用线程（如GUI线程）只把数据放入队列，
+    不等待磁盘I/O。同一文件在合并窗口内的多次写入只写最后一次；每次写入都
+    通过 atomic_write 完成。程序退出前应调用 close() 或 flush() 同步写完。
+    """
+
+    # 进程内共享的实例
+    _shared = None
+    _shared_lock = threading.Lock()
+
+    @classmethod
+    def shared(cls):
+        """获取进程内共享的写入器，解释器退出时自动写完剩余的数据
+
+        Returns:
+            BackgroundWriter 实例
+        """
+        with cls._shared_lock:
+            if cls._shared is None:
+                cls._shared = cls()
+                atexit.register(cls._shared.close)
+            return cls._shared
+
+    def __init__(self, delay=0.2):
+        """初始化写入器
+
+        Args:
+            delay: 合并窗口（秒），同一文件第一次提交后经过该时间才写入
+        """
+        self.delay = delay
+        self._condition = threading.Condition()
+        # 保证文件按提交顺序写入：取出待写数据和写入文件在同一把锁内完成
+        self._io_lock = threading.Lock()
+        self._pending = {}  # 路径 -> 等待写入的内容
+        self._in_flight = {}  # 路径 -> 正在写入的内容
+        self._thread = None
+        self._closed = False
+
+    def submit(self, path, data, serializer, callback=None, error_callback=None):
+        """提交一次写入
+
+        Args:
+            path: 目标文件路径
+            data: 要写入的对象，提交后调用者不应再修改它
+            serializer: 在后台线程中把data转换为字节串的函数
+            callback: 写入成功后在后台线程中调用的函数，可选
+            error_callback: 写入失败后以异常为参数调用的函数，可选
+        """
+        with self._condition:
+            closed = self._closed
+            if not closed:
+                self._enqueue(path, data, serializer, callback, error_callback)
+        if closed:
+            # 已关闭时在调用线程中同步写入
+            entry = _PendingWrite(data, serializer, 0)
+            entry.add_callbacks(callback, error_callback)
+            with self._io_lock:
+                self._write_entry(path, entry)
+
+    def _enqueue(self, path, data, serializer, callback, error_callback=None):
+        """把写入放入等待队列并唤醒后台线程，调用时须持有条件变量"""
+        entry = self._pending.get(path)
+        if entry is None:
+            entry = _PendingWrite(data, serializer, time.monotonic() + self.delay)
+            self._pending[path] = entry
+        else:
+            # 合并：保留原来的截止时间，只替换内容
+            entry.data = data
+            entry.serializer = serializer
+        entry.add_callbacks(callback, error_callback)
+
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._run, name="BackgroundWriter", daemon=True)
+            self._thread.start()
+        self._condition.notify()
+
+    def write_json(self, path, data, indent=2, callback=None, error_callback=None):
+        """提交一次JSON文件写入
+
+        Args:
+            path: 目标文件路径
+            data: 可JSON序列化的对象，提交后调用者不应再修改它
+            indent: JSON缩进
+            callback: 写入成功后调用的函数，可选
+            error_callback: 写入失败后以异常为参数调用的函数，可选
+        """
+        self.submit(
+            path, data,
+            lambda obj: json.dumps(obj, ensure_ascii=False, indent=indent).encode('utf-8'),
+            callback, error_callback
+        )
+
+    def pending(self, path):
+        """获取尚未写入文件的最新内容
+
+        Args:
+            path: 文件路径
+
+        Returns:
+            最近一次提交但尚未写完的对象，没有时返回None
+        """
+        with self._condition:
+            entry = self._pending.get(path) or self._in_flight.get(path)
+            return entry.data if entry is not None else None
+
+    def flush(self, path=None):
+        """在调用线程中同步写入等待中的数据
+
+        Args:
+            path: 只写入该文件；为None时写入全部
+        """
+        with self._io_lock:
+            with self._condition:
+                if path is None:
+                    entries = list(self._pending.items())
+                    self._pending.clear()
+                else:
+                    entry = self._pending.pop(path, None)
+                    entries = [(path, entry)] if entry is not None else []
+            self._write_entries(entries)
+
+    def close(self):
+        """写完全部数据并停止后台线程"""
+        with self._condition:
+            self._closed = True
+            self._condition.notify()
+        self.flush()
+        if self._thread is not None:
+            self._thread.join()
+
+    def _run(self):
+        """后台线程：等到合并窗口结束后写入到期的文件"""
+        while True:
+            with self._condition:
+                while not self._pending and not self._closed:
+                    self._condition.wait()
+                if not self._pending:
+                    return
+                wait = min(entry.deadline for entry in self._pending.values()) - time.monotonic()
+                if wait > 0 and not self._closed:
+                    self._condition.wait(wait)
+                    continue
+
+            with self._io_lock:
+                with self._condition:
+                    now = time.monotonic()
+                    due = [
+                        (path, entry) for path, entry in self._pending.items()
+                        if entry.deadline <= now or self._closed
+                    ]
+                    for path, entry in due:
+                        del self._pending[path]
+                self._write_entries(due)
+
+    def _write_entries(self, entries):
+        """依次写入已从等待队列取出的内容，调用时须持有 _io_lock
+
+        写入期间这些内容记录在 _in_flight 中，pending() 仍能返回它们。
+        """
+        with self._condition:
+            for path, entry in entries:
+                self._in_flight[path] = entry
+        for path, entry in entries:
+            self._write_entry(path, entry)
+        with self._condition:
+            for path, entry in entries:
+                if self._in_flight.get(path) is entry:
+                    del self._in_flight[path]
+
+    def _write_entry(self, path, entry):
+        """序列化并原子地写入一个文件，失败时打印错误并调用失败回调"""
+        try:
+            atomic_write(path, entry.serializer(entry.data))
+        except Exception as e:
+            print(f"写入文件失败: {path}: {e}")
+            callbacks, arguments = entry.error_callbacks, (e,)
+        else:
+            callbacks, arguments = entry.callbacks, ()
+        for callback in callbacks:
+            try:
+                callback(*arguments)
+            except Exception as e:
+                print(f"写入回调失败: {e}")
@@ -4,11 +4,20 @@ import os
 # 添加项目根目录到Python路径，确保可以导入calculator包
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from PyQt6.QtWidgets import QApplication
-from PyQt6.QtCore import QFile, QTextStream
-from PyQt6.QtGui import QIcon
-from calculator.ui.main_window import CalculatorMainWindow
-from calculator.data.config_manager import ConfigManager
+from calculator.startup_profile import StartupProfiler
+
+# 启动计时从这里开始，使用 --profile-startup 启动时打印各阶段耗时
+profiler = StartupProfiler.shared()
+
+with profiler.phase("导入 PyQt6"):
+    from PyQt6.QtWidgets import QApplication
+    from PyQt6.QtCore import QEvent, QFile, QObject, QTextStream
+    from PyQt6.QtGui import QIcon
+with profiler.phase("导入主窗口模块"):
+    from calculator.ui.main_window import CalculatorMainWindow
+with profiler.phase("导入数据模块"):
+    from calculator.data.config_manager import ConfigManager
+    from calculator.data.persistence import BackgroundWriter
 
 def apply_theme(app, theme_name, resources_dir):
     """应用主题样式表
@@ -56,38 +65,64 @@ def set_application_icon(app, resources_dir):
         print(f"设置图标失败: {e}")
         return False
 
+class FirstPaintReporter(QObject):
+    """窗口第一次绘制时记录首帧时间并打印启动耗时分析"""
+    
+    def __init__(self, window):
+        super().__init__(window)
+        self.window = window
+        window.installEventFilter(self)
+    
+    def eventFilter(self, obj, event):
+        if obj is self.window and event.type() == QEvent.Type.Paint:
+            self.window.removeEventFilter(self)
+            profiler.mark("首帧绘制")
+            profiler.report()
+        return False
+
 def main():
     """主程序入口"""
-    # 创建QApplication实例
-    app = QApplication(sys.argv)
+    # --profile-startup 由本程序处理，不传给Qt
+    profile_startup = "--profile-startup" in sys.argv
+    if profile_startup:
+        sys.argv.remove("--profile-startup")
     
+    # 创建QApplication实例
+    with profiler.phase("创建QApplication"):
+        app = QApplication(sys.argv)
     
     # 获取资源文件夹路径（resources文件夹位于calculator目录内）
     calculator_dir = os.path.dirname(os.path.abspath(__file__))
     resources_dir = os.path.join(calculator_dir, 'resources')
     
     # 加载配置
-    config_manager = ConfigManager()
+    with profiler.phase("加载配置"):
+        config_manager = ConfigManager.shared()
     
     # 应用主题
-    theme = config_manager.get_theme()
-    apply_theme(app, theme, resources_dir)
+    with profiler.phase("应用主题样式表"):
+        theme = config_manager.get_theme()
+        apply_theme(app, theme, resources_dir)
     
     # 设置应用程序图标
-    set_application_icon(app, resources_dir)
+    with profiler.phase("设置图标"):
+        set_application_icon(app, resources_dir)
     
     # 创建主窗口实例
-    window = CalculatorMainWindow()
+    with profiler.phase("创建主窗口"):
+        window = CalculatorMainWindow()
     
     # 应用配置
-    font_size = config_manager.get_font_size()
     window_size = config_manager.get_window_size()
     
     # 设置窗口大小
     window.resize(window_size["width"], window_size["height"])
     
     # 显示主窗口
-    window.show()
+    if profile_startup:
+        FirstPaintReporter(window)
+    with profiler.phase("显示窗口"):
+        window.show()
     
     # 定义主题切换处理函数
     def handle_theme_change(theme_name):
@@ -113,7 +148,11 @@ def main():
     window.closeEvent = save_config_on_close
     
     # 运行应用程序主循环
-    sys.exit(app.exec())
+    exit_code = app.exec()
+    
+    # 退出前同步写完后台写入器中尚未写入的配置和历史记录
+    BackgroundWriter.shared().close()
+    sys.exit(exit_code)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
@@ -0,0 +1,10 @@
+"""计算服务模块包"""
+
+from .server import EvaluationServer
+from .client import RPCClient, RPCError
+
+__all__ = [
+    'EvaluationServer',
+    'RPCClient',
+    'RPCError'
+]
@@ -0,0 +1,54 @@
+"""启动计算服务
+
+运行方式：
+    python -m calculator.server [--host HOST] [--port PORT] [--unix PATH] [--workers N]
+"""
+
+import argparse
+import asyncio
+import os
+import sys
+
+# 添加项目根目录到Python路径，确保可以导入calculator包
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from calculator.server.server import EvaluationServer
+
+
+def main(argv=None):
+    """服务主函数"""
+    parser = argparse.ArgumentParser(prog="python -m calculator.server", description="JSON-RPC 计算服务")
+    parser.add_argument("--host", default="127.0.0.1", help="TCP监听地址（默认127.0.0.1）")
+    parser.add_argument("--port", type=int, default=8765, help="TCP监听端口（默认8765）")
+    parser.add_argument("--unix", metavar="PATH", help="改为监听Unix套接字")
+    parser.add_argument("--workers", type=int, default=0, help="进程池工作进程数（默认0，不使用进程池）")
+    parser.add_argument("--offload-threshold", type=int, default=1000,
+                        help="参数字符串长度达到该值时交给进程池（默认1000）")
+    parser.add_argument("--max-pending", type=int, default=64, help="每个连接同时处理的最大请求数（默认64）")
+    args = parser.parse_args(argv)
+
+    server = EvaluationServer(
+        workers=args.workers,
+        offload_threshold=args.offload_threshold,
+        max_pending=args.max_pending
+    )
+
+    async def run():
+        if args.unix:
+            await server.start_unix(args.unix)
+            print(f"计算服务已启动: unix:{args.unix}")
+        else:
+            listener = await server.start_tcp(args.host, args.port)
+            host, port = listener.sockets[0].getsockname()[:2]
+            print(f"计算服务已启动: {host}:{port}")
+        await server.serve_forever()
+
+    try:
+        asyncio.run(run())
+    except KeyboardInterrupt:
+        pass
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,133 @@
+"""计算服务的asyncio客户端
+
+同一连接上的请求以流水线方式发送，后台任务读取响应并按 id 交给等待的调用者。
+"""
+
+import asyncio
+import itertools
+import json
+
+
+class RPCError(ValueError):
+    """服务端返回的错误
+
+    Attributes:
+        code: JSON-RPC 错误码
+    """
+
+    def __init__(self, code, message):
+        super().__init__(message)
+        self.code = code
+
+
+class RPCClient:
+    """JSON-RPC 计算服务客户端"""
+
+    def __init__(self, reader, writer):
+        self._reader = reader
+        self._writer = writer
+        self._ids = itertools.count(1)
+        self._waiters = {}  # 请求id -> Future
+        self._read_task = asyncio.create_task(self._read_responses())
+
+    @classmethod
+    async def connect(cls, host="127.0.0.1", port=8765, path=None):
+        """连接服务
+
+        Args:
+            host: TCP主机
+            port: TCP端口
+            path: Unix套接字路径，指定时忽略host和port
+
+        Returns:
+            RPCClient 对象
+        """
+        if path is not None:
+            reader, writer = await asyncio.open_unix_connection(path, limit=1 << 20)
+        else:
+            reader, writer = await asyncio.open_connection(host, port, limit=1 << 20)
+        return cls(reader, writer)
+
+    async def call(self, method, *params):
+        """调用一个方法
+
+        Args:
+            method: 方法名，如 "evaluate_expression"
+            *params: 位置参数
+
+        Returns:
+            调用结果
+
+        Raises:
+            RPCError: 服务端返回错误
+        """
+        request, future = self._new_request(method, params)
+        await self._send(request)
+        return await future
+
+    async def batch(self, calls):
+        """以一个批量请求调用多个方法
+
+        Args:
+            calls: (方法名, 参数列表) 的可迭代对象
+
+        Returns:
+            结果列表，顺序与calls一致；出错的调用对应位置为 RPCError 对象
+        """
+        requests = []
+        futures = []
+        for method, params in calls:
+            request, future = self._new_request(method, params)
+            requests.append(request)
+            futures.append(future)
+        await self._send(requests)
+        return await asyncio.gather(*futures, return_exceptions=True)
+
+    async def close(self):
+        """关闭连接"""
+        self._writer.close()
+        try:
+            await self._writer.wait_closed()
+        except ConnectionError:
+            pass
+        self._read_task.cancel()
+        try:
+            await self._read_task
+        except asyncio.CancelledError:
+            pass
+
+    def _new_request(self, method, params):
+        """创建请求对象和等待响应的Future"""
+        request_id = next(self._ids)
+        future = asyncio.get_running_loop().create_future()
+        self._waiters[request_id] = future
+        return {'jsonrpc': '2.0', 'id': request_id, 'method': method, 'params': list(params)}, future
+
+    async def _send(self, message):
+        """发送一行请求"""
+        self._writer.write(json.dumps(message, ensure_ascii=False).encode('utf-8') + b"\n")
+        await self._writer.drain()
+
+    async def _read_responses(self):
+        """后台任务：读取响应并唤醒对应的调用者"""
+        try:
+            while True:
+                line = await self._reader.readline()
+                if not line:
+                    break
+                message = json.loads(line)
+                for response in message if isinstance(message, list) else [message]:
+                    future = self._waiters.pop(response.get('id'), None)
+                    if future is None or future.done():
+                        continue
+                    if 'error' in response:
+                        error = response['error']
+                        future.set_exception(RPCError(error.get('code'), error.get('message')))
+                    else:
+                        future.set_result(response.get('result'))
+        finally:
+            # 连接断开时让仍在等待的调用者失败
+            for future in self._waiters.values():
+                if not future.done():
+                    future.set_exception(ConnectionError("连接已关闭"))
+            self._waiters.clear()
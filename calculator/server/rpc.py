@@ -0,0 +1,76 @@
+"""JSON-RPC 协议辅助函数与可调用方法表
+
+服务端只开放下列计算方法，方法名为 "类名.方法名"：
+    ArithmeticCalculator.evaluate_expression（也可简写为 evaluate_expression）
+    ScientificCalculator 的全部公开方法，如 ScientificCalculator.sin
+    UnitConverter.convert_*，如 UnitConverter.convert_length
+    BaseConverter.convert
+"""
+
+from calculator.core.arithmetic import ArithmeticCalculator
+from calculator.core.base_converter import BaseConverter
+from calculator.core.scientific import ScientificCalculator
+from calculator.core.unit_converter import UnitConverter
+
+# JSON-RPC 2.0 错误码
+PARSE_ERROR = -32700
+INVALID_REQUEST = -32600
+METHOD_NOT_FOUND = -32601
+INVALID_PARAMS = -32602
+INTERNAL_ERROR = -32603
+# 计算器自身抛出的 ValueError（如除数为零）
+CALCULATION_ERROR = -32000
+
+
+# 返回值不能序列化为JSON的方法，不对外开放
+_EXCLUDED_METHODS = {'decimal_context'}
+
+
+def _build_methods():
+    """构建方法名到函数的映射"""
+    methods = {
+        'evaluate_expression': ArithmeticCalculator.evaluate_expression,
+        'ArithmeticCalculator.evaluate_expression': ArithmeticCalculator.evaluate_expression,
+        'BaseConverter.convert': BaseConverter.convert
+    }
+    for name in dir(ScientificCalculator):
+        if not name.startswith('_') and name not in _EXCLUDED_METHODS:
+            methods[f'ScientificCalculator.{name}'] = getattr(ScientificCalculator, name)
+    for name in dir(UnitConverter):
+        if name.startswith('convert_'):
+            methods[f'UnitConverter.{name}'] = getattr(UnitConverter, name)
+    return methods
+
+
+METHODS = _build_methods()
+
+
+def call_method(name, params):
+    """调用已开放的方法；也作为进程池中执行的任务
+
+    Args:
+        name: 方法名
+        params: 位置参数列表或关键字参数字典
+
+    Returns:
+        方法的返回值
+
+    Raises:
+        KeyError: 方法不存在
+        TypeError: 参数不匹配
+        ValueError: 计算错误
+    """
+    function = METHODS[name]
+    if isinstance(params, dict):
+        return function(**params)
+    return function(*params)
+
+
+def error_response(request_id, code, message):
+    """构造错误响应"""
+    return {'jsonrpc': '2.0', 'id': request_id, 'error': {'code': code, 'message': message}}
+
+
+def result_response(request_id, result):
+    """构造成功响应"""
+    return {'jsonrpc': '2.0', 'id': request_id, 'result': result}
@@ -0,0 +1,226 @@
+"""基于asyncio的计算服务
+
+协议为按行分隔的 JSON-RPC 2.0：每行一个请求对象，或一个请求数组（批量请求），
+服务端对每行返回一行响应。同一连接上可以连续发送多个请求（流水线），
+响应可能乱序返回，客户端按 id 对应。
+
+背压：每个连接最多同时处理 max_pending 个请求，达到上限后暂停读取该连接；
+写响应时等待发送缓冲区排空，读取慢的客户端会使服务端暂停处理它的请求。
+
+进程池：workers 大于0时，参数中含有长度不小于 offload_threshold 的字符串的调用
+（如很长的表达式或数字串）交给进程池执行，避免阻塞事件循环。
+"""
+
+import asyncio
+import json
+
+from .rpc import (
+    CALCULATION_ERROR, INTERNAL_ERROR, INVALID_PARAMS, INVALID_REQUEST, METHOD_NOT_FOUND,
+    METHODS, PARSE_ERROR, call_method, error_response, result_response
+)
+
+
+class EvaluationServer:
+    """JSON-RPC 计算服务"""
+
+    def __init__(self, workers=0, offload_threshold=1000, max_pending=64, max_line_size=1 << 20):
+        """初始化服务
+
+        Args:
+            workers: 进程池的工作进程数，0表示所有调用都在事件循环中执行
+            offload_threshold: 参数中字符串长度达到该值时交给进程池执行
+            max_pending: 每个连接同时处理的最大请求数
+            max_line_size: 单行请求的最大字节数
+        """
+        self.workers = workers
+        self.offload_threshold = offload_threshold
+        self.max_pending = max_pending
+        self.max_line_size = max_line_size
+        self._pool = None
+        self._server = None
+        # 活动连接: 处理任务 -> StreamWriter
+        self._connections = {}
+
+    async def start_tcp(self, host="127.0.0.1", port=8765):
+        """在TCP端口上开始监听
+
+        Returns:
+            asyncio.Server 对象，port为0时可从其sockets获取实际端口
+        """
+        self._start_pool()
+        self._server = await asyncio.start_server(
+            self._handle_connection, host, port, limit=self.max_line_size
+        )
+        return self._server
+
+    async def start_unix(self, path):
+        """在Unix套接字上开始监听
+
+        Returns:
+            asyncio.Server 对象
+        """
+        self._start_pool()
+        self._server = await asyncio.start_unix_server(
+            self._handle_connection, path, limit=self.max_line_size
+        )
+        return self._server
+
+    async def serve_forever(self):
+        """持续处理连接，直到被取消"""
+        try:
+            await self._server.serve_forever()
+        finally:
+            await self.close()
+
+    async def close(self):
+        """停止监听，关闭所有连接并等待其处理任务结束，然后关闭进程池"""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+            self._server = None
+        connections = list(self._connections.items())
+        for _, writer in connections:
+            writer.close()
+        if connections:
+            await asyncio.gather(*(task for task, _ in connections), return_exceptions=True)
+        if self._pool is not None:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+            self._pool = None
+
+    def _start_pool(self):
+        """按需创建进程池"""
+        if self.workers > 0 and self._pool is None:
+            from concurrent.futures import ProcessPoolExecutor
+            self._pool = ProcessPoolExecutor(max_workers=self.workers)
+
+    async def _handle_connection(self, reader, writer):
+        """处理一个连接：读取请求行并并发处理，数量受 max_pending 限制"""
+        pending = asyncio.Semaphore(self.max_pending)
+        write_lock = asyncio.Lock()
+        tasks = set()
+        current = asyncio.current_task()
+        self._connections[current] = writer
+        try:
+            while True:
+                # 达到并发上限时在这里等待，不再读取新的请求
+                await pending.acquire()
+                try:
+                    line = await reader.readline()
+                except (ValueError, asyncio.LimitOverrunError):
+                    pending.release()
+                    await self._send(writer, write_lock, error_response(None, INVALID_REQUEST, "请求过长"))
+                    break
+                except ConnectionError:
+                    pending.release()
+                    break
+                if not line:
+                    pending.release()
+                    break
+                task = asyncio.create_task(self._process_line(line, writer, write_lock, pending))
+                tasks.add(task)
+                task.add_done_callback(tasks.discard)
+            if tasks:
+                await asyncio.gather(*tasks, return_exceptions=True)
+        finally:
+            self._connections.pop(current, None)
+            writer.close()
+            try:
+                await writer.wait_closed()
+            except ConnectionError:
+                pass
+
+    async def _process_line(self, line, writer, write_lock, pending):
+        """处理一行请求并写回响应"""
+        try:
+            response = await self.handle_message(line)
+            if response is not None:
+                await self._send(writer, write_lock, response)
+        except ConnectionError:
+            pass
+        finally:
+            pending.release()
+
+    async def _send(self, writer, write_lock, response):
+        """写一行响应，并等待发送缓冲区排空（背压）
+
+        Args:
+            response: 响应的JSON文本（见 handle_message）
+        """
+        data = response.encode('utf-8') + b"\n"
+        async with write_lock:
+            writer.write(data)
+            await writer.drain()
+
+    async def handle_message(self, data):
+        """处理一条消息（单个请求或批量请求）
+
+        Args:
+            data: 一行JSON文本（bytes或str）
+
+        Returns:
+            响应对象或响应数组的JSON文本，或None（全部为通知时不需要响应）
+        """
+        if not data.strip():
+            return None
+        try:
+            message = json.loads(data)
+        except ValueError:
+            return _encode(error_response(None, PARSE_ERROR, "JSON解析错误"))
+
+        if isinstance(message, list):
+            if not message:
+                return _encode(error_response(None, INVALID_REQUEST, "批量请求不能为空"))
+            responses = await asyncio.gather(*(self._handle_request(request) for request in message))
+            responses = [response for response in responses if response is not None]
+            return "[" + ", ".join(responses) + "]" if responses else None
+        return await self._handle_request(message)
+
+    async def _handle_request(self, request):
+        """处理单个请求并编码为JSON文本，没有id的请求视为通知，不返回响应"""
+        if not isinstance(request, dict) or not isinstance(request.get('method'), str):
+            return _encode(error_response(None, INVALID_REQUEST, "无效的请求"))
+        request_id = request.get('id')
+        is_notification = 'id' not in request
+        method = request['method']
+        params = request.get('params', [])
+
+        if not isinstance(params, (list, dict)):
+            response = error_response(request_id, INVALID_PARAMS, "参数必须是数组或对象")
+        elif method not in METHODS:
+            response = error_response(request_id, METHOD_NOT_FOUND, f"方法不存在: {method}")
+        else:
+            try:
+                response = result_response(request_id, await self._call(method, params))
+            except TypeError as e:
+                response = error_response(request_id, INVALID_PARAMS, f"参数错误: {e}")
+            except ValueError as e:
+                response = error_response(request_id, CALCULATION_ERROR, str(e))
+            except Exception as e:
+                response = error_response(request_id, INTERNAL_ERROR, f"内部错误: {e}")
+        return None if is_notification else _encode(response)
+
+    async def _call(self, method, params):
+        """执行调用，参数较大时交给进程池"""
+        if self._pool is not None and self._is_heavy(params):
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._pool, call_method, method, params)
+        return call_method(method, params)
+
+    def _is_heavy(self, params):
+        """参数中是否有长度达到阈值的字符串"""
+        values = params.values() if isinstance(params, dict) else params
+        return any(isinstance(value, str) and len(value) >= self.offload_threshold for value in values)
+
+
+def _encode(response):
+    """把响应编码为一行JSON文本
+
+    结果无法编码时（如超过 str() 4300 位限制的整数、NaN 和无穷大，
+    标准JSON不能表示后两者）改为返回同一个id的内部错误，客户端不会一直等待。
+    """
+    try:
+        return json.dumps(response, ensure_ascii=False, allow_nan=False)
+    except (ValueError, TypeError) as e:
+        return json.dumps(
+            error_response(response.get('id'), INTERNAL_ERROR, f"结果无法编码为JSON: {e}"), ensure_ascii=False
+        )
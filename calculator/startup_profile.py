@@ -0,0 +1,75 @@
+"""启动耗时分析
+
+记录启动过程中各阶段（导入模块、创建应用、加载配置、创建窗口、首帧绘制等）
+的耗时，以及每个阶段新导入的模块数量。计时一直进行，开销只有几次
+perf_counter 调用和 sys.modules 的比较；只有使用 --profile-startup 启动时
+才打印报告。
+
+需要逐个模块的导入耗时时，可以配合解释器自带的选项：
+    python -X importtime -m calculator.main
+"""
+
+import sys
+import time
+from contextlib import contextmanager
+
+
+class StartupProfiler:
+    """启动阶段计时器，阶段可以嵌套"""
+
+    _shared = None
+
+    @classmethod
+    def shared(cls):
+        """获取进程内共享的计时器，第一次调用的时间视为启动起点"""
+        if cls._shared is None:
+            cls._shared = cls()
+        return cls._shared
+
+    def __init__(self):
+        self.start = time.perf_counter()
+        # (阶段名, 嵌套深度, 耗时, 新导入的模块数)，按阶段开始的顺序排列
+        self.phases = []
+        self._depth = 0
+
+    @contextmanager
+    def phase(self, name):
+        """记录一个阶段的耗时
+
+        Args:
+            name: 阶段名称
+        """
+        index = len(self.phases)
+        self.phases.append((name, self._depth, 0.0, 0))
+        modules_before = len(sys.modules)
+        self._depth += 1
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = time.perf_counter() - start
+            self._depth -= 1
+            self.phases[index] = (name, self._depth, elapsed, len(sys.modules) - modules_before)
+
+    def mark(self, name):
+        """记录从启动起点到现在的时间点，如首帧绘制完成"""
+        self.phases.append((name, 0, time.perf_counter() - self.start, None))
+
+    def report(self, stream=None):
+        """打印各阶段的耗时
+
+        Args:
+            stream: 输出流，默认为标准错误
+        """
+        stream = stream if stream is not None else sys.stderr
+        print("启动耗时分析:", file=stream)
+        for name, depth, elapsed, modules in self.phases:
+            indent = "  " * depth
+            if modules is None:
+                # 时间点：从启动起点算起
+                print(f"  @{elapsed * 1e3:7.1f} ms  {indent}{name}", file=stream)
+            else:
+                imported = f"（导入模块 {modules} 个）" if modules else ""
+                print(f"  {elapsed * 1e3:8.1f} ms  {indent}{name}{imported}", file=stream)
+        print(f"  已加载模块总数: {len(sys.modules)}", file=stream)
+        stream.flush()
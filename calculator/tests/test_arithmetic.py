@@ -0,0 +1,48 @@
+import sys
+import os
+
+# 添加包含calculator包的项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from calculator.core.arithmetic import ArithmeticCalculator
+from calculator.core.expression_cache import ExpressionCache
+
+
+def test_evaluate_expression():
+    """测试带括号表达式的计算"""
+    assert ArithmeticCalculator.evaluate_expression("1+2*3") == 7
+    assert ArithmeticCalculator.evaluate_expression("(1+2)*3") == 9
+    assert ArithmeticCalculator.evaluate_expression("-3/2") == -1.5
+    for expression in ["1/0", "", "(1", "2**3", "a+1"]:
+        try:
+            ArithmeticCalculator.evaluate_expression(expression)
+        except ValueError:
+            continue
+        raise AssertionError(f"表达式应当报错: {expression}")
+
+
+def test_expression_cache_hits():
+    """测试重复表达式命中缓存"""
+    ArithmeticCalculator.clear_expression_cache()
+    ArithmeticCalculator.evaluate_expression("2*(3+4)")
+    ArithmeticCalculator.evaluate_expression("2*(3+4)")
+    info = ArithmeticCalculator.expression_cache_info()
+    assert info["hits"] == 1 and info["misses"] == 1
+    # 运行期错误（除零）在每次执行时都要报告
+    for _ in range(2):
+        try:
+            ArithmeticCalculator.evaluate_expression("1/(2-2)")
+            raise AssertionError("除零应当报错")
+        except ValueError as e:
+            assert "除数不能为零" in str(e)
+
+
+def test_expression_cache_eviction():
+    """测试LRU淘汰"""
+    cache = ExpressionCache(maxsize=2)
+    cache.get_or_compile("a", str.upper)
+    cache.get_or_compile("b", str.upper)
+    cache.get_or_compile("a", str.upper)
+    cache.get_or_compile("c", str.upper)
+    assert "a" in cache and "b" not in cache
+    assert cache.info()["evictions"] == 1
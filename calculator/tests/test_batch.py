@@ -0,0 +1,31 @@
+import sys
+import os
+import io
+
+# 添加包含calculator包的项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from calculator.core.batch import evaluate_stream, read_csv_column, read_lines
+
+
+def test_stream_with_errors():
+    """测试逐行计算，出错的行不中断批次"""
+    stream = io.StringIO("1+1\n\n2/0\n(3+4)*2\n")
+    results = list(evaluate_stream(read_lines(stream)))
+    assert [(r.line, r.value) for r in results] == [(1, 2), (3, None), (4, 14)]
+    assert results[1].error == "除数不能为零"
+
+
+def test_csv_column():
+    """测试从CSV的指定列读取表达式"""
+    stream = io.StringIO("id,expr\n1,1+2\n2,\n3,2*5\n")
+    assert list(read_csv_column(stream, "expr")) == [(2, "1+2"), (4, "2*5")]
+    stream = io.StringIO("1,1+2\n2,3*3\n")
+    assert list(read_csv_column(stream, 1, has_header=False)) == [(1, "1+2"), (2, "3*3")]
+
+
+def test_process_pool_keeps_order():
+    """测试多进程计算时结果保持输入顺序"""
+    items = [(i, f"{i}*2") for i in range(1, 501)]
+    results = list(evaluate_stream(items, workers=2, chunk_size=7))
+    assert [r.value for r in results] == [i * 2 for i in range(1, 501)]
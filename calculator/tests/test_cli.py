@@ -0,0 +1,78 @@
+import sys
+import os
+import io
+import subprocess
+
+import pytest
+
+# 添加包含calculator包的项目根目录到Python路径
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+sys.path.append(PROJECT_ROOT)
+
+from calculator.cli import main, run_repl, _HistoryRecorder
+
+
+def test_expression_mode(capsys):
+    """测试 -e 模式输出结果，出错时返回非零退出码"""
+    assert main(["-e", "1+2*3", "-e", "7/2"]) == 0
+    assert capsys.readouterr().out == "7\n3.5\n"
+    assert main(["-e", "1/0"]) == 1
+    assert "除数不能为零" in capsys.readouterr().err
+
+
+def test_exact_mode(capsys):
+    """测试精确模式按精度显示小数或显示分数"""
+    assert main(["--exact", "--precision", "4", "-e", "0.1+0.2", "-e", "2/3"]) == 0
+    assert capsys.readouterr().out == "0.3\n0.6667\n"
+    assert main(["--exact", "--fraction", "-e", "0.1+0.2", "-e", "2/3"]) == 0
+    assert capsys.readouterr().out == "3/10\n2/3\n"
+
+
+def test_repl_from_pipe():
+    """测试从非终端输入逐行计算"""
+    stdin = io.StringIO("1+1\n\n2×(3+4)\n:history\n")
+    out = io.StringIO()
+    assert run_repl(_HistoryRecorder(False), stdin=stdin, out=out) == 0
+    assert out.getvalue() == "2\n14\n1+1 = 2\n2×(3+4) = 14\n"
+
+
+def test_cli_does_not_import_qt():
+    """测试命令行模式不导入PyQt6和NumPy"""
+    code = (
+        "import sys; from calculator.cli import main; main(['-e', '1+1']); "
+        "assert not any(m.startswith(('PyQt6', 'numpy')) for m in sys.modules)"
+    )
+    result = subprocess.run([sys.executable, "-c", code], cwd=PROJECT_ROOT, capture_output=True, text=True)
+    assert result.returncode == 0, result.stderr
+    assert result.stdout == "2\n"
+
+
+def test_convert_subcommand(tmp_path, capsys):
+    """测试 convert 子命令流式转换文件，忽略换行并报告无效数字"""
+    source = tmp_path / "dump.hex"
+    source.write_text("00ff\n10a\n")
+    assert main(["convert", "--from", "16", "--to", "2", str(source), "--chunk-digits", "2"]) == 0
+    assert capsys.readouterr().out == "11111111000100001010\n"
+
+    target = tmp_path / "dump.oct"
+    assert main(["convert", "--from", "16", "--to", "8", str(source), "-o", str(target), "--preserve-width"]) == 0
+    assert target.read_text() == "0003770412\n"
+
+    source.write_text("12g4")
+    assert main(["convert", "--from", "16", "--to", "2", str(source)]) == 1
+    assert "第3位" in capsys.readouterr().err
+
+
+def test_rejects_ignored_option_combinations(capsys):
+    """测试会被忽略的选项组合直接报错，而不是静默忽略"""
+    for argv in (["--fraction", "-e", "1/3"],
+                 ["--decimal", "--fraction", "-e", "1/3"],
+                 ["--save-history", "--batch", "-"],
+                 ["--precision", "50", "-e", "1/3"],
+                 ["--exact", "--fraction", "--precision", "4", "-e", "1/3"]):
+        with pytest.raises(SystemExit) as error:
+            main(argv)
+        assert error.value.code == 2
+    err = capsys.readouterr().err
+    assert "--fraction" in err
+    assert "--precision 只能与 --exact 或 --decimal 一起使用" in err
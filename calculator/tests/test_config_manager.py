@@ -0,0 +1,94 @@
+import sys
+import os
+import json
+
+# 添加包含calculator包的项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from calculator.data.config_manager import ConfigManager
+
+
+def test_cached_reads_and_external_change(tmp_path, monkeypatch):
+    """测试读取使用缓存，文件被外部修改后重新加载"""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    manager = ConfigManager(reload_interval=0)
+    assert manager.get_theme() == "light"
+
+    config = manager.load_config()
+    config["theme"] = "dark"
+    config["font_size"] = 20
+    with open(manager.config_file, 'w', encoding='utf-8') as f:
+        json.dump(config, f)
+    assert manager.get_theme() == "dark"
+    assert manager.get_font_size() == 20
+
+
+def test_batch_writes_once(tmp_path, monkeypatch):
+    """测试批量修改只在退出时写入一次文件"""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    manager = ConfigManager()
+    writes = []
+    original_write = manager._write_config
+    monkeypatch.setattr(manager, "_write_config", lambda config: writes.append(1) or original_write(config))
+
+    with manager.batch():
+        manager.set_theme("dark")
+        manager.set_window_size(800, 600)
+        assert manager.get_theme() == "dark"
+        assert writes == []
+    assert writes == [1]
+
+    manager.writer.flush()
+    with open(manager.config_file, encoding='utf-8') as f:
+        saved = json.load(f)
+    assert saved["theme"] == "dark"
+    assert saved["window_size"] == {"width": 800, "height": 600}
+
+
+def test_shared_instance(tmp_path, monkeypatch):
+    """测试同一配置文件共享同一个实例"""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    manager = ConfigManager.shared("shared_test_config.json")
+    assert ConfigManager.shared("shared_test_config.json") is manager
+    assert ConfigManager.shared() is not manager
+
+
+def test_returned_values_do_not_alias_cache(tmp_path, monkeypatch):
+    """测试修改返回的字典或列表不会改动缓存和默认配置"""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    manager = ConfigManager(reload_interval=60)
+    manager.get_config_value("recent_tabs").append("科学")
+    manager.get_config_value("window_size")["width"] = 1
+    assert manager.get_config_value("recent_tabs") == []
+    assert manager.get_window_size() == {"width": 450, "height": 600}
+    assert manager.default_config["recent_tabs"] == []
+
+    tabs = ["标准"]
+    manager.set_config_value("recent_tabs", tabs)
+    tabs.append("科学")
+    assert manager.get_config_value("recent_tabs") == ["标准"]
+
+
+def test_failed_write_clears_dirty(tmp_path, monkeypatch):
+    """测试写入失败后恢复按文件变化重新加载，而不是一直认为有写入在进行"""
+    monkeypatch.setenv("HOME", str(tmp_path))
+    manager = ConfigManager(reload_interval=0)
+    manager.writer.flush()
+
+    def fail(path, data):
+        raise OSError("磁盘已满")
+
+    monkeypatch.setattr("calculator.data.persistence.atomic_write", fail)
+    manager.set_theme("dark")
+    manager.writer.flush(manager.config_file)
+    assert not manager._dirty
+    assert manager.get_theme() == "dark"
+
+    monkeypatch.undo()
+    monkeypatch.setenv("HOME", str(tmp_path))
+    config = manager.load_config()
+    config["theme"] = "light"
+    config["font_size"] = 22
+    with open(manager.config_file, 'w', encoding='utf-8') as f:
+        json.dump(config, f)
+    assert manager.get_font_size() == 22
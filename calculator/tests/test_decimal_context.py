@@ -0,0 +1,98 @@
+import sys
+import os
+import math
+import decimal
+from concurrent.futures import ThreadPoolExecutor
+from decimal import Decimal
+
+import pytest
+
+# 添加包含calculator包的项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from calculator.core.arithmetic import ArithmeticCalculator
+from calculator.core.decimal_context import DecimalContext, format_decimal
+from calculator.core.scientific import ScientificCalculator
+
+PI_60 = Decimal("3.14159265358979323846264338327950288419716939937510582097494")
+
+
+def test_evaluate_decimal():
+    """测试十进制表达式按精度计算，且不修改调用者的上下文"""
+    prec = decimal.getcontext().prec
+    assert ArithmeticCalculator.evaluate_decimal("0.1+0.2") == Decimal("0.3")
+    assert ArithmeticCalculator.evaluate_decimal("1/3", precision=40) == Decimal("0." + "3" * 40)
+    assert decimal.getcontext().prec == prec
+    with pytest.raises(ValueError):
+        ArithmeticCalculator.evaluate_decimal("1/(1-1)")
+
+
+def test_scientific_functions():
+    """测试级数实现的函数与 math 一致，π 的各位数字正确"""
+    context = ScientificCalculator.decimal_context(50)
+    assert context.pi() == decimal.Context(prec=50).plus(PI_60)
+    for name in ("sin", "cos", "tan", "atan", "exp"):
+        for x in (0.5, -2.5, 10, 300):
+            assert float(getattr(context, name)(x)) == pytest.approx(getattr(math, name)(x), rel=1e-12)
+    for x in (-1, -0.5, 0.3, 1):
+        assert float(context.asin(x)) == pytest.approx(math.asin(x), abs=1e-15)
+        assert float(context.acos(x)) == pytest.approx(math.acos(x), abs=1e-15)
+    assert context.sin(30, radians=False) == Decimal("0.5")
+    assert context.cube_root(-8) == -2
+    assert context.log(8, 2) == 3
+    with pytest.raises(ValueError):
+        context.tan(90, radians=False)
+
+
+def test_series_match_higher_precision():
+    """测试大参数的约简：50位的结果与80位的结果在前50位一致"""
+    low, high = DecimalContext(50), DecimalContext(80)
+    for x in ("0.7", "1e3", "123456.789"):
+        assert low.sin(Decimal(x)) == low.round(high.sin(Decimal(x)))
+        assert low.cos(Decimal(x)) == low.round(high.cos(Decimal(x)))
+
+
+def test_inverse_functions_full_precision():
+    """测试 asin、acos 在端点和一般值处都达到超过28位的要求精度"""
+    context = DecimalContext(50)
+    half_pi = decimal.Context(prec=50).divide(PI_60, 2)
+    assert context.asin(1) == half_pi
+    assert context.asin(-1) == half_pi.copy_negate()
+    assert context.acos(-1) == context.pi()
+    assert context.acos(0) == half_pi
+    high = DecimalContext(80)
+    for x in ("0.5", "-0.3", "0.99"):
+        assert context.asin(Decimal(x)) == context.round(high.asin(Decimal(x)))
+        assert context.acos(Decimal(x)) == context.round(high.acos(Decimal(x)))
+
+
+def test_power_errors():
+    """测试零的负数次幂和非有限结果报错，而不是返回 Infinity"""
+    context = DecimalContext(50)
+    assert context.power(2, -1) == Decimal("0.5")
+    for exponent in (-1, -2.5):
+        with pytest.raises(ValueError, match="零不能做负数次幂运算"):
+            context.power(0, exponent)
+    with pytest.raises(ValueError, match="负数不能做非整数次幂运算"):
+        context.power(-2, 0.5)
+    with pytest.raises(ValueError, match="计算结果溢出"):
+        context.power("Infinity", 2)
+
+
+def test_thread_contexts_are_independent():
+    """测试不同线程、不同精度并行计算互不影响"""
+    def run(precision):
+        return DecimalContext(precision).evaluate("1/7")
+
+    with ThreadPoolExecutor(max_workers=4) as executor:
+        results = list(executor.map(run, [10, 20, 30, 40] * 5))
+    for precision, result in zip([10, 20, 30, 40] * 5, results):
+        assert len(result.as_tuple().digits) == precision
+
+
+def test_format_decimal():
+    """测试去掉末尾的0，不按默认精度舍入"""
+    assert format_decimal(Decimal("2.500")) == "2.5"
+    assert format_decimal(Decimal("1E+3")) == "1000"
+    assert format_decimal(Decimal("0.000")) == "0"
+    assert format_decimal(Decimal("0." + "3" * 40)) == "0." + "3" * 40
@@ -0,0 +1,41 @@
+import sys
+import os
+from fractions import Fraction
+
+import pytest
+
+# 添加包含calculator包的项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from calculator.core.arithmetic import ArithmeticCalculator
+from calculator.core.exact import format_fraction
+from calculator.core.incremental import IncrementalEvaluator
+
+
+def test_evaluate_exact():
+    """测试精确模式没有浮点误差，整数除法得到分数"""
+    assert ArithmeticCalculator.evaluate_exact("0.1+0.2") == Fraction(3, 10)
+    assert ArithmeticCalculator.evaluate_exact("1÷3×3") == 1
+    assert ArithmeticCalculator.evaluate_exact("2(1÷3", auto_close=True) == Fraction(2, 3)
+    assert ArithmeticCalculator.evaluate_expression("0.1+0.2") == 0.1 + 0.2
+    with pytest.raises(ValueError):
+        ArithmeticCalculator.evaluate_exact("1/(2-2)")
+
+
+def test_incremental_exact():
+    """测试增量求值器使用精确数值类型"""
+    evaluator = IncrementalEvaluator(Fraction)
+    assert evaluator.update("1/3") == Fraction(1, 3)
+    assert evaluator.update("1/3+0.1") == Fraction(13, 30)
+
+
+def test_format_fraction():
+    """测试分数显示和按精度舍入"""
+    assert format_fraction(Fraction(3, 10)) == "3/10"
+    assert format_fraction(Fraction(4, 2)) == "2"
+    assert format_fraction(Fraction(1, 3), 10) == "0.3333333333"
+    assert format_fraction(Fraction(2, 3), 4) == "0.6667"
+    assert format_fraction(Fraction(-1, 8), 2) == "-0.12"
+    assert format_fraction(Fraction(5, 2), 3) == "2.5"
+    assert format_fraction(Fraction(-1, 1000), 2) == "0"
+    assert format_fraction(Fraction(199, 100), 1) == "2"
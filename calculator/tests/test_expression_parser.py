@@ -0,0 +1,100 @@
+import sys
+import os
+
+# 添加包含calculator包的项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from calculator.core.arithmetic import ArithmeticCalculator
+from calculator.core.expression_parser import NAME, NUMBER, ExpressionSyntaxError, compile_expression, tokenize
+
+
+def test_display_operators_and_implicit_multiplication():
+    """测试×、÷和隐式乘法"""
+    evaluate = ArithmeticCalculator.evaluate_expression
+    assert evaluate("6×7") == 42
+    assert evaluate("7÷2") == 3.5
+    assert evaluate("2(3+4)") == 14
+    assert evaluate("(1+2)(3+4)") == 21
+    assert evaluate("(1+2)3") == 9
+    assert evaluate("2*-3") == -6
+    assert evaluate("-2*3+1") == -5
+
+
+def test_auto_close_brackets():
+    """测试自动补全未闭合的括号"""
+    assert ArithmeticCalculator.evaluate_expression("2×(3+4", auto_close=True) == 14
+    try:
+        ArithmeticCalculator.evaluate_expression("2×(3+4")
+        raise AssertionError("未闭合的括号应当报错")
+    except ExpressionSyntaxError as e:
+        assert e.position == 2
+
+
+def test_error_position():
+    """测试语法错误位置"""
+    cases = {
+        "1+a": 2,
+        "1 2": 2,
+        "1+": 2,
+        "1..2": 2,
+        "(1+2))": 5,
+        "*3": 0
+    }
+    for expression, position in cases.items():
+        try:
+            compile_expression(expression)
+        except ExpressionSyntaxError as e:
+            assert e.position == position, (expression, e.position)
+        else:
+            raise AssertionError(f"表达式应当报错: {expression}")
+
+
+def test_tokenize_matches_compile_expression():
+    """测试分词器与编译器对数字、变量名和词法错误的处理一致"""
+    tokens = list(tokenize("12×(x1-.5)", names=True))
+    assert tokens[0] == (NUMBER, 12, 0)
+    assert tokens[3] == (NAME, "x1", 4)
+    assert tokens[5] == (NUMBER, 0.5, 7)
+    assert compile_expression("12×(x1-.5)", variables=["x1"]).run([2.5]) == 24
+
+    for expression in ("1+a", "1..2", "2$3", "3+1.2.3", "1+2a"):
+        for names in (False, True):
+            try:
+                list(tokenize(expression, names=names))
+            except ExpressionSyntaxError as e:
+                expected = (e.reason, e.position)
+            else:
+                expected = None
+            try:
+                compile_expression(expression, variables=["a"] if names else None)
+            except ExpressionSyntaxError as e:
+                actual = (e.reason, e.position)
+            else:
+                actual = None
+            assert actual == expected, (expression, names, actual, expected)
+
+
+def test_deep_nesting():
+    """测试深层嵌套不受递归深度限制"""
+    depth = sys.getrecursionlimit() * 5
+    expression = "(" * depth + "1+2" + ")" * depth
+    assert ArithmeticCalculator.evaluate_expression(expression) == 3
+    assert ArithmeticCalculator.evaluate_expression("-" * depth + "3") == (3 if depth % 2 == 0 else -3)
+
+
+def test_incremental_evaluator_matches_full_evaluation():
+    """测试增量求值与完整求值结果一致"""
+    from calculator.core.incremental import IncrementalEvaluator
+    evaluator = IncrementalEvaluator()
+    edits = ["1", "12", "12+", "12+3", "12+3×", "12+3×(4", "12+3×(4-", "12+3×(4-1)",
+             "12+3×(4-1)2", "12+3×(4-1)", "2+3×(4-1)", "2+3×(4÷0)", "2+3×(4÷2)", ""]
+    for text in edits:
+        try:
+            expected = ArithmeticCalculator.evaluate_expression(text, auto_close=True)
+        except ValueError:
+            expected = None
+        try:
+            actual = evaluator.update(text)
+        except ValueError:
+            actual = None
+        assert actual == expected, (text, actual, expected)
@@ -0,0 +1,62 @@
+import sys
+import os
+import math
+import pytest
+
+# 添加包含calculator包的项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from calculator.core.arithmetic import ArithmeticCalculator
+from calculator.core.factorial import (
+    factorial, factorial_digits, factorial_log10, factorial_scientific, SMALL_FACTORIAL_LIMIT
+)
+
+
+def test_exact_factorial():
+    """测试查表和二分乘积两条路径都得到精确值"""
+    for n in (0, 1, 5, 20, SMALL_FACTORIAL_LIMIT, SMALL_FACTORIAL_LIMIT + 1, 1000):
+        assert factorial(n) == math.factorial(n)
+    assert ArithmeticCalculator.factorial(10) == 3628800
+
+    for invalid in (-1, 2.5, "5"):
+        with pytest.raises(ValueError):
+            ArithmeticCalculator.factorial(invalid)
+
+
+def test_size_guard():
+    """测试位数上限：先估算位数，超过上限时不计算直接报错"""
+    assert factorial(449, max_digits=1000) == math.factorial(449)
+    with pytest.raises(ValueError, match="超过上限"):
+        ArithmeticCalculator.factorial(10 ** 9, max_digits=1000)
+
+
+def test_magnitude_estimates():
+    """测试不计算阶乘本身的位数和科学计数法估算"""
+    for n in (0, 1, 10, 170, 171, 1000, 1500):
+        assert factorial_digits(n) == len(str(math.factorial(n)))
+    assert factorial_scientific(1000) == "4.02387260077e+2567"
+    assert factorial_scientific(10) == "3.62880000000e+06"
+
+    # 超出 lgamma 精确范围时改用Stirling级数，与 lgamma 的结果一致
+    n = 2 ** 53
+    assert math.isclose(factorial_log10(n), math.lgamma(float(n) + 1) / math.log(10), rel_tol=1e-14)
+
+    # 位数超过浮点数的有效数字时仍然精确
+    n = 10 ** 100
+    assert factorial_digits(n) == 995657055180967481723488710810833949177056029941963334338855462168341353507911292252707750506615682568
+    assert factorial_scientific(n, 6) == "1.62940e+995657055180967481723488710810833949177056029941963334338855462168341353507911292252707750506615682567"
+
+    with pytest.raises(ValueError):
+        factorial_log10(10 ** 400)
+
+
+def test_scientific_full_precision():
+    """测试30位有效数字的尾数与精确值一致（n 刚超过查表上限时Stirling级数收敛最慢）"""
+    from decimal import Context
+    for n in (171, 172, 180, 1000):
+        context = Context(prec=30)
+        exact = context.create_decimal(math.factorial(n))
+        mantissa = context.scaleb(exact, -exact.adjusted())
+        assert factorial_scientific(n, 30) == f"{mantissa:.29f}e+{exact.adjusted()}"
+    with pytest.raises(ValueError):
+        factorial_scientific(200, 31)
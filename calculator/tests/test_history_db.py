@@ -0,0 +1,58 @@
+import sys
+import os
+from datetime import datetime
+
+# 添加包含calculator包的项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from calculator.data.history_db import HistoryDatabase
+
+
+def _item(expression, result, minute):
+    return {'expression': expression, 'result': result, 'timestamp': f"2024-01-01T10:{minute:02d}:00"}
+
+
+def test_read_and_date_range(tmp_path):
+    """测试按页读取和按日期范围查询"""
+    db = HistoryDatabase(str(tmp_path / "history.db"), max_items=None)
+    db.append_many(_item(f"{i}+1", i + 1, i) for i in range(10))
+    assert len(db) == 10
+    assert [item['result'] for item in db.read(0, 3)] == [10, 9, 8]
+
+    items = db.query_by_date(datetime(2024, 1, 1, 10, 2), datetime(2024, 1, 1, 10, 4))
+    assert [item['expression'] for item in items] == ["4+1", "3+1", "2+1"]
+    db.close()
+
+
+def test_search_and_compaction(tmp_path):
+    """测试文本搜索和超过保留数量后的清理"""
+    db = HistoryDatabase(str(tmp_path / "history.db"), max_items=3, compact_threshold=4)
+    db.append(_item("sin(30)", 0.5, 1))
+    db.append(_item("2+2", 4, 2))
+    db.append(_item("sqrt(16)", 4, 3))
+    assert [item['expression'] for item in db.search("sin")] == ["sin(30)"]
+    assert [item['expression'] for item in db.search("4")] == ["sqrt(16)", "2+2"]
+
+    db.append(_item("1+1", 2, 4))
+    db.append(_item("3*3", 9, 5))
+    assert len(db) == 3
+    assert db.search("sin") == []
+    db.close()
+
+
+def test_search_without_fts_tokens(tmp_path):
+    """测试FTS5按词前缀匹配；文本中没有词时退化为与LIKE一致的子串匹配"""
+    db = HistoryDatabase(str(tmp_path / "history.db"))
+    db.append(_item("23+1", 24, 1))
+    db.append(_item("3*3", 9, 2))
+    db.append(_item("5-2", 3, 3))
+    assert [item['expression'] for item in db.search("+")] == ["23+1"]
+    assert len(db.search("")) == 3
+    if db.has_fts:
+        # 按词前缀匹配："3" 不匹配 "23"
+        assert [item['expression'] for item in db.search("3")] == ["5-2", "3*3"]
+    # 不支持FTS5时按子串匹配
+    db.has_fts = False
+    assert [item['expression'] for item in db.search("3")] == ["5-2", "3*3", "23+1"]
+    assert [item['expression'] for item in db.search("+")] == ["23+1"]
+    db.close()
@@ -0,0 +1,73 @@
+import sys
+import os
+
+# 添加包含calculator包的项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from calculator.data.history_log import HistoryLog
+
+
+def _item(i):
+    return {'expression': f"{i}+1", 'result': i + 1, 'timestamp': f"2024-01-01T00:00:{i:02d}"}
+
+
+def test_append_and_read(tmp_path):
+    """测试追加记录和按页读取（最新的在前）"""
+    log = HistoryLog(str(tmp_path / "history.jsonl"), max_items=10)
+    for i in range(5):
+        log.append(_item(i))
+    assert len(log) == 5
+    assert [item['result'] for item in log.read()] == [5, 4, 3, 2, 1]
+    assert [item['result'] for item in log.read(1, 2)] == [4, 3]
+
+    # 重新打开时直接使用索引
+    reopened = HistoryLog(log.log_file, max_items=10)
+    assert reopened.read(0, 1) == [_item(4)]
+
+
+def test_compaction(tmp_path):
+    """测试超过阈值后压缩，只保留最新的记录"""
+    log = HistoryLog(str(tmp_path / "history.jsonl"), max_items=3, compact_threshold=5)
+    for i in range(6):
+        log.append(_item(i))
+    with open(log.log_file, 'rb') as f:
+        assert len(f.readlines()) == 3
+    assert [item['result'] for item in log.read()] == [6, 5, 4]
+
+
+def test_rebuild_index_after_partial_write(tmp_path):
+    """测试索引丢失或日志末尾写入不完整时重建索引"""
+    log = HistoryLog(str(tmp_path / "history.jsonl"), max_items=10)
+    for i in range(3):
+        log.append(_item(i))
+    with open(log.log_file, 'ab') as f:
+        f.write(b'{"expression":"9+')
+    os.remove(log.index_file)
+
+    reopened = HistoryLog(log.log_file, max_items=10)
+    assert [item['result'] for item in reopened.read()] == [3, 2, 1]
+    reopened.append(_item(7))
+    assert reopened.read(0, 1) == [_item(7)]
+
+
+def test_unlimited(tmp_path):
+    """测试 max_items 为None时不限制记录数量，也不压缩"""
+    log = HistoryLog(str(tmp_path / "history.jsonl"), max_items=None)
+    for i in range(250):
+        log.append(_item(i % 60))
+    assert len(log) == 250
+    log.compact()
+    assert len(log.read()) == 250
+
+
+def test_append_from_another_process(tmp_path):
+    """测试日志在加载之后被其他实例追加时，偏移量仍指向正确的行"""
+    path = str(tmp_path / "history.jsonl")
+    first = HistoryLog(path, max_items=10)
+    second = HistoryLog(path, max_items=10)
+    first.append(_item(1))
+    second.append(_item(2))
+    first.append(_item(3))
+    assert [item['result'] for item in first.read()] == [4, 3, 2]
+    assert [item['result'] for item in second.read()] == [4, 3, 2]
+    assert [item['result'] for item in HistoryLog(path, max_items=10).read()] == [4, 3, 2]
@@ -0,0 +1,86 @@
+import sys
+import os
+
+import pytest
+
+# 添加包含calculator包的项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+pytest.importorskip("PyQt6.QtWidgets")
+
+from calculator.ui.history_view import ExpressionRole, HistoryListModel, ResultRole
+
+
+def test_history_model_paging():
+    """测试历史记录模型按页加载，最新的记录在第一行"""
+    history = [f"{i}+1 = {i + 1}" for i in range(250)]
+    model = HistoryListModel(history, page_size=100)
+    assert model.rowCount() == 100
+    assert model.index(0).data(ExpressionRole) == "249+1"
+    assert model.index(0).data(ResultRole) == "250"
+
+    while model.canFetchMore():
+        model.fetchMore()
+    assert model.rowCount() == 250
+    assert model.index(249).data() == "0+1 = 1"
+
+
+def test_history_model_append():
+    """测试追加记录后新记录显示在第一行"""
+    history = ["1+1 = 2"]
+    model = HistoryListModel(history)
+    history.append("2+2 = 4")
+    model.record_appended()
+    assert model.rowCount() == 2
+    assert model.index(0).data(ResultRole) == "4"
+
+
+class _CountingStore:
+    """记录每次 read 调用的存储，用于检查模型只按页读取"""
+
+    def __init__(self, store):
+        self.store = store
+        self.reads = []
+
+    def __len__(self):
+        return len(self.store)
+
+    def read(self, start=0, count=None):
+        self.reads.append((start, count))
+        return self.store.read(start, count)
+
+
+def test_history_model_pages_from_store(tmp_path):
+    """测试来源为存储时每页只通过 read(start, count) 读取这一页"""
+    from calculator.data.history_log import HistoryLog
+    log = HistoryLog(str(tmp_path / "history.jsonl"), max_items=1000)
+    for i in range(250):
+        log.append({'expression': f"{i}+1", 'result': i + 1, 'timestamp': f"{i:04d}"})
+    store = _CountingStore(log)
+    model = HistoryListModel(store, page_size=100)
+    assert store.reads == [(0, 100)]
+    assert model.rowCount() == 100
+    assert model.index(0).data(ExpressionRole) == "249+1"
+
+    while model.canFetchMore():
+        model.fetchMore()
+    assert store.reads == [(0, 100), (100, 100), (200, 50)]
+    assert model.index(249).data() == "0+1 = 1"
+
+    log.append({'expression': "9*9", 'result': 81, 'timestamp': "9999"})
+    model.record_appended()
+    assert model.rowCount() == 251
+    assert model.index(0).data(ResultRole) == "81"
+
+
+def test_history_model_stops_at_store_retention(tmp_path):
+    """测试存储返回的记录少于其计数（数据库尚未清理超出保留数量的记录）时不再请求更多"""
+    from calculator.data.history_db import HistoryDatabase
+    db = HistoryDatabase(str(tmp_path / "history.db"), max_items=5, compact_threshold=100)
+    for i in range(8):
+        db.append({'expression': f"{i}+0", 'result': i, 'timestamp': f"{i:04d}"})
+    model = HistoryListModel(db, page_size=3)
+    while model.canFetchMore():
+        model.fetchMore()
+    assert model.rowCount() == model.total_count() == 5
+    db.close()
@@ -0,0 +1,101 @@
+import sys
+import os
+
+import pytest
+
+# 添加包含calculator包的项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+QtWidgets = pytest.importorskip("PyQt6.QtWidgets")
+
+from calculator.data.config_manager import ConfigManager
+from calculator.ui.main_window import CalculatorMainWindow
+
+
+@pytest.fixture
+def window(tmp_path, monkeypatch):
+    monkeypatch.setenv("HOME", str(tmp_path))
+    manager = ConfigManager()
+    monkeypatch.setattr(ConfigManager, "shared", classmethod(lambda cls, config_file=None: manager))
+    app = QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+    window = CalculatorMainWindow()
+    yield window
+    window.close()
+    window.deleteLater()
+    app.processEvents()
+
+
+def test_tabs_built_on_first_selection(window):
+    """测试启动时只创建当前选项卡，其余选项卡在第一次切换时创建"""
+    assert window._built_tabs == {0}
+    assert hasattr(window, 'display')
+    assert not hasattr(window, 'scientific_display')
+    assert not hasattr(window, 'from_unit_combo')
+    assert window.scientific_calc_widget.layout() is None
+
+    window.tabs.setCurrentIndex(1)
+    assert window._built_tabs == {0, 1}
+    assert window.scientific_calc_widget.layout() is not None
+    assert window.scientific_display.text() == ""
+
+    window.tabs.setCurrentIndex(3)
+    window.tabs.setCurrentIndex(1)
+    assert window._built_tabs == {0, 1, 3}
+    assert window.from_base_combo.count() > 0
+
+
+def test_theme_change_before_tabs_built(window):
+    """测试未创建的选项卡不影响主题切换，之后创建时使用当前主题"""
+    window.update_theme(True)
+    window.tabs.setCurrentIndex(1)
+    assert window.style_registry.applied_style(window.scientific_display)[:2] == ('input', 'dark')
+
+
+def test_base_converter_offers_every_base(window):
+    """测试进制下拉框列出全部进制，转换按条目数据取进制并可分组显示"""
+    window.tabs.setCurrentIndex(3)
+    assert window.from_base_combo.count() == len(window.base_converter.supported_bases())
+    window.from_base_combo.setCurrentIndex(window.from_base_combo.findData(16))
+    window.to_base_combo.setCurrentIndex(window.to_base_combo.findData(2))
+    window.input_number.setText("fF")
+    window.convert_base()
+    assert window.output_number.text() == "11111111"
+
+    window.group_digits_check.setChecked(True)
+    assert window.output_number.text() == "1111 1111"
+
+
+def test_programmer_tab_shows_every_base(window):
+    """测试程序员模式同时显示各进制的结果，切换字长时按新字长截断"""
+    window.tabs.setCurrentIndex(4)
+    window.programmer_base_combo.setCurrentIndex(window.programmer_base_combo.findData(10))
+    window.programmer_input.setText("-1 & 0x1FF")
+    window.calculate_programmer()
+    assert window.programmer_outputs[10].text() == "511"
+    assert window.programmer_outputs[16].text() == "0000 0000 0000 01FF"
+
+    window.word_size_combo.setCurrentIndex(window.word_size_combo.findData(8))
+    assert window.programmer_outputs[10].text() == "-1"
+    assert window.programmer_outputs[2].text() == "1111 1111"
+    window.signed_combo.setCurrentIndex(window.signed_combo.findData(False))
+    assert window.programmer_outputs[10].text() == "255"
+
+
+def test_programmer_placeholder_examples_are_valid(window):
+    """测试程序员模式输入框提示中的示例都是可以计算的表达式"""
+    window.tabs.setCurrentIndex(4)
+    examples = window.programmer_input.placeholderText().removeprefix("如 ").split("、")
+    for example in examples:
+        window.programmer_calc.evaluate(example)
+
+
+def test_programmer_tab_follows_theme(window):
+    """测试切换主题时程序员模式界面随之更新样式"""
+    window.update_theme(False)
+    window.tabs.setCurrentIndex(4)
+    assert "#ffffff" in window.programmer_input.styleSheet()
+    window.update_theme(True)
+    assert "#333333" in window.programmer_input.styleSheet()
+    assert "#2d2d2d" in window.programmer_widget.styleSheet()
+    assert "#303030" in window.programmer_outputs[2].styleSheet()
@@ -0,0 +1,42 @@
+import sys
+import os
+import json
+
+# 添加包含calculator包的项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from calculator.data.persistence import BackgroundWriter, atomic_write
+
+
+def test_atomic_write(tmp_path):
+    """测试原子写入替换文件且不留下临时文件"""
+    path = tmp_path / "data.json"
+    path.write_text("old")
+    atomic_write(str(path), b"new")
+    assert path.read_text() == "new"
+    assert os.listdir(tmp_path) == ["data.json"]
+
+
+def test_coalesced_writes(tmp_path, monkeypatch):
+    """测试合并窗口内的多次写入只写最后一次，关闭时同步写完"""
+    path = str(tmp_path / "data.json")
+    writer = BackgroundWriter(delay=60)
+    written = []
+    monkeypatch.setattr("calculator.data.persistence.atomic_write",
+                        lambda p, data: written.append(data) or atomic_write(p, data))
+
+    for i in range(5):
+        writer.write_json(path, {"value": i})
+    assert writer.pending(path) == {"value": 4}
+    assert not os.path.exists(path)
+
+    writer.close()
+    assert len(written) == 1
+    with open(path, encoding='utf-8') as f:
+        assert json.load(f) == {"value": 4}
+    assert writer.pending(path) is None
+
+    # 关闭后的写入在调用线程中同步完成
+    writer.write_json(path, {"value": 5})
+    with open(path, encoding='utf-8') as f:
+        assert json.load(f) == {"value": 5}
@@ -0,0 +1,148 @@
+import sys
+import os
+import threading
+import time
+from fractions import Fraction
+
+import pytest
+
+# 添加包含calculator包的项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+os.environ.setdefault("QT_QPA_PLATFORM", "offscreen")
+QtWidgets = pytest.importorskip("PyQt6.QtWidgets")
+
+from PyQt6.QtCore import QRunnable, QThreadPool
+
+from calculator.ui.preview_worker import PreviewScheduler
+
+
+@pytest.fixture
+def app():
+    return QtWidgets.QApplication.instance() or QtWidgets.QApplication([])
+
+
+@pytest.fixture
+def pool():
+    pool = QThreadPool()
+    pool.setMaxThreadCount(1)
+    yield pool
+    pool.waitForDone()
+
+
+def wait_until(app, condition, timeout=5.0):
+    """处理事件直到条件成立或超时"""
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "等待超时"
+        app.processEvents()
+        time.sleep(0.005)
+
+
+def settle(app, seconds=0.1):
+    """再处理一段时间的事件，让迟到的信号（如果有）有机会到达"""
+    deadline = time.monotonic() + seconds
+    while time.monotonic() < deadline:
+        app.processEvents()
+        time.sleep(0.005)
+
+
+class _Blocker(QRunnable):
+    """占住线程池唯一的线程，直到 release 被设置"""
+
+    def __init__(self):
+        super().__init__()
+        self.started = threading.Event()
+        self.release = threading.Event()
+
+    def run(self):
+        self.started.set()
+        self.release.wait(5)
+
+
+def test_debounce_emits_only_latest(app, pool):
+    """测试防抖间隔内的连续请求只计算并返回最后一次"""
+    scheduler = PreviewScheduler(delay_ms=20, thread_pool=pool)
+    results = []
+    scheduler.result_ready.connect(results.append)
+    for text in ("1+1", "1+2", "1+3"):
+        scheduler.request(text)
+    wait_until(app, lambda: results)
+    settle(app)
+    assert results == [4]
+
+
+def test_queued_task_is_taken_back(app, pool):
+    """测试尚未开始的任务在新请求到来时从线程池中移除，不会被执行"""
+    blocker = _Blocker()
+    pool.start(blocker)
+    assert blocker.started.wait(5)
+    scheduler = PreviewScheduler(delay_ms=0, thread_pool=pool)
+    results = []
+    scheduler.result_ready.connect(results.append)
+
+    scheduler.request("1+1")
+    wait_until(app, lambda: scheduler._tasks)
+    scheduler.request("2+2")
+    assert not scheduler._tasks
+    wait_until(app, lambda: scheduler._tasks)
+    blocker.release.set()
+    wait_until(app, lambda: results)
+    settle(app)
+    assert results == [4]
+
+
+def test_stale_running_result_is_discarded(app, pool):
+    """测试已经开始的旧计算完成后其结果被丢弃，只发出最新请求的结果"""
+    started = threading.Event()
+    gate = threading.Event()
+
+    def number(text):
+        started.set()
+        gate.wait(5)
+        return int(text)
+
+    scheduler = PreviewScheduler(delay_ms=0, thread_pool=pool, number=number)
+    results = []
+    scheduler.result_ready.connect(results.append)
+    scheduler.request("1+1")
+    wait_until(app, started.is_set)
+    scheduler.request("2+3")
+    gate.set()
+    wait_until(app, lambda: results)
+    settle(app)
+    assert results == [5]
+
+
+def test_set_number_and_cancel(app, pool):
+    """测试更换数值类型后使用新的求值器，取消后不再发出结果"""
+    scheduler = PreviewScheduler(delay_ms=0, thread_pool=pool)
+    results = []
+    scheduler.result_ready.connect(results.append)
+    scheduler.set_number(Fraction)
+    scheduler.request("1÷3+1")
+    wait_until(app, lambda: results)
+    assert results == [Fraction(4, 3)]
+
+    scheduler.request("1+1")
+    scheduler.cancel()
+    settle(app)
+    assert results == [Fraction(4, 3)]
+
+    # 表达式无效时结果为None
+    scheduler.request("1+")
+    wait_until(app, lambda: len(results) == 2)
+    assert results[1] is None
+
+
+def test_decimal_preview_uses_context_precision(app, pool):
+    """测试十进制模式的预览在给定上下文的精度下计算，与"="的结果一致"""
+    from calculator.core.decimal_context import DecimalContext, parse_decimal
+    context = DecimalContext(40)
+    scheduler = PreviewScheduler(delay_ms=0, thread_pool=pool, number=parse_decimal, context=context)
+    results = []
+    scheduler.result_ready.connect(results.append)
+    scheduler.request("1÷3+0")
+    wait_until(app, lambda: results)
+    assert results == [context.evaluate("1/3+0")]
+    assert len(str(results[0])) == 42
@@ -0,0 +1,86 @@
+import sys
+import os
+import pytest
+
+# 添加包含calculator包的项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from calculator.core.expression_parser import compile_programmer_expression
+from calculator.core.programmer import ProgrammerCalculator
+
+
+def test_bitwise_operators_and_precedence():
+    """测试位运算符的优先级与C语言一致，关键字和符号写法等价"""
+    calc = ProgrammerCalculator(32)
+    assert calc.evaluate("1 | 2 ^ 3 & 4") == 1 | 2 ^ 3 & 4
+    assert calc.evaluate("1 + 2 << 3") == (1 + 2) << 3
+    assert calc.evaluate("0xF0 or 0b1010 xor 0o17 and 5") == 0xF0 | 0b1010 ^ 0o17 & 5
+    assert calc.evaluate("~0") == 0xFFFFFFFF
+    assert calc.evaluate("not 0 shr 28 mod 5") == 0xFFFFFFFF
+    assert calc.evaluate("2(3 + 4)") == 14
+    assert calc.evaluate("(1 << 4", auto_close=True) == 16
+
+
+def test_input_base():
+    """测试没有前缀的数字按输入进制解析，前缀优先"""
+    calc = ProgrammerCalculator(16)
+    assert calc.evaluate("FF + 1", base=16) == 0x100
+    assert calc.evaluate("0b11 + 10", base=2) == 5
+    assert calc.evaluate("17", base=8) == 15
+    with pytest.raises(ValueError):
+        calc.evaluate("12", base=2)
+    with pytest.raises(ValueError):
+        calc.evaluate("1", base=3)
+
+
+def test_wraparound_and_signed_interpretation():
+    """测试结果截断到字长，有符号模式按补码解释"""
+    signed = ProgrammerCalculator(8)
+    unsigned = ProgrammerCalculator(8, signed=False)
+    assert signed.evaluate("127 + 1") == 0x80
+    assert signed.value_of(0x80) == -128
+    assert unsigned.value_of(0x80) == 128
+    assert signed.evaluate("-1") == 0xFF
+    assert signed.evaluate("16 * 16") == 0
+    assert signed.to_signed(signed.evaluate("-7 / 2")) == -3
+    assert signed.to_signed(signed.evaluate("-7 % 2")) == -1
+    # 无符号模式下 -7 是 249
+    assert unsigned.evaluate("-7 / 2") == 124
+    with pytest.raises(ValueError):
+        signed.evaluate("0x100")
+    with pytest.raises(ValueError):
+        signed.evaluate("1 / 0")
+
+
+def test_shifts_and_rotates():
+    """测试算术/逻辑右移和循环移位"""
+    signed = ProgrammerCalculator(8)
+    unsigned = ProgrammerCalculator(8, signed=False)
+    assert signed.evaluate("0x80 >> 1") == 0xC0
+    assert unsigned.evaluate("0x80 >> 1") == 0x40
+    assert signed.evaluate("1 << 8") == 0
+    assert signed.evaluate("0x81 rol 1") == 0x03
+    assert signed.evaluate("0x81 ror 1") == 0xC0
+    assert signed.evaluate("0x81 rol 9") == 0x03
+    assert ProgrammerCalculator(128).evaluate("1 << 127") == 1 << 127
+    with pytest.raises(ValueError):
+        signed.evaluate("1 << -1")
+
+
+def test_views():
+    """测试同一位模式在各进制下的显示"""
+    calc = ProgrammerCalculator(16)
+    views = calc.views(calc.evaluate("-2"))
+    assert views == {16: "FFFE", 10: "-2", 8: "177776", 2: "1111 1111 1111 1110"}
+    assert ProgrammerCalculator(16, signed=False).views(0xFFFE)[10] == "65534"
+    with pytest.raises(ValueError):
+        ProgrammerCalculator(12)
+
+
+def test_float_vm_rejects_bitwise_opcodes():
+    """测试位运算的字节码不能在浮点数虚拟机中执行"""
+    compiled = compile_programmer_expression("1 & 3")
+    with pytest.raises(ValueError):
+        compiled.run()
+    with pytest.raises(ValueError):
+        compile_programmer_expression("1.5 + 1")
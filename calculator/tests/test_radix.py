@@ -0,0 +1,96 @@
+import sys
+import os
+import pytest
+
+# 添加包含calculator包的项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from calculator.core.base_converter import BaseConverter
+from calculator.core.radix import BASE62_DIGITS, base_to_int, group_digits, int_to_base
+
+
+def naive_digits(value, base):
+    """逐位转换的参考实现"""
+    digits = ""
+    while value:
+        value, digit = divmod(value, base)
+        digits = "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZ"[digit] + digits
+    return digits or "0"
+
+
+def test_small_values():
+    """测试小整数在各种进制下与逐位转换一致"""
+    for base in range(2, 37):
+        for value in (0, 1, base - 1, base, 255, 123456789):
+            text = int_to_base(value, base)
+            assert text == naive_digits(value, base)
+            assert base_to_int(text, base) == value
+            assert base_to_int(text.lower(), base) == value
+    assert int_to_base(-255, 16) == "-FF"
+    assert BaseConverter.convert("ff", 16, 2) == "11111111"
+    assert BaseConverter.convert("-255", 10, 8) == "-377"
+
+
+def test_huge_values_round_trip():
+    """测试远超 int()/str() 4300位限制的大整数经分治转换后往返一致"""
+    value = 7 ** 40000 + 12345  # 约33800位十进制数
+    for base in (2, 3, 10, 16, 36):
+        text = int_to_base(value, base)
+        assert base_to_int(text, base) == value
+    # 分治结果与逐位转换一致（取较小的数以免参考实现太慢）
+    value = 3 ** 5000 - 1
+    for base in (7, 10, 36):
+        assert int_to_base(value, base) == naive_digits(value, base)
+
+    decimal_text = int_to_base(value, 10)
+    assert BaseConverter.convert(decimal_text, 10, 16) == int_to_base(value, 16)
+    assert BaseConverter.convert(int_to_base(value, 16), 16, 10) == decimal_text
+    assert BaseConverter.validate_number("+" + decimal_text, 10)
+
+
+def test_invalid_input():
+    """测试长字符串中的非法字符同样被拒绝"""
+    long_digits = "12345" * 500
+    for text in (long_digits + "A", long_digits[:1200] + "." + long_digits[1200:], "_" + long_digits):
+        with pytest.raises(ValueError, match="无效的10进制"):
+            base_to_int(text, 10)
+    assert base_to_int("1_000", 10) == 1000
+    assert base_to_int("1_" + long_digits, 10) == base_to_int("1" + long_digits, 10)
+    with pytest.raises(ValueError):
+        int_to_base(10, 37)
+    assert not BaseConverter.validate_number("19", 8)
+
+
+def test_any_base_and_grouping():
+    """测试任意进制（含62进制）、不区分大小写的输入和分组输出"""
+    assert BaseConverter.convert("zz", 36, 10) == "1295"
+    assert BaseConverter.convert("ZZ", 36, 3) == "1202222"
+    assert BaseConverter.convert("61", 10, 62) == "z"
+    assert BaseConverter.convert("Zz", 62, 10) == str(35 * 62 + 61)
+    with pytest.raises(ValueError, match="无效的62进制"):
+        BaseConverter.convert("a-b", 62, 10)
+    with pytest.raises(ValueError, match="进制必须是"):
+        BaseConverter.convert("1", 10, 40)
+
+    value = 5 ** 3000
+    text = int_to_base(value, 62)
+    assert base_to_int(text, 62) == value
+    assert text == naive_digits_62(value)
+
+    assert group_digits("-11110000", 4) == "-1111 0000"
+    assert group_digits("1234567", 3, ",") == "1,234,567"
+    grouped = BaseConverter.convert("255", 10, 2, group_size=4)
+    assert grouped == "1111 1111"
+    assert BaseConverter.convert(grouped, 2, 16) == "FF"
+    assert BaseConverter.supported_bases()[-1] == 62
+    assert BaseConverter.base_name(16) == "十六进制 (16)"
+    assert BaseConverter.base_name(7) == "7进制 (7)"
+
+
+def naive_digits_62(value):
+    """62进制逐位转换的参考实现"""
+    digits = ""
+    while value:
+        value, digit = divmod(value, 62)
+        digits = BASE62_DIGITS[digit] + digits
+    return digits or "0"
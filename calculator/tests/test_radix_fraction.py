@@ -0,0 +1,110 @@
+import sys
+import os
+import pytest
+from decimal import Decimal
+from fractions import Fraction
+
+# 添加包含calculator包的项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from calculator.core.base_converter import BaseConverter
+from calculator.core.radix_fraction import (
+    convert_fraction, float_bits, float_from_bits, fraction_to_base, parse_fraction
+)
+
+
+def test_parse_radix_point():
+    """测试带小数点和循环节的文本解析为精确分数"""
+    assert parse_fraction("1A.8", 16) == Fraction(53, 2)
+    assert parse_fraction("-.8", 16) == Fraction(-1, 2)
+    assert parse_fraction("1.", 2) == 1
+    assert parse_fraction("0.1", 10) == Fraction(1, 10)
+    assert parse_fraction("0.1(6)", 10) == Fraction(1, 6)
+    assert parse_fraction("0.(142857)", 10) == Fraction(1, 7)
+    assert parse_fraction("z.Z", 62) == Fraction(61 * 62 + 35, 62)
+    for text in ("", ".", "1.2.3", "1__0.5", "_1.5", "1.5_", "1.()", "0x.8", "0o1.8", "2.1"):
+        with pytest.raises(ValueError):
+            parse_fraction(text, 2 if text == "2.1" else 16)
+
+
+def test_prefixes_and_underscores_match_integer_syntax():
+    """测试小数与整数一样接受 int() 的进制前缀和下划线"""
+    assert parse_fraction("0x1F.8", 16) == Fraction(63, 2)
+    assert parse_fraction("-0b1_0.1", 2) == Fraction(-5, 2)
+    assert parse_fraction("0o_7.4", 8) == Fraction(15, 2)
+    assert parse_fraction("1_0.2_5", 10) == Fraction(41, 4)
+    assert BaseConverter.convert("0x1F", 16, 10) == "31"
+    assert BaseConverter.convert("0x1F.8", 16, 10) == "31.5"
+
+
+def test_terminating_and_repeating_expansions():
+    """测试有限小数直接输出，循环小数找到循环节并放在括号中"""
+    assert convert_fraction("1A.8", 16, 10) == "26.5"
+    assert convert_fraction("0.1", 10, 2) == "0.0(0011)"
+    assert convert_fraction("0.1", 10, 16) == "0.1(9)"
+    assert fraction_to_base(Fraction(1, 7), 10) == "0.(142857)"
+    assert fraction_to_base(Fraction(22, 7), 2) == "11.(001)"
+    assert fraction_to_base(Fraction(-1, 6), 10) == "-0.1(6)"
+    # 循环节的输出可以原样解析回来
+    for value in (Fraction(1, 6), Fraction(355, 113), Fraction(-7, 12)):
+        for base in (2, 3, 10, 16, 62):
+            assert parse_fraction(fraction_to_base(value, base, 200), base) == value
+
+
+def test_digit_limit():
+    """测试超过小数位数上限时截断并以 ... 结尾"""
+    assert fraction_to_base(Fraction(1, 97), 10, 20) == "0.01030927835051546391..."
+    assert fraction_to_base(Fraction(1, 3), 10, 0) == "0..."
+    assert fraction_to_base(Fraction(1, 1024), 10, 5) == "0.00097..."
+    assert fraction_to_base(Fraction(1, 1024), 10, 10) == "0.0009765625"
+    # 浮点数按精确值转换
+    assert fraction_to_base(0.1, 10, 100) == "0.1000000000000000055511151231257827021181583404541015625"
+    with pytest.raises(ValueError):
+        fraction_to_base(Fraction(1, 3), 10, -1)
+    with pytest.raises(ValueError):
+        fraction_to_base(float("inf"), 10)
+
+
+def test_base_converter_fractions_and_batch():
+    """测试 BaseConverter 的小数转换、分组和批量转换"""
+    assert BaseConverter.convert("-1A.8", 16, 2, group_size=4) == "-1 1010.1"
+    assert BaseConverter.convert("0.1", 10, 2, max_fraction_digits=3) == "0.000..."
+    assert BaseConverter.convert("255", 10, 16) == "FF"
+    assert BaseConverter.validate_number("1A.8", 16)
+    assert not BaseConverter.validate_number("1A.G", 16)
+
+    results = BaseConverter.convert_many(["0.5", "", "12.x", "255.75\n"], 10, 16)
+    assert [(r.line, r.value) for r in results] == [(1, "0.8"), (3, None), (4, "FF.C")]
+    assert results[1].error == "无效的10进制数字字符串"
+    with pytest.raises(ValueError):
+        BaseConverter.convert_many(["1"], 10, 63)
+
+
+def test_float_bits():
+    """测试 float32/float64 的位模式和精确值"""
+    info = BaseConverter.float_bits(0.1)
+    assert info.hex == "3FB999999999999A"
+    assert (info.sign, info.exponent, info.kind) == (0, 1019, "规格化数")
+    assert info.exact == "0.1000000000000000055511151231257827021181583404541015625"
+    single = float_bits("0.1", "float32")
+    assert single.hex == "3DCCCCCD"
+    assert single.binary == "0 01111011 10011001100110011001101"
+    assert single.exact == "0.100000001490116119384765625"
+    assert float_bits(-0.0).kind == "零" and float_bits(-0.0).sign == 1
+    assert float_bits(5e-324).kind == "非规格化数"
+    assert float_bits("-inf", "float32").hex == "FF800000"
+    assert float_from_bits("7FC00000", "float32").kind == "NaN"
+    assert float_from_bits(0x3FF0000000000000).value == 1.0
+    with pytest.raises(ValueError):
+        float_bits(1e39, "float32")
+    # 有限的文本溢出时报错，而不是静默变为无穷大
+    for text in ("1e400", "-1e400"):
+        for format_name in ("float32", "float64"):
+            with pytest.raises(ValueError):
+                float_bits(text, format_name)
+    with pytest.raises(ValueError):
+        float_bits(Decimal("1e400"))
+    with pytest.raises(ValueError):
+        float_bits(1.0, "float16")
+    with pytest.raises(ValueError):
+        float_from_bits(1 << 32, "float32")
@@ -0,0 +1,51 @@
+import sys
+import os
+import random
+import pytest
+
+# 添加包含calculator包的项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from calculator.core.radix import DIGITS, base_to_int, int_to_base
+from calculator.core.radix_stream import POWER_OF_TWO_BASES, convert_file, iter_convert, iter_convert_file
+
+
+def test_chunks_match_whole_number_conversion():
+    """测试任意段大小下逐段转换的结果与整体转换一致"""
+    rng = random.Random(0)
+    for _ in range(200):
+        from_base, to_base = rng.choice(POWER_OF_TWO_BASES), rng.choice(POWER_OF_TWO_BASES)
+        digits = "".join(rng.choice(DIGITS[:from_base]) for _ in range(rng.randint(1, 200)))
+        expected = int_to_base(base_to_int(digits, from_base), to_base)
+        chunk_digits = rng.randint(1, 50)
+        assert "".join(iter_convert(digits.lower(), from_base, to_base, chunk_digits)) == expected
+
+    assert "".join(iter_convert("0F", 16, 2, preserve_width=True)) == "00001111"
+    assert "".join(iter_convert("000", 16, 32)) == "0"
+    with pytest.raises(ValueError, match="只支持"):
+        list(iter_convert("12", 10, 2))
+    with pytest.raises(ValueError, match="没有数字"):
+        list(iter_convert(" \n", 16, 2))
+
+
+def test_file_conversion_through_mmap(tmp_path):
+    """测试通过 mmap 读取文件，逐段写出结果"""
+    value = random.Random(1).getrandbits(200000)
+    hex_text = int_to_base(value, 16)
+    source = tmp_path / "value.hex"
+    # 每64位一行，模拟十六进制转储
+    source.write_text("\n".join(hex_text[i:i + 64] for i in range(0, len(hex_text), 64)) + "\n")
+
+    target = tmp_path / "value.b32"
+    written = convert_file(source, target, 16, 32, chunk_digits=1000)
+    assert target.read_text() == int_to_base(value, 32)
+    assert written == len(int_to_base(value, 32))
+
+    pieces = list(iter_convert_file(source, 16, 2, chunk_digits=1000))
+    assert len(pieces) > 1
+    assert "".join(pieces) == format(value, "b")
+
+    empty = tmp_path / "empty.hex"
+    empty.write_text("")
+    with pytest.raises(ValueError):
+        list(iter_convert_file(empty, 16, 2))
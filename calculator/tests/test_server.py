@@ -0,0 +1,81 @@
+import sys
+import os
+import asyncio
+import json
+
+import pytest
+
+# 添加包含calculator包的项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from calculator.server import EvaluationServer, RPCClient, RPCError
+from calculator.server.rpc import CALCULATION_ERROR, INTERNAL_ERROR, METHOD_NOT_FOUND
+
+
+async def _with_server(workers, scenario):
+    server = EvaluationServer(workers=workers, offload_threshold=8)
+    listener = await server.start_tcp("127.0.0.1", 0)
+    host, port = listener.sockets[0].getsockname()[:2]
+    client = await RPCClient.connect(host, port)
+    try:
+        return await scenario(client)
+    finally:
+        await client.close()
+        await server.close()
+
+
+def test_calls_and_errors():
+    """测试单个调用、批量请求和错误响应"""
+    async def scenario(client):
+        assert await client.call("evaluate_expression", "1+2*3") == 7
+        assert await client.call("UnitConverter.convert_length", 1, "kilometer", "meter") == 1000
+        with pytest.raises(RPCError) as error:
+            await client.call("evaluate_expression", "1/0")
+        assert error.value.code == CALCULATION_ERROR
+        with pytest.raises(RPCError) as error:
+            await client.call("os.system", "ls")
+        assert error.value.code == METHOD_NOT_FOUND
+
+        results = await client.batch([
+            ("BaseConverter.convert", ["ff", 16, 2]),
+            ("evaluate_expression", ["(1"]),
+            ("ScientificCalculator.pi", [])
+        ])
+        assert results[0] == "11111111"
+        assert isinstance(results[1], RPCError)
+        assert results[2] == pytest.approx(3.141592653589793)
+
+    asyncio.run(_with_server(0, scenario))
+
+
+def test_process_pool_offload():
+    """测试长参数交给进程池执行"""
+    async def scenario(client):
+        expression = "+".join(["1"] * 50)
+        results = await asyncio.gather(*(client.call("evaluate_expression", expression) for _ in range(10)))
+        assert results == [50] * 10
+
+    asyncio.run(_with_server(1, scenario))
+
+
+def test_unencodable_result_gets_error_response():
+    """测试无法编码为JSON的结果返回同一id的内部错误，而不是让客户端一直等待"""
+    async def scenario(client):
+        with pytest.raises(RPCError) as error:
+            await asyncio.wait_for(client.call("evaluate_expression", "9" * 3000 + "*" + "9" * 3000), 10)
+        assert error.value.code == INTERNAL_ERROR
+        # 同一连接上之后的请求不受影响
+        assert await client.call("evaluate_expression", "1+1") == 2
+
+    asyncio.run(_with_server(0, scenario))
+
+
+def test_non_finite_result_is_not_emitted_as_json():
+    """测试NaN和无穷大不输出为非标准的JSON"""
+    server = EvaluationServer()
+    request = '{"jsonrpc": "2.0", "id": 7, "method": "ScientificCalculator.pi"}'
+    response = json.loads(asyncio.run(server.handle_message(request)))
+    assert response['id'] == 7 and response['result'] == pytest.approx(3.141592653589793)
+    request = '{"jsonrpc": "2.0", "id": 8, "method": "UnitConverter.convert_length", "params": [1e308, "kilometer", "meter"]}'
+    response = json.loads(asyncio.run(server.handle_message(request)))
+    assert (response['id'], response['error']['code']) == (8, INTERNAL_ERROR)
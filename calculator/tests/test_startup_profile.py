@@ -0,0 +1,49 @@
+import sys
+import os
+import io
+import subprocess
+
+# 添加包含calculator包的项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from calculator.startup_profile import StartupProfiler
+
+PROJECT_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+
+def test_nested_phases_and_report():
+    """测试嵌套阶段按开始顺序记录，并统计新导入的模块"""
+    profiler = StartupProfiler()
+    with profiler.phase("外层"):
+        with profiler.phase("导入"):
+            import calculator.core.expression_vm  # noqa: F401
+    profiler.mark("首帧")
+
+    names = [(name, depth) for name, depth, _, _ in profiler.phases]
+    assert names == [("外层", 0), ("导入", 1), ("首帧", 0)]
+    assert profiler.phases[0][2] >= profiler.phases[1][2]
+    assert profiler.phases[2][3] is None
+
+    stream = io.StringIO()
+    profiler.report(stream)
+    assert "外层" in stream.getvalue()
+    assert "@" in stream.getvalue()
+
+
+def test_packages_import_submodules_lazily():
+    """测试导入core和data包时不导入子模块，访问公开名称时才导入；HistoryManager 不导入 sqlite3"""
+    code = (
+        "import sys\n"
+        "import calculator.core, calculator.data\n"
+        "assert 'calculator.core.scientific' not in sys.modules\n"
+        "assert 'calculator.data.history_manager' not in sys.modules\n"
+        "from calculator.core import ScientificCalculator\n"
+        "from calculator.data import ConfigManager\n"
+        "assert 'calculator.core.scientific' in sys.modules\n"
+        "assert 'calculator.data.history_manager' not in sys.modules\n"
+        "assert 'numpy' not in sys.modules\n"
+        "assert 'IncrementalEvaluator' in dir(calculator.core)\n"
+        "from calculator.data import HistoryManager\n"
+        "assert 'sqlite3' not in sys.modules\n"
+    )
+    subprocess.run([sys.executable, "-c", code], cwd=PROJECT_ROOT, check=True)
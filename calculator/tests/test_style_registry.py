@@ -0,0 +1,42 @@
+import sys
+import os
+
+# 添加包含calculator包的项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from calculator.ui.style_registry import StyleRegistry
+
+
+class _FakeWidget:
+    """记录setStyleSheet调用次数的假控件"""
+
+    def __init__(self):
+        self.calls = 0
+        self.style = ""
+
+    def setStyleSheet(self, style):
+        self.calls += 1
+        self.style = style
+
+
+def test_stylesheet_cached():
+    """测试同一组合只生成一次样式表"""
+    registry = StyleRegistry()
+    first = registry.stylesheet("input", "dark")
+    assert first is registry.stylesheet("input", "dark", 24)
+    assert "font-size: 24px" in first
+    assert "#3a3a3a" in first
+
+
+def test_apply_skips_unchanged():
+    """测试样式未变化时不重复调用setStyleSheet"""
+    registry = StyleRegistry()
+    widget = _FakeWidget()
+    assert registry.apply(widget, "pre_result", "light")
+    assert not registry.apply(widget, "pre_result", "light")
+    assert widget.calls == 1
+    assert registry.apply(widget, "pre_result", "dark")
+    assert registry.apply(widget, "pre_result", "dark", 20)
+    assert widget.calls == 3
+    assert registry.applied_style(widget) == ("pre_result", "dark", 20)
+    assert "font-size: 20px" in widget.style
@@ -0,0 +1,37 @@
+import sys
+import os
+import math
+from array import array
+
+# 添加包含calculator包的项目根目录到Python路径
+sys.path.append(os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__)))))
+
+from calculator.core.vectorized import compile_vectorized, np
+
+
+def test_vectorized_without_numpy():
+    """测试不使用NumPy时的逐行求值与除零掩码"""
+    expression = compile_vectorized("(a+b)*c/d")
+    assert expression.variables == ('a', 'b', 'c', 'd')
+    values, errors = expression.evaluate(
+        a=array('d', [1, 2, 3]), b=1, c=[2, 2, 2], d=array('d', [1, 0, 2]), use_numpy=False
+    )
+    assert list(errors) == [0, 1, 0]
+    assert values[0] == 4 and math.isnan(values[1]) and values[2] == 4
+
+
+def test_vectorized_matches_scalar_path():
+    """测试批量结果与标量计算一致"""
+    if np is None:
+        return
+    from calculator.core.arithmetic import ArithmeticCalculator
+    a = np.array([1.5, -2.0, 3.25, 0.0])
+    b = np.array([2.0, 0.0, -1.0, 4.0])
+    values, errors = compile_vectorized("a÷b-2(a+b)").evaluate(a=a, b=b)
+    for i in range(len(a)):
+        try:
+            expected = ArithmeticCalculator.evaluate_expression(f"{a[i]}/{b[i]}-2*({a[i]}+{b[i]})")
+        except ValueError:
+            assert errors[i] and math.isnan(values[i])
+            continue
+        assert not errors[i] and math.isclose(values[i], expected)
@@ -0,0 +1,268 @@
+"""使用说明对话框
+
+对话框很少打开，主窗口在第一次显示使用说明时才导入本模块。
+"""
+
+from PyQt6.QtWidgets import (
+    QDialog, QFrame, QHBoxLayout, QLabel, QPushButton, QScrollArea, QSizePolicy,
+    QSpacerItem, QVBoxLayout, QWidget
+)
+
+
+class HelpDialog(QDialog):
+    """Fluent Design风格的使用说明对话框，支持深色/浅色模式"""
+
+    def __init__(self, is_dark_theme=False, parent=None):
+        """创建对话框
+
+        Args:
+            is_dark_theme: 是否使用深色主题
+            parent: 父窗口
+        """
+        super().__init__(parent)
+        # 根据当前主题设置颜色方案
+        if is_dark_theme:
+            # 深色主题颜色
+            dialog_bg = "#2d2d2d"
+            card_bg = "#3a3a3a"
+            card_hover_bg = "#424242"
+            text_primary = "#ffffff"
+            text_secondary = "#b0b0b0"
+            text_tertiary = "#e0e0e0"
+            accent_color = "#0078d4"
+            accent_hover = "#106ebe"
+            accent_pressed = "#005a9e"
+            border_color = "#4a4a4a"
+        else:
+            # 浅色主题颜色
+            dialog_bg = "#ffffff"
+            card_bg = "#f3f3f3"
+            card_hover_bg = "#ebebeb"
+            text_primary = "#1a1a1a"
+            text_secondary = "#444444"
+            text_tertiary = "#666666"
+            accent_color = "#0078d7"
+            accent_hover = "#106ebe"
+            accent_pressed = "#005a9e"
+            border_color = "#e0e0e0"
+        
+        self.setWindowTitle("使用说明")
+        self.setMinimumSize(640, 720)  # 略微增加尺寸以确保所有内容可见
+        
+        # 设置Fluent Design风格
+        self.setStyleSheet(f"""
+            QDialog {{ 
+                background-color: {dialog_bg}; 
+                border-radius: 8px;
+                border: 1px solid {border_color};
+            }}
+        """)
+        
+        # 创建主布局
+        main_layout = QVBoxLayout(self)
+        main_layout.setContentsMargins(24, 24, 24, 24)
+        main_layout.setSpacing(16)  # 统一间距
+        
+        # 添加标题标签
+        title_label = QLabel("Python多功能计算器使用说明")
+        title_label.setStyleSheet(f"""
+            QLabel {{ 
+                color: {text_primary}; 
+                font-size: 20px; 
+                font-weight: 600;
+                margin-bottom: 8px;
+            }}
+        """)
+        main_layout.addWidget(title_label)
+        
+        # 添加版本信息
+        version_label = QLabel("版本 1.0")
+        version_label.setStyleSheet(f"color: {text_secondary}; font-size: 12px;")
+        main_layout.addWidget(version_label)
+        
+        # 创建滚动区域
+        scroll_area = QScrollArea()
+        scroll_area.setWidgetResizable(True)
+        
+        # 设置滚动条样式
+        scroll_area.setStyleSheet(f"""
+            QScrollArea {{ background-color: transparent; border: none; }}
+            QScrollBar:vertical {{ 
+                background-color: transparent;
+                width: 8px;
+                margin: 0 4px 0 0;
+            }}
+            QScrollBar::handle:vertical {{ 
+                background-color: {text_secondary};
+                border-radius: 4px;
+                min-height: 20px;
+            }}
+            QScrollBar::handle:vertical:hover {{ 
+                background-color: {text_primary};
+            }}
+            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{ 
+                height: 0px;
+                width: 0px;
+            }}
+        """)
+        
+        # 创建滚动内容容器
+        scroll_content = QWidget()
+        scroll_content.setStyleSheet("background-color: transparent;")
+        
+        # 创建内容布局
+        content_layout = QVBoxLayout(scroll_content)
+        content_layout.setSpacing(20)  # 增加内容块之间的间距
+        content_layout.setContentsMargins(4, 4, 4, 4)
+        
+        # 帮助内容
+        help_sections = [
+            {
+                "title": "1. 基本计算",
+                "content": [
+                    "- 数字键 (0-9)：输入数字",
+                    "- 运算符键 (+, -, *, /)：输入运算符",
+                    "- 小数点 (.)：输入小数点",
+                    "- Enter/Return键：计算结果",
+                    "- Escape键：清除",
+                    "- 减号 (-)：切换正负号",
+                    "- 百分号 (%)：转换为百分比",
+                    "- 鼠标点击：点击相应按钮"
+                ]
+            },
+            {
+                "title": "2. 科学计算",
+                "content": [
+                    "- 基本功能同基本计算器",
+                    "- 键盘快捷键：",
+                    "  - Shift+S：sin",
+                    "  - Shift+C：cos",
+                    "  - Shift+T：tan",
+                    "  - Shift+P：π (圆周率)",
+                    "  - E：e (自然对数底)",
+                    "  - Ctrl+X：平方根",
+                    "- 科学函数按钮：点击相应按钮使用所有科学函数"
+                ]
+            },
+            {
+                "title": "3. 单位换算",
+                "content": [
+                    "- 选择单位类型",
+                    "- 选择源单位和目标单位",
+                    "- 输入要转换的值",
+                    "- 点击转换按钮"
+                ]
+            },
+            {
+                "title": "4. 进制转换",
+                "content": [
+                    "- 选择源进制和目标进制",
+                    "- 输入要转换的数字",
+                    "- 点击转换按钮"
+                ]
+            },
+            {
+                "title": "键盘输入支持",
+                "content": [
+                    "在基本计算器和科学计算器选项卡中可以使用相应的键盘快捷键进行操作，提高计算效率。"
+                ]
+            },
+            {
+                "title": "主题设置",
+                "content": [
+                    "- 浅色/深色主题：在设置菜单中可切换主题",
+                    "- 所有界面元素都会根据当前主题自动适配"
+                ]
+            },
+            {
+                "title": "历史记录",
+                "content": [
+                    "- 计算结果会自动保存在历史记录中",
+                    "- 点击'历史记录'按钮查看所有计算历史",
+                    "- 支持复制历史计算结果"
+                ]
+            }
+        ]
+        
+        # 创建帮助内容块
+        for section in help_sections:
+            # 章节标题
+            section_title = QLabel(section["title"])
+            section_title.setStyleSheet(f"""
+                QLabel {{ 
+                    color: {text_primary}; 
+                    font-size: 16px; 
+                    font-weight: 500;
+                    margin-bottom: 8px;
+                }}
+            """)
+            content_layout.addWidget(section_title)
+            
+            # 章节内容容器
+            content_frame = QFrame()
+            content_frame.setStyleSheet(f"""
+                QFrame {{ 
+                    background-color: {card_bg}; 
+                    border-radius: 8px;
+                    padding: 16px;
+                    border: 1px solid {border_color};
+                }}
+            """)
+            
+            content_block_layout = QVBoxLayout(content_frame)
+            content_block_layout.setContentsMargins(0, 0, 0, 0)
+            content_block_layout.setSpacing(10)  # 增加内容项之间的间距
+            
+            # 添加内容项
+            for item in section["content"]:
+                item_label = QLabel(item)
+                item_label.setStyleSheet(f"""
+                    QLabel {{ 
+                        color: {text_secondary}; 
+                        font-size: 14px;
+                    }}
+                """)
+                item_label.setWordWrap(True)
+                content_block_layout.addWidget(item_label)
+            
+            content_layout.addWidget(content_frame)
+        
+        # 添加底部空白，确保滚动到底部时内容完全可见
+        content_layout.addSpacerItem(QSpacerItem(0, 20, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Fixed))
+        
+        # 设置滚动区域的内容
+        scroll_area.setWidget(scroll_content)
+        
+        # 添加滚动区域到主布局
+        main_layout.addWidget(scroll_area, 1)  # 1表示伸展系数
+        
+        # 添加关闭按钮
+        close_button = QPushButton("关闭")
+        close_button.setFixedHeight(36)
+        close_button.setMinimumWidth(80)  # 设置最小宽度，确保按钮不会太小
+        close_button.setStyleSheet(f"""
+            QPushButton {{ 
+                background-color: {accent_color}; 
+                color: white; 
+                border: none; 
+                border-radius: 4px; 
+                font-size: 14px;
+                font-weight: 500;
+                padding: 0 16px;
+            }}
+            QPushButton:hover {{ 
+                background-color: {accent_hover}; 
+            }}
+            QPushButton:pressed {{ 
+                background-color: {accent_pressed}; 
+            }}
+        """)
+        close_button.clicked.connect(self.accept)
+        
+        # 创建按钮布局
+        button_layout = QHBoxLayout()
+        button_layout.setContentsMargins(0, 16, 0, 0)  # 增加顶部边距，确保按钮不会紧贴内容
+        button_layout.addStretch()
+        button_layout.addWidget(close_button)
+        button_layout.addStretch()
+        main_layout.addLayout(button_layout)
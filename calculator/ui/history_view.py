@@ -0,0 +1,355 @@
+"""历史记录视图模块
+
+历史记录对话框使用 模型/视图 结构：HistoryListModel 按页从历史记录中
+懒加载条目（来源可以是内存中的列表，也可以是 HistoryLog、HistoryDatabase
+这样支持 read(start, count) 的存储，此时每页只从存储中读取这一页），
+QListView 只为可见的行调用 HistoryItemDelegate 绘制，
+不再为每条记录创建 QFrame、QLabel 和 QPushButton。对话框创建一次后
+常驻，再次打开时只刷新模型，因此打开耗时只与可见行数有关。
+"""
+
+from PyQt6.QtCore import QAbstractListModel, QEvent, QModelIndex, QRect, QSize, Qt
+from PyQt6.QtGui import QColor, QFont, QPainter, QPen
+from PyQt6.QtWidgets import (
+    QAbstractItemView, QApplication, QDialog, QHBoxLayout, QLabel, QListView,
+    QPushButton, QStyle, QStyledItemDelegate, QVBoxLayout
+)
+
+# 历史记录对话框的配色方案
+HISTORY_PALETTES = {
+    "dark": {
+        "dialog_bg": "#2d2d2d",
+        "card_bg": "#3a3a3a",
+        "card_hover_bg": "#424242",
+        "text_primary": "#ffffff",
+        "text_secondary": "#b0b0b0",
+        "accent_color": "#0078d4",
+        "danger_color": "#f15252"
+    },
+    "light": {
+        "dialog_bg": "#ffffff",
+        "card_bg": "#f3f3f3",
+        "card_hover_bg": "#ebebeb",
+        "text_primary": "#1a1a1a",
+        "text_secondary": "#666666",
+        "accent_color": "#0078d7",
+        "danger_color": "#d13438"
+    }
+}
+
+# 自定义数据角色
+ExpressionRole = Qt.ItemDataRole.UserRole + 1
+ResultRole = Qt.ItemDataRole.UserRole + 2
+
+
+def split_record(record):
+    """把 "表达式 = 结果" 形式的历史记录拆分为 (表达式, 结果)"""
+    parts = record.split("=")
+    if len(parts) == 2:
+        return parts[0].strip(), parts[1].strip()
+    return record.strip(), ""
+
+
+def _store_record(item):
+    """把存储中的历史记录字典转换为 "表达式 = 结果" 形式"""
+    return f"{item.get('expression', '')} = {item.get('result', '')}"
+
+
+class HistoryListModel(QAbstractListModel):
+    """按页懒加载的历史记录模型，最新的记录排在最前面"""
+
+    def __init__(self, history=None, page_size=200, parent=None):
+        """初始化模型
+
+        Args:
+            history: 历史记录来源：按时间从旧到新的 "表达式 = 结果" 序列（支持len()和下标访问），
+                或支持 len() 和 read(start, count) 的存储（如 HistoryLog、HistoryDatabase，
+                read 按从新到旧返回记录字典）
+            page_size: 每次加载的条目数
+            parent: 父对象
+        """
+        super().__init__(parent)
+        self._page_size = page_size
+        self._set_source(history if history is not None else [])
+
+    def _set_source(self, history):
+        """设置来源并加载第一页"""
+        self._history = history
+        # 存储来源时缓存已读取的各页（最新的在前），序列来源直接按下标访问
+        self._rows = [] if hasattr(history, 'read') else None
+        # 存储返回的条数少于请求时说明已经读完（数据库的保留数量可能小于其中的记录数）
+        self._exhausted = False
+        self._loaded = 0
+        self._loaded = self._next_page()
+
+    def _next_page(self):
+        """读取下一页（存储来源时从存储中读取），返回该页的条数；尚未计入已加载的行数"""
+        count = min(self._page_size, self.total_count() - self._loaded)
+        if count <= 0 or self._rows is None:
+            return max(count, 0)
+        page = self._history.read(self._loaded, count)
+        if len(page) < count:
+            self._exhausted = True
+        self._rows.extend(_store_record(item) for item in page)
+        return len(page)
+
+    def set_history(self, history):
+        """更换历史记录来源并重置模型，只加载第一页"""
+        self.beginResetModel()
+        self._set_source(history)
+        self.endResetModel()
+
+    def refresh(self):
+        """历史记录在模型之外被修改后重新同步"""
+        self.set_history(self._history)
+
+    def record_appended(self):
+        """通知模型历史记录末尾追加了一条记录，新记录显示在第一行"""
+        self.beginInsertRows(QModelIndex(), 0, 0)
+        if self._rows is not None:
+            self._rows[:0] = [_store_record(item) for item in self._history.read(0, 1)]
+        self._loaded += 1
+        self.endInsertRows()
+
+    def total_count(self):
+        """历史记录总数（包括尚未加载的条目）"""
+        if self._exhausted:
+            return self._loaded
+        return len(self._history)
+
+    def rowCount(self, parent=QModelIndex()):
+        if parent.isValid():
+            return 0
+        return self._loaded
+
+    def canFetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return False
+        return self._loaded < self.total_count()
+
+    def fetchMore(self, parent=QModelIndex()):
+        if parent.isValid():
+            return
+        # 先读取这一页，按实际读到的条数插入行
+        count = self._next_page()
+        if count <= 0:
+            return
+        self.beginInsertRows(QModelIndex(), self._loaded, self._loaded + count - 1)
+        self._loaded += count
+        self.endInsertRows()
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid() or not 0 <= index.row() < self._loaded:
+            return None
+        # 第0行对应最新的记录
+        if self._rows is not None:
+            record = self._rows[index.row()]
+        else:
+            record = self._history[len(self._history) - 1 - index.row()]
+        if role == Qt.ItemDataRole.DisplayRole:
+            return record
+        if role == ExpressionRole:
+            return split_record(record)[0]
+        if role == ResultRole:
+            return split_record(record)[1]
+        return None
+
+
+class HistoryItemDelegate(QStyledItemDelegate):
+    """把一条历史记录绘制为卡片：表达式、结果和复制按钮"""
+
+    ROW_HEIGHT = 112
+    COPY_WIDTH = 56
+    COPY_HEIGHT = 28
+
+    def __init__(self, parent=None):
+        super().__init__(parent)
+        self._palette = HISTORY_PALETTES["light"]
+        self._expression_font = QFont()
+        self._expression_font.setPixelSize(14)
+        self._result_font = QFont()
+        self._result_font.setPixelSize(18)
+        self._result_font.setWeight(QFont.Weight.DemiBold)
+        self._copy_font = QFont()
+        self._copy_font.setPixelSize(12)
+
+    def set_theme(self, theme):
+        """设置配色主题 (light 或 dark)"""
+        self._palette = HISTORY_PALETTES[theme]
+
+    def sizeHint(self, option, index):
+        return QSize(option.rect.width(), self.ROW_HEIGHT)
+
+    def _card_rect(self, rect):
+        """卡片区域（行之间留出间距）"""
+        return rect.adjusted(4, 4, -4, -4)
+
+    def _copy_rect(self, rect):
+        """复制按钮区域"""
+        card = self._card_rect(rect)
+        return QRect(card.right() - 16 - self.COPY_WIDTH, card.bottom() - 12 - self.COPY_HEIGHT,
+                     self.COPY_WIDTH, self.COPY_HEIGHT)
+
+    def paint(self, painter, option, index):
+        palette = self._palette
+        hovered = bool(option.state & QStyle.StateFlag.State_MouseOver)
+        card = self._card_rect(option.rect)
+        inner = card.adjusted(16, 12, -16, -12)
+
+        painter.save()
+        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+
+        # 卡片背景
+        painter.setPen(QPen(QColor(palette["accent_color"])) if hovered else Qt.PenStyle.NoPen)
+        painter.setBrush(QColor(palette["card_hover_bg"] if hovered else palette["card_bg"]))
+        painter.drawRoundedRect(card, 8, 8)
+
+        # 表达式和结果，过长时省略显示
+        painter.setFont(self._expression_font)
+        painter.setPen(QColor(palette["text_secondary"]))
+        expression_rect = QRect(inner.left(), inner.top(), inner.width(), 20)
+        expression = painter.fontMetrics().elidedText(
+            index.data(ExpressionRole), Qt.TextElideMode.ElideRight, expression_rect.width())
+        painter.drawText(expression_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, expression)
+
+        painter.setFont(self._result_font)
+        painter.setPen(QColor(palette["text_primary"]))
+        result_rect = QRect(inner.left(), expression_rect.bottom() + 8, inner.width(), 26)
+        result = painter.fontMetrics().elidedText(
+            index.data(ResultRole), Qt.TextElideMode.ElideRight, result_rect.width())
+        painter.drawText(result_rect, Qt.AlignmentFlag.AlignLeft | Qt.AlignmentFlag.AlignVCenter, result)
+
+        # 复制按钮，悬停在卡片上时填充强调色
+        copy_rect = self._copy_rect(option.rect)
+        painter.setPen(QPen(QColor(palette["accent_color"])))
+        painter.setBrush(QColor(palette["accent_color"]) if hovered else Qt.BrushStyle.NoBrush)
+        painter.drawRoundedRect(copy_rect, 4, 4)
+        painter.setFont(self._copy_font)
+        painter.setPen(QColor("white") if hovered else QColor(palette["accent_color"]))
+        painter.drawText(copy_rect, Qt.AlignmentFlag.AlignCenter, "复制")
+
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        """点击复制按钮时把结果复制到剪贴板"""
+        if (event.type() == QEvent.Type.MouseButtonRelease
+                and event.button() == Qt.MouseButton.LeftButton
+                and self._copy_rect(option.rect).contains(event.position().toPoint())):
+            QApplication.clipboard().setText(index.data(ResultRole))
+            return True
+        return super().editorEvent(event, model, option, index)
+
+
+class HistoryDialog(QDialog):
+    """常驻的历史记录对话框"""
+
+    def __init__(self, history, parent=None):
+        """初始化对话框
+
+        Args:
+            history: 历史记录列表（按时间从旧到新）
+            parent: 父窗口
+        """
+        super().__init__(parent)
+        self.setWindowTitle("历史记录")
+        self.setMinimumSize(480, 640)
+        self._theme = None
+
+        self.model = HistoryListModel(history, parent=self)
+        self.delegate = HistoryItemDelegate(self)
+
+        # 创建主布局
+        main_layout = QVBoxLayout(self)
+        main_layout.setContentsMargins(20, 20, 20, 20)
+        main_layout.setSpacing(16)
+
+        # 创建标题标签
+        self.title_label = QLabel("今天")
+        main_layout.addWidget(self.title_label, alignment=Qt.AlignmentFlag.AlignLeft)
+
+        # 列表视图：所有行高度相同，只绘制可见的行
+        self.list_view = QListView()
+        self.list_view.setModel(self.model)
+        self.list_view.setItemDelegate(self.delegate)
+        self.list_view.setUniformItemSizes(True)
+        self.list_view.setMouseTracking(True)
+        self.list_view.setVerticalScrollMode(QAbstractItemView.ScrollMode.ScrollPerPixel)
+        self.list_view.setSelectionMode(QAbstractItemView.SelectionMode.NoSelection)
+        self.list_view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        main_layout.addWidget(self.list_view, 1)  # 1表示伸展系数
+
+        # 没有历史记录时的提示
+        self.empty_label = QLabel("📋\n\n暂无计算历史\n\n进行计算后，历史记录将显示在这里")
+        self.empty_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
+        main_layout.addWidget(self.empty_label, 1)
+
+        # 创建底部布局
+        bottom_layout = QHBoxLayout()
+        self.count_label = QLabel()
+        bottom_layout.addWidget(self.count_label)
+        bottom_layout.addStretch()
+
+        # 清空按钮，由主窗口连接确认流程
+        self.clear_button = QPushButton("清空历史")
+        self.clear_button.setFixedHeight(32)
+        bottom_layout.addWidget(self.clear_button)
+        main_layout.addLayout(bottom_layout)
+
+        self.model.modelReset.connect(self._update_summary)
+        self.model.rowsInserted.connect(self._update_summary)
+        self._update_summary()
+
+    def set_theme(self, theme):
+        """应用配色主题，主题未变化时不重新设置样式"""
+        if theme == self._theme:
+            return
+        self._theme = theme
+        palette = HISTORY_PALETTES[theme]
+        self.delegate.set_theme(theme)
+        self.setStyleSheet(f"QDialog {{ background-color: {palette['dialog_bg']}; color: {palette['text_primary']}; border-radius: 8px; border: 1px solid {palette['card_hover_bg']}; }}")
+        self.title_label.setStyleSheet(f"color: {palette['text_secondary']}; font-size: 14px; font-weight: 500; margin-bottom: 8px;")
+        self.empty_label.setStyleSheet(f"color: {palette['text_secondary']}; font-size: 14px;")
+        self.count_label.setStyleSheet(f"color: {palette['text_secondary']}; font-size: 12px;")
+        self.list_view.setStyleSheet(f"""
+            QListView {{ background-color: transparent; border: none; }}
+            QScrollBar:vertical {{
+                background-color: transparent;
+                width: 8px;
+                margin: 0 0 0 0;
+            }}
+            QScrollBar::handle:vertical {{
+                background-color: {palette['text_secondary']};
+                border-radius: 4px;
+                min-height: 20px;
+            }}
+            QScrollBar::handle:vertical:hover {{
+                background-color: {palette['text_primary']};
+            }}
+            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{
+                height: 0px;
+                width: 0px;
+            }}
+        """)
+        self.clear_button.setStyleSheet(f"""
+            QPushButton {{
+                background-color: transparent;
+                color: {palette['danger_color']};
+                border: 1px solid {palette['danger_color']};
+                border-radius: 4px;
+                padding: 0 12px;
+                font-size: 14px;
+            }}
+            QPushButton:hover {{
+                background-color: {palette['danger_color']};
+                color: white;
+            }}
+        """)
+        self.list_view.viewport().update()
+
+    def _update_summary(self):
+        """更新记录数量和空状态提示"""
+        total = self.model.total_count()
+        self.count_label.setText(f"共 {total} 条记录")
+        self.list_view.setVisible(total > 0)
+        self.empty_label.setVisible(total == 0)
+        self.clear_button.setEnabled(total > 0)
@@ -7,20 +7,24 @@ parent_dir = os.path.dirname(os.path.dirname(current_dir))
 if parent_dir not in sys.path:
     sys.path.append(parent_dir)
 
-import re
 from PyQt6.QtWidgets import (
-    QApplication, QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
+    QMainWindow, QWidget, QVBoxLayout, QHBoxLayout, QGridLayout,
     QPushButton, QLineEdit, QTabWidget, QLabel, QMessageBox,
-    QMenuBar, QMenu, QComboBox, QDialog, QScrollArea, QFrame, QSpacerItem, QSizePolicy
+    QComboBox, QDialog, QSpacerItem, QSizePolicy, QCheckBox
 )
-from PyQt6.QtCore import Qt, pyqtSignal, QPropertyAnimation, QTimer
-from PyQt6.QtGui import QIcon, QFont, QAction
-import math
+from PyQt6.QtCore import Qt, QPropertyAnimation, QTimer
+from PyQt6.QtGui import QAction
 from calculator.core.arithmetic import ArithmeticCalculator
 from calculator.core.scientific import ScientificCalculator
 from calculator.core.unit_converter import UnitConverter
 from calculator.core.base_converter import BaseConverter
 from calculator.data.config_manager import ConfigManager
+from calculator.startup_profile import StartupProfiler
+from calculator.ui.preview_worker import PreviewScheduler
+from calculator.ui.style_registry import StyleRegistry
+
+# 阶乘结果超过这个位数时显示科学计数法近似值，不计算精确值，避免界面长时间无响应
+FACTORIAL_DISPLAY_DIGITS = 1000
 
 class CalculatorMainWindow(QMainWindow):
     """计算器主窗口类"""
@@ -41,59 +45,77 @@ class CalculatorMainWindow(QMainWindow):
         self.current_operation = None  # 当前操作
         self.first_operand = 0  # 第一个操作数
         self.history = []  # 计算历史
+        self._preview_schedulers = {}  # 每个输入框的后台预览调度器
+        self._history_dialog = None  # 常驻的历史记录对话框，首次打开时创建
+        
+        # 显示区域样式注册表，缓存样式表并避免重复setStyleSheet
+        self.style_registry = StyleRegistry()
         
         # 保存主题切换信号接收者引用
         self.theme_changed_handler = None
         
         # 先加载配置，设置正确的主题状态
-        config_manager = ConfigManager()
+        config_manager = ConfigManager.shared()
         theme = config_manager.get_theme()
         # 当前主题模式
         self.is_dark_theme = (theme == "dark")
+        # 数值模式（float 或 fraction）及精确模式的结果显示方式（fraction 或 decimal）
+        self.number_mode = config_manager.get_number_mode()
+        self.fraction_display = config_manager.get_fraction_display()
         
         # 在设置了正确的主题状态后再初始化UI
         self.init_ui()
     
     def init_ui(self):
         """初始化用户界面"""
+        profiler = StartupProfiler.shared()
+        
         # 创建中央部件和主布局
         central_widget = QWidget()
         self.setCentralWidget(central_widget)
         main_layout = QVBoxLayout(central_widget)
         
         # 创建菜单栏
-        self.create_menu_bar()
+        with profiler.phase("创建菜单栏"):
+            self.create_menu_bar()
         
         # 创建选项卡控件
         self.tabs = QTabWidget()
         
-        # 添加基本计算器选项卡
+        # 各选项卡先添加空的占位控件，界面在第一次切换到该选项卡时才创建
         self.basic_calc_widget = QWidget()
-        self.create_basic_calculator_ui(self.basic_calc_widget)
-        self.tabs.addTab(self.basic_calc_widget, "基本计算")
-        
-        # 添加科学计算器选项卡
         self.scientific_calc_widget = QWidget()
-        self.create_scientific_calculator_ui(self.scientific_calc_widget)
-        self.tabs.addTab(self.scientific_calc_widget, "科学计算")
-        
-        # 添加单位换算选项卡
         self.unit_converter_widget = QWidget()
-        self.create_unit_converter_ui(self.unit_converter_widget)
-        self.tabs.addTab(self.unit_converter_widget, "单位换算")
-        
-        # 添加进制转换选项卡
         self.base_converter_widget = QWidget()
-        self.create_base_converter_ui(self.base_converter_widget)
+        self.programmer_widget = QWidget()
+        # 选项卡索引 -> (占位控件, 界面创建函数)
+        self._tab_builders = {
+            0: (self.basic_calc_widget, self.create_basic_calculator_ui),
+            1: (self.scientific_calc_widget, self.create_scientific_calculator_ui),
+            2: (self.unit_converter_widget, self.create_unit_converter_ui),
+            3: (self.base_converter_widget, self.create_base_converter_ui),
+            4: (self.programmer_widget, self.create_programmer_ui)
+        }
+        self._built_tabs = set()  # 已创建界面的选项卡索引
+        
+        self.tabs.addTab(self.basic_calc_widget, "基本计算")
+        self.tabs.addTab(self.scientific_calc_widget, "科学计算")
+        self.tabs.addTab(self.unit_converter_widget, "单位换算")
         self.tabs.addTab(self.base_converter_widget, "进制转换")
+        self.tabs.addTab(self.programmer_widget, "程序员")
+        
+        # 只创建启动时显示的选项卡
+        with profiler.phase("创建当前选项卡"):
+            self._ensure_tab_built(self.tabs.currentIndex())
         
         main_layout.addWidget(self.tabs)
         
-        # 连接标签页切换信号，确保输入框获得焦点时能响应回车键
+        # 连接标签页切换信号，创建尚未创建的选项卡，并确保输入框获得焦点时能响应回车键
         self.tabs.currentChanged.connect(self._on_tab_changed)
         
         # 在创建完UI后立即应用当前主题样式
-        self.update_theme(self.is_dark_theme)
+        with profiler.phase("应用显示区域样式"):
+            self.update_theme(self.is_dark_theme)
     
     def create_menu_bar(self):
         """创建菜单栏"""
@@ -128,6 +150,21 @@ class CalculatorMainWindow(QMainWindow):
         dark_theme_action.triggered.connect(lambda: self.on_theme_changed("dark"))
         theme_menu.addAction(dark_theme_action)
         
+        # 数值模式子菜单
+        number_menu = settings_menu.addMenu("数值模式")
+        number_modes = [
+            ("浮点数", "float", None),
+            ("精确分数（显示分数）", "fraction", "fraction"),
+            ("精确分数（按精度显示小数）", "fraction", "decimal"),
+            ("十进制高精度（按精度的有效数字）", "decimal", None)
+        ]
+        for title, mode, fraction_display in number_modes:
+            action = QAction(title, self)
+            action.triggered.connect(
+                lambda checked, m=mode, d=fraction_display: self.on_number_mode_changed(m, d)
+            )
+            number_menu.addAction(action)
+        
         # 帮助菜单
         help_menu = menu_bar.addMenu("帮助")
         
@@ -188,6 +225,97 @@ class CalculatorMainWindow(QMainWindow):
         button.clicked.connect(lambda checked, t=text: self.on_basic_button_clicked(t, display, converter_type))
         return button
     
+    def on_number_mode_changed(self, mode, fraction_display=None):
+        """切换数值模式并保存到配置
+        
+        Args:
+            mode: 数值模式 (float 或 fraction)
+            fraction_display: 精确模式的结果显示方式 (fraction 或 decimal)，为None时不修改
+        """
+        config_manager = ConfigManager.shared()
+        with config_manager.batch():
+            config_manager.set_number_mode(mode)
+            if fraction_display is not None:
+                config_manager.set_fraction_display(fraction_display)
+        self.number_mode = mode
+        if fraction_display is not None:
+            self.fraction_display = fraction_display
+        
+        # 实时预览也改用新的数值类型和上下文
+        number = self._number_type()
+        context = self._preview_context()
+        for scheduler in self._preview_schedulers.values():
+            scheduler.set_number(number, context)
+    
+    def _number_type(self):
+        """当前数值模式下把数字文本转换为数值的函数，None表示int/float"""
+        # fractions 和 decimal 只在使用对应模式时导入
+        if self.number_mode == "fraction":
+            from calculator.core.exact import EXACT_NUMBER
+            return EXACT_NUMBER
+        if self.number_mode == "decimal":
+            from calculator.core.decimal_context import parse_decimal
+            return parse_decimal
+        return None
+    
+    def _preview_context(self):
+        """实时预览在其中计算的数值上下文：十进制模式与"="使用同一精度，其他模式为None"""
+        return self._decimal_context() if self.number_mode == "decimal" else None
+    
+    def _decimal_context(self):
+        """十进制模式使用的上下文，精度为配置中的有效数字位数"""
+        return self.scientific_calc.decimal_context(max(1, ConfigManager.shared().get_precision()))
+    
+    def _scientific_calculators(self):
+        """当前数值模式下的 (科学函数计算器, 乘方开方计算器)"""
+        if self.number_mode == "decimal":
+            context = self._decimal_context()
+            return context, context
+        return self.scientific_calc, self.arithmetic_calc
+    
+    def _factorial(self, value):
+        """计算阶乘：结果不超过 FACTORIAL_DISPLAY_DIGITS 位时返回精确值，否则返回科学计数法近似值"""
+        from calculator.core.factorial import factorial_digits, factorial_scientific
+        n = int(value)
+        if factorial_digits(n) > FACTORIAL_DISPLAY_DIGITS:
+            return factorial_scientific(n)
+        return self.arithmetic_calc.factorial(n)
+    
+    def _evaluate(self, expression):
+        """按当前数值模式计算表达式，自动补全未闭合的括号"""
+        if self.number_mode == "fraction":
+            return self.arithmetic_calc.evaluate_exact(expression, auto_close=True)
+        if self.number_mode == "decimal":
+            return self._decimal_context().evaluate(expression, auto_close=True)
+        return self.arithmetic_calc.evaluate_expression(expression, auto_close=True)
+    
+    def _format_result(self, result):
+        """格式化计算结果
+        
+        浮点数的整数值去掉末尾的.0；精确模式的结果显示为分数，或按配置的精度舍入为小数；
+        十进制模式的结果按配置的有效数字位数舍入，并去掉末尾的0。
+        
+        Args:
+            result: 计算结果
+            
+        Returns:
+            用于显示的结果
+        """
+        # 已经格式化的结果（如阶乘的近似值）原样显示
+        if isinstance(result, str):
+            return result
+        if isinstance(result, float):
+            return int(result) if result.is_integer() else result
+        if self.number_mode == "decimal":
+            from calculator.core.decimal_context import format_decimal
+            context = self._decimal_context()
+            return format_decimal(context.round(context.to_decimal(result)))
+        if self.number_mode == "fraction":
+            from calculator.core.exact import format_fraction
+            precision = ConfigManager.shared().get_precision() if self.fraction_display == "decimal" else None
+            return format_fraction(result, precision)
+        return result
+    
     def on_theme_changed(self, theme_name):
         """处理主题切换事件
         
@@ -317,88 +445,37 @@ class CalculatorMainWindow(QMainWindow):
         if hasattr(self, 'scientific_expression_history'):
             self._update_scientific_display_styles()
         
-        # 更新单位换算器和进制转换器界面样式
-        # 检查tab_widget是否已经创建
-        if hasattr(self, 'tab_widget'):
-            current_index = self.tab_widget.currentIndex()
-            # 重新创建单位换算器UI（如果当前在该标签页或已初始化过）
-            if (current_index == 2 or hasattr(self, 'unit_converter_widget')) and \
-               hasattr(self, 'create_unit_converter_ui') and \
-               hasattr(self, 'unit_converter_widget'):
-                self.create_unit_converter_ui(self.unit_converter_widget)
-            # 重新创建进制转换器UI（如果当前在该标签页或已初始化过）
-            if (current_index == 3 or hasattr(self, 'base_converter_widget')) and \
-               hasattr(self, 'create_base_converter_ui') and \
-               hasattr(self, 'base_converter_widget'):
-                self.create_base_converter_ui(self.base_converter_widget)
+        # 更新程序员模式界面样式
+        if hasattr(self, 'programmer_input'):
+            self._update_programmer_styles()
+        
+        # 更新已创建的历史记录对话框样式
+        if self._history_dialog is not None:
+            self._history_dialog.set_theme(self._theme_name())
     
     def _update_display_styles(self):
         """更新基本计算器显示区域样式"""
-        if self.is_dark_theme:
-            # 深色主题样式
-            bg_color = "#3a3a3a"
-            text_color = "#ffffff"
-            text_color_secondary = "#cccccc"
-        else:
-            # 浅色主题样式
-            bg_color = "#ffffff"
-            text_color = "#000000"
-            text_color_secondary = "#666666"
-        
-        # 统一使用透明边框
-        border_color = "transparent"
-        
-        # 历史显示区域 - 透明边框
-        self.expression_history.setStyleSheet(
-            f"font-size: 16px; color: {text_color_secondary}; padding: 5px; "
-            f"background-color: {bg_color}; border: 1px solid {border_color};"
-        )
-        
-        # 表达式输入区域 - 透明边框
-        self.display.setStyleSheet(
-            f"font-size: 24px; color: {text_color}; padding: 5px; "
-            f"background-color: {bg_color}; border: 1px solid {border_color};"
-        )
-        
-        # 预计算结果显示区域 - 透明边框
-        self.pre_result_display.setStyleSheet(
-            f"font-size: 18px; color: {text_color_secondary}; padding: 5px; "
-            f"background-color: {bg_color}; border: 1px solid {border_color};"
-        )
+        self._apply_display_styles(self.expression_history, self.display, self.pre_result_display)
     
     def _update_scientific_display_styles(self):
         """更新科学计算器显示区域样式"""
-        if self.is_dark_theme:
-            # 深色主题样式
-            bg_color = "#3a3a3a"  # 中性灰色背景
-            text_color = "#ffffff"
-            text_color_secondary = "#cccccc"
-        else:
-            # 浅色主题样式
-            bg_color = "#ffffff"
-            text_color = "#000000"
-            text_color_secondary = "#666666"
-        
-        # 统一使用透明边框
-        border_color = "transparent"
-        
-        # 科学计算器显示区域样式
-        self.scientific_expression_history.setStyleSheet(
-            f"font-size: 16px; color: {text_color_secondary}; padding: 5px; "
-            f"background-color: {bg_color}; border: 1px solid {border_color};"
-        )
-        
-        self.scientific_display.setStyleSheet(
-            f"font-size: 24px; color: {text_color}; padding: 5px; "
-            f"background-color: {bg_color}; border: 1px solid {border_color};"
-        )
-        
-        # 预处理文本框 - 透明边框
-        self.scientific_pre_result_display.setStyleSheet(
-            f"font-size: 18px; color: {text_color_secondary}; padding: 5px; "
-            f"background-color: {bg_color}; border: 1px solid {border_color};"
+        self._apply_display_styles(
+            self.scientific_expression_history,
+            self.scientific_display,
+            self.scientific_pre_result_display
         )
     
+    def _apply_display_styles(self, history_display, display, pre_result_display):
+        """应用显示区域样式，样式表由注册表缓存，未变化时不会重复设置"""
+        theme = self._theme_name()
+        self.style_registry.apply(history_display, "history", theme)
+        self.style_registry.apply(display, "input", theme)
+        self.style_registry.apply(pre_result_display, "pre_result", theme)
+    
+    def _theme_name(self):
+        """当前主题名称 (light 或 dark)"""
+        return "dark" if self.is_dark_theme else "light"
+    
     def create_basic_calculator_ui(self, parent_widget):
         """创建基本计算器界面"""
         layout = QVBoxLayout(parent_widget)
@@ -430,29 +507,6 @@ class CalculatorMainWindow(QMainWindow):
         # 设置初始样式
         self._update_display_styles()
         
-        # 立即应用深色主题样式（如果当前是深色主题）
-        if self.is_dark_theme:
-            bg_color = "#3a3a3a"
-            text_color = "#ffffff"
-            text_color_secondary = "#cccccc"
-            
-            # 直接设置各个文本框的样式，统一使用透明边框
-            self.expression_history.setStyleSheet(
-                f"font-size: 16px; color: {text_color_secondary}; padding: 5px; "
-                f"background-color: {bg_color}; border: 1px solid transparent;"
-            )
-            
-            self.display.setStyleSheet(
-                f"font-size: 24px; color: {text_color}; padding: 5px; "
-                f"background-color: {bg_color}; border: 1px solid transparent;"
-            )
-            
-            # 预处理文本框使用透明边框
-            self.pre_result_display.setStyleSheet(
-                f"font-size: 18px; color: {text_color_secondary}; padding: 5px; "
-                f"background-color: {bg_color}; border: 1px solid transparent;"
-            )
-        
         # 创建按钮网格布局
         grid_layout = QGridLayout()
         
@@ -526,29 +580,6 @@ class CalculatorMainWindow(QMainWindow):
         # 设置初始样式
         self._update_scientific_display_styles()
         
-        # 立即应用深色主题样式（如果当前是深色主题）
-        if self.is_dark_theme:
-            bg_color = "#3a3a3a"
-            text_color = "#ffffff"
-            text_color_secondary = "#cccccc"
-            
-            # 直接设置各个文本框的样式，统一使用透明边框
-            self.scientific_expression_history.setStyleSheet(
-                f"font-size: 16px; color: {text_color_secondary}; padding: 5px; "
-                f"background-color: {bg_color}; border: 1px solid transparent;"
-            )
-            
-            self.scientific_display.setStyleSheet(
-                f"font-size: 24px; color: {text_color}; padding: 5px; "
-                f"background-color: {bg_color}; border: 1px solid transparent;"
-            )
-            
-            # 预处理文本框使用透明边框
-            self.scientific_pre_result_display.setStyleSheet(
-                f"font-size: 18px; color: {text_color_secondary}; padding: 5px; "
-                f"background-color: {bg_color}; border: 1px solid transparent;"
-            )
-        
         # 创建科学函数按钮区域
         scientific_buttons_layout = QGridLayout()
         
@@ -859,7 +890,7 @@ class CalculatorMainWindow(QMainWindow):
         
         # 源进制
         self.from_base_combo = QComboBox()
-        self.from_base_combo.addItems(["二进制 (2)", "八进制 (8)", "十进制 (10)", "十六进制 (16)"])
+        self._add_base_items(self.from_base_combo)
         self.from_base_combo.setMinimumHeight(36)
         self.from_base_combo.setStyleSheet(f"""
             QComboBox {{
@@ -902,7 +933,7 @@ class CalculatorMainWindow(QMainWindow):
         
         # 目标进制
         self.to_base_combo = QComboBox()
-        self.to_base_combo.addItems(["二进制 (2)", "八进制 (8)", "十进制 (10)", "十六进制 (16)"])
+        self._add_base_items(self.to_base_combo)
         self.to_base_combo.setMinimumHeight(36)
         self.to_base_combo.setStyleSheet(f"""
             QComboBox {{
@@ -937,6 +968,7 @@ class CalculatorMainWindow(QMainWindow):
         input_label.setStyleSheet(f"color: {text_primary}; font-size: 14px; font-weight: 500;")
         
         self.input_number = QLineEdit()
+        self.input_number.setPlaceholderText("整数或小数，如 1A.8、0.(3)")
         self.input_number.setMinimumHeight(40)
         self.input_number.setStyleSheet(f"""
             QLineEdit {{
@@ -983,11 +1015,195 @@ class CalculatorMainWindow(QMainWindow):
         number_layout.addLayout(output_layout)
         layout.addLayout(number_layout)
         
+        # 结果分组显示：二进制和十六进制每4位一组，其他进制每3位一组
+        self.group_digits_check = QCheckBox("数字分组")
+        self.group_digits_check.setStyleSheet(f"color: {text_primary}; font-size: 14px;")
+        self.group_digits_check.toggled.connect(self.convert_base)
+        layout.addWidget(self.group_digits_check)
+        
         # 添加额外的底部间距
         layout.addItem(QSpacerItem(0, 8, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Fixed))
     
+    def create_programmer_ui(self, parent_widget):
+        """创建程序员模式界面：选择字长、符号和输入进制，输入位运算表达式，结果同时显示为各进制"""
+        # 程序员模式的计算引擎在第一次打开该选项卡时才导入
+        from calculator.core.programmer import WORD_SIZES, ProgrammerCalculator
+        
+        if not hasattr(self, 'programmer_calc'):
+            self.programmer_calc = ProgrammerCalculator()
+        
+        layout = QVBoxLayout(parent_widget)
+        layout.setSpacing(12)
+        layout.setContentsMargins(16, 16, 16, 16)
+        
+        # 字长、符号和输入进制
+        options_layout = QHBoxLayout()
+        options_layout.setSpacing(12)
+        self.word_size_combo = QComboBox()
+        for word_size in WORD_SIZES:
+            self.word_size_combo.addItem(f"{word_size}位", word_size)
+        self.word_size_combo.setCurrentIndex(self.word_size_combo.findData(self.programmer_calc.word_size))
+        self.signed_combo = QComboBox()
+        self.signed_combo.addItem("有符号", True)
+        self.signed_combo.addItem("无符号", False)
+        self.signed_combo.setCurrentIndex(self.signed_combo.findData(self.programmer_calc.signed))
+        self.programmer_base_combo = QComboBox()
+        for base in (16, 10, 8, 2):
+            self.programmer_base_combo.addItem(self.base_converter.base_name(base), base)
+        for combo in (self.word_size_combo, self.signed_combo, self.programmer_base_combo):
+            combo.setMinimumHeight(36)
+            options_layout.addWidget(combo, 1)
+        self.word_size_combo.currentIndexChanged.connect(self.on_programmer_word_changed)
+        self.signed_combo.currentIndexChanged.connect(self.on_programmer_word_changed)
+        layout.addLayout(options_layout)
+        
+        # 表达式输入和计算按钮
+        input_layout = QHBoxLayout()
+        input_layout.setSpacing(12)
+        self.programmer_input = QLineEdit()
+        self.programmer_input.setPlaceholderText("如 (0xF0 | 0b1010) << 2、0x81 rol 3、~0 ^ 0xFF")
+        self.programmer_input.setMinimumHeight(40)
+        self.programmer_input.returnPressed.connect(self.calculate_programmer)
+        self.programmer_calculate_button = QPushButton("计算")
+        self.programmer_calculate_button.setMinimumHeight(40)
+        self.programmer_calculate_button.clicked.connect(self.calculate_programmer)
+        input_layout.addWidget(self.programmer_input, 1)
+        input_layout.addWidget(self.programmer_calculate_button)
+        layout.addLayout(input_layout)
+        
+        # 结果同时显示为16、10、8、2进制
+        grid = QGridLayout()
+        grid.setHorizontalSpacing(12)
+        grid.setVerticalSpacing(8)
+        self.programmer_outputs = {}
+        self.programmer_labels = []
+        for row, (base, label_text) in enumerate(((16, "HEX"), (10, "DEC"), (8, "OCT"), (2, "BIN"))):
+            label = QLabel(label_text)
+            output = QLineEdit()
+            output.setReadOnly(True)
+            output.setMinimumHeight(32)
+            grid.addWidget(label, row, 0)
+            grid.addWidget(output, row, 1)
+            self.programmer_labels.append(label)
+            self.programmer_outputs[base] = output
+        layout.addLayout(grid)
+        
+        layout.addItem(QSpacerItem(0, 0, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Expanding))
+        self._programmer_value = None
+        
+        # 设置初始样式，切换主题时由 update_theme 重新设置
+        self._update_programmer_styles()
+    
+    def _update_programmer_styles(self):
+        """按当前主题设置程序员模式界面的样式"""
+        # 根据当前主题设置颜色方案（与进制转换界面一致）
+        if self.is_dark_theme:
+            bg_color = "#2d2d2d"
+            card_bg = "#3a3a3a"
+            text_primary = "#ffffff"
+            border_color = "#4a4a4a"
+            accent_color = "#0078d4"
+            accent_hover = "#106ebe"
+            input_bg = "#333333"
+            disabled_bg = "#303030"
+        else:
+            bg_color = "#f3f3f3"
+            card_bg = "#ffffff"
+            text_primary = "#1a1a1a"
+            border_color = "#e0e0e0"
+            accent_color = "#0078d7"
+            accent_hover = "#106ebe"
+            input_bg = "#ffffff"
+            disabled_bg = "#f3f3f3"
+        
+        self.programmer_widget.setStyleSheet(f"background-color: {bg_color};")
+        combo_style = f"""
+            QComboBox {{
+                background-color: {card_bg};
+                color: {text_primary};
+                border: 1px solid {border_color};
+                border-radius: 4px;
+                padding: 0 12px;
+                font-size: 14px;
+            }}
+            QComboBox::drop-down {{
+                border: none;
+                subcontrol-origin: padding;
+                subcontrol-position: top right;
+                width: 25px;
+            }}
+        """
+        for combo in (self.word_size_combo, self.signed_combo, self.programmer_base_combo):
+            combo.setStyleSheet(combo_style)
+        self.programmer_input.setStyleSheet(f"""
+            QLineEdit {{
+                background-color: {input_bg};
+                color: {text_primary};
+                border: 1px solid {border_color};
+                border-radius: 4px;
+                padding: 0 12px;
+                font-size: 16px;
+            }}
+            QLineEdit:focus {{
+                border-color: {accent_color};
+                outline: none;
+            }}
+        """)
+        self.programmer_calculate_button.setStyleSheet(f"""
+            QPushButton {{
+                background-color: {accent_color};
+                color: white;
+                border: none;
+                border-radius: 4px;
+                font-size: 14px;
+                font-weight: 500;
+                padding: 0 20px;
+            }}
+            QPushButton:hover {{
+                background-color: {accent_hover};
+            }}
+            QPushButton:pressed {{
+                background-color: #005a9e;
+            }}
+        """)
+        label_style = f"color: {text_primary}; font-size: 14px; font-weight: 500;"
+        for label in self.programmer_labels:
+            label.setStyleSheet(label_style)
+        output_style = f"""
+            QLineEdit {{
+                background-color: {disabled_bg};
+                color: {text_primary};
+                border: 1px solid {border_color};
+                border-radius: 4px;
+                padding: 0 8px;
+                font-family: Consolas, "Courier New", monospace;
+                font-size: 13px;
+            }}
+        """
+        for output in self.programmer_outputs.values():
+            output.setStyleSheet(output_style)
+    
+    def _ensure_tab_built(self, index):
+        """第一次用到某个选项卡时创建它的界面
+        
+        Args:
+            index: 选项卡索引
+        
+        Returns:
+            是否在本次调用中创建了界面
+        """
+        if index in self._built_tabs or index not in self._tab_builders:
+            return False
+        self._built_tabs.add(index)
+        widget, builder = self._tab_builders[index]
+        builder(widget)
+        return True
+    
     def _on_tab_changed(self, index):
         """标签页切换时的处理"""
+        # 占位的选项卡在第一次切换到时创建界面
+        self._ensure_tab_built(index)
+        
         # 确保当前活动标签页的输入框获得焦点
         if index == 0:  # 基本计算
             self.display.setFocus()
@@ -1022,98 +1238,64 @@ class CalculatorMainWindow(QMainWindow):
             display.blockSignals(False)
             text = new_text
         
-        # 确保文本立即可见
-        display.repaint()
-        
         # 显示预计算结果
         self._update_pre_result(text, display)
     
     def _update_pre_result(self, text, display):
-        """更新预计算结果显示"""
+        """更新预计算结果显示
+        
+        计算在后台线程中进行，连续按键经过防抖合并，结果由_show_pre_result显示
+        """
         # 确定要使用的预结果显示控件
         if display == self.display:
             pre_result_display = self.pre_result_display
         else:
             pre_result_display = self.scientific_pre_result_display
         
+        scheduler = self._preview_schedulers.get(display)
+        if scheduler is None:
+            scheduler = PreviewScheduler(number=self._number_type(), context=self._preview_context(), parent=self)
+            scheduler.result_ready.connect(
+                lambda result, target=pre_result_display: self._show_pre_result(target, result)
+            )
+            self._preview_schedulers[display] = scheduler
+        
         # 只有在表达式看起来完整时才计算（包含运算符和数字）
         if not text or len(text) < 3:
+            scheduler.cancel()
             pre_result_display.setText("")
             return
         
         # 检查是否包含基本运算符
         if not any(op in text for op in ['+', '-', '×', '÷']):
+            scheduler.cancel()
             pre_result_display.setText("")
             return
         
-        try:
-            # 自动补全未闭合的括号
-            expression = text
-            open_brackets = expression.count('(')
-            close_brackets = expression.count(')')
-            if open_brackets > close_brackets:
-                expression += ')' * (open_brackets - close_brackets)
-            
-            # 预处理表达式，替换×为*，÷为/
-            processed_expression = expression.replace('×', '*').replace('÷', '/')
-            
-            # 处理隐式乘法
-            processed_expression = re.sub(r'([0-9\)])\s*\(', r'\1*(', processed_expression)
-            processed_expression = re.sub(r'\)\s*([0-9])', r')*\1', processed_expression)
-            
-            # 尝试计算预结果
-            result = self.arithmetic_calc.evaluate_expression(processed_expression)
-            
-            # 格式化结果
-            if isinstance(result, float) and result.is_integer():
-                result = int(result)
-            
-            # 保存新的结果文本
-            new_text = str(result)
-            
-            # 直接更新文本，确保显示正常
-            pre_result_display.setText(new_text)
-            # 根据当前主题设置适当的样式
-            if self.is_dark_theme:
-                # 深色主题样式
-                bg_color = "#3a3a3a"
-                text_color = "#cccccc"
-            else:
-                # 浅色主题样式
-                bg_color = "#ffffff"
-                text_color = "#666666"
-            
-            # 统一使用透明边框
-            border_color = "transparent"
-            
-            # 确保文本可见的样式
-            pre_result_display.setStyleSheet(
-                f"font-size: 18px; color: {text_color}; padding: 5px; "
-                f"background-color: {bg_color}; border: 1px solid {border_color};"
-            )
-        except:
+        # 增量求值：只重新处理文本中变化的部分，自动补全未闭合的括号
+        scheduler.request(text)
+    
+    def _show_pre_result(self, pre_result_display, result):
+        """显示后台计算得到的预结果，计算失败时result为None"""
+        if result is None:
             # 如果计算失败，直接清空
             pre_result_display.setText("")
+            return
+        
+        # 格式化结果
+        result = self._format_result(result)
+        
+        # 直接更新文本，确保显示正常；样式未变化时注册表不会重新设置
+        pre_result_display.setText(str(result))
+        self.style_registry.apply(pre_result_display, "pre_result", self._theme_name())
     
     def _animate_widget(self, widget, duration, target_alpha, on_finished=None):
         """通用的控件设置函数 - 简化版以确保显示正常"""
-        # 直接设置样式，确保文本始终可见
-        import re
-        current_style = widget.styleSheet()
-        font_size_match = re.search(r'font-size:\s*(\d+)px', current_style)
-        font_size = font_size_match.group(1) if font_size_match else '16'
-        
-        # 根据控件类型和当前主题设置适当的样式，统一使用透明边框
-        if 'pre_result' in str(widget) or ('pre_result' in widget.__class__.__name__):
-            if self.is_dark_theme:
-                widget.setStyleSheet(f"font-size: {font_size}px; color: #cccccc; padding: 5px; background-color: #3a3a3a; border: 1px solid transparent;")
-            else:
-                widget.setStyleSheet(f"font-size: {font_size}px; color: #666666; padding: 5px; background-color: #ffffff; border: 1px solid transparent;")
-        else:
-            if self.is_dark_theme:
-                widget.setStyleSheet(f"font-size: {font_size}px; color: #ffffff; padding: 5px; background-color: #3a3a3a; border: 1px solid transparent;")
-            else:
-                widget.setStyleSheet(f"font-size: {font_size}px; color: #000000; padding: 5px; background-color: #ffffff; border: 1px solid transparent;")
+        # 按控件上次应用的角色和字体大小重新应用当前主题的样式，确保文本始终可见
+        applied = self.style_registry.applied_style(widget)
+        if applied is not None:
+            role, _, font_size = applied
+            self.style_registry.apply(widget, role, self._theme_name(), font_size)
         
         # 如果有回调，直接调用
         if on_finished:
@@ -1121,16 +1303,11 @@ class CalculatorMainWindow(QMainWindow):
     
     def _animate_font_size(self, widget, duration, target_size, on_finished=None):
         """字体大小设置函数 - 简化版以确保显示正常"""
-        import re
-        current_style = widget.styleSheet()
-        
         # 直接设置新的字体大小
-        new_style = re.sub(
-            r'font-size:\s*(\d+)px',
-            f'font-size: {target_size}px',
-            current_style
-        )
-        widget.setStyleSheet(new_style)
+        applied = self.style_registry.applied_style(widget)
+        if applied is not None:
+            role = applied[0]
+            self.style_registry.apply(widget, role, self._theme_name(), target_size)
         
         # 如果有回调，直接调用
         if on_finished:
@@ -1160,35 +1337,8 @@ class CalculatorMainWindow(QMainWindow):
         # 直接显示计算结果
         display.setText(str(result))
         
-        # 先获取当前主题设置，然后更新样式
-        if self.is_dark_theme:
-            # 深色主题样式
-            bg_color = "#3a3a3a"
-            text_color = "#ffffff"
-            text_color_secondary = "#cccccc"
-        else:
-            # 浅色主题样式
-            bg_color = "#ffffff"
-            text_color = "#000000"
-            text_color_secondary = "#666666"
-        
-        # 直接设置历史区域样式，确保使用当前主题的背景色
-        history_display.setStyleSheet(
-            f"font-size: 16px; color: {text_color_secondary}; padding: 5px; "
-            f"background-color: {bg_color}; border: 1px solid transparent;"
-        )
-        
-        # 直接设置显示区域样式，确保使用当前主题的背景色
-        display.setStyleSheet(
-            f"font-size: 24px; color: {text_color}; padding: 5px; "
-            f"background-color: {bg_color}; border: 1px solid transparent;"
-        )
-        
-        # 直接设置预结果显示区域样式，使用透明边框
-        pre_result_display.setStyleSheet(
-            f"font-size: 18px; color: {text_color_secondary}; padding: 5px; "
-            f"background-color: {bg_color}; border: 1px solid transparent;"
-        )
+        # 确保使用当前主题的样式；样式未变化时注册表不会重新设置
+        self._apply_display_styles(history_display, display, pre_result_display)
         
         # 强制重绘以确保文本立即可见
         display.repaint()
@@ -1301,32 +1451,25 @@ class CalculatorMainWindow(QMainWindow):
                         # 如果不是有效数字，继续执行正常计算流程
                         pass
                 
-                # 自动补全未闭合的括号
+                # 使用算术计算器的evaluate_expression方法处理带括号的表达式
+                # 解析器直接支持×、÷和隐式乘法，如 2(3+4) 或 (3+4)(5+6)
+                result = self._evaluate(expression)
+                
+                # 历史记录中显示补全括号后的表达式
                 open_brackets = expression.count('(')
                 close_brackets = expression.count(')')
                 if open_brackets > close_brackets:
                     expression += ')' * (open_brackets - close_brackets)
                 
-                # 预处理表达式，替换×为*，÷为/，处理隐式乘法
-                processed_expression = expression.replace('×', '*').replace('÷', '/')
-                
-                # 处理隐式乘法，如 2(3+4) 或 (3+4)(5+6)
-                processed_expression = re.sub(r'([0-9\)])\s*\(', r'\1*(', processed_expression)
-                processed_expression = re.sub(r'\)\s*([0-9])', r')*\1', processed_expression)
-                
-                # 使用算术计算器的evaluate_expression方法处理带括号的表达式
-                result = self.arithmetic_calc.evaluate_expression(processed_expression)
-                
-                # 格式化结果，去除末尾的.0
-                if isinstance(result, float) and result.is_integer():
-                    result = int(result)
+                # 格式化结果，去除末尾的.0，精确模式显示为分数或按精度舍入
+                result = self._format_result(result)
                 
                 # 将表达式移到历史显示区域，结果显示在当前区域
                 self._move_expression_to_history(expression, result, display)
                 
                 # 添加到历史记录
                 history_item = f"{expression} = {result}"
-                self.history.append(history_item)
+                self._record_history(history_item)
                 
                 # 不清空标志，允许使用计算结果继续计算
                 # self.clear_flag = True  # 移除这行，避免清空表达式
@@ -1340,54 +1483,55 @@ class CalculatorMainWindow(QMainWindow):
         try:
             # 获取当前显示的值
             current_text = self.scientific_display.text()
+            # 十进制模式下科学函数和乘方、开方按配置的精度计算
+            scientific, arithmetic = self._scientific_calculators()
             
             # 特殊处理π和e按钮
             if button_text in ['pi', 'e']:
                 if button_text == 'pi':
-                    result = self.scientific_calc.pi()
+                    result = scientific.pi()
                 else:  # 'e'
-                    result = self.scientific_calc.e()
+                    result = scientific.e()
                 self.clear_flag = False  # 直接显示值，不清空
                 
                 # 显示结果
                 self.scientific_display.setText(str(result))
             else:
                 # 对于其他科学函数，需要先获取数值
-                value = float(current_text) if current_text else 0
+                value = self._display_value(current_text) if current_text else 0
                 result = 0
                 
                 if button_text == 'sin':
-                    result = self.scientific_calc.sin(value)
+                    result = scientific.sin(value)
                 elif button_text == 'cos':
-                    result = self.scientific_calc.cos(value)
+                    result = scientific.cos(value)
                 elif button_text == 'tan':
-                    result = self.scientific_calc.tan(value)
+                    result = scientific.tan(value)
                 elif button_text == 'asin':
-                    result = self.scientific_calc.asin(value)
+                    result = scientific.asin(value)
                 elif button_text == 'acos':
-                    result = self.scientific_calc.acos(value)
+                    result = scientific.acos(value)
                 elif button_text == 'atan':
-                    result = self.scientific_calc.atan(value)
+                    result = scientific.atan(value)
                 elif button_text == 'ln':
-                    result = self.scientific_calc.log(value)
+                    result = scientific.log(value)
                 elif button_text == 'log':
-                    result = self.scientific_calc.log10(value)
+                    result = scientific.log10(value)
                 elif button_text == '^2':
-                    result = self.arithmetic_calc.power(value, 2)
+                    result = arithmetic.power(value, 2)
                 elif button_text == '^3':
-                    result = self.arithmetic_calc.power(value, 3)
+                    result = arithmetic.power(value, 3)
                 elif button_text == 'sqrt':
-                    result = self.arithmetic_calc.square_root(value)
+                    result = arithmetic.square_root(value)
                 elif button_text == 'cbrt':
-                    result = self.arithmetic_calc.cube_root(value)
+                    result = arithmetic.cube_root(value)
                 elif button_text == 'exp':
-                    result = self.scientific_calc.exp(value)
+                    result = scientific.exp(value)
                 elif button_text == '!':
-                    result = self.arithmetic_calc.factorial(int(value))
+                    result = self._factorial(value)
             
             # 格式化结果
-            if isinstance(result, float) and result.is_integer():
-                result = int(result)
+            result = self._format_result(result)
             
             # 对于科学函数，将表达式移到历史显示（例如 sin(30) = 0.5）
             if button_text not in ['pi', 'e']:
@@ -1396,7 +1540,7 @@ class CalculatorMainWindow(QMainWindow):
                 
                 # 添加到历史记录
                 history_item = f"{expression} = {result}"
-                self.history.append(history_item)
+                self._record_history(history_item)
             
             self.clear_flag = True
         except ValueError as e:
@@ -1404,6 +1548,15 @@ class CalculatorMainWindow(QMainWindow):
         except Exception as e:
             self.show_error("计算错误")
     
+    def _display_value(self, text):
+        """把输入框中的数值转换为float（十进制模式下为Decimal）；分数（如 1/3）按表达式计算"""
+        if self.number_mode == "decimal":
+            return self._evaluate(text)
+        try:
+            return float(text)
+        except ValueError:
+            return float(self._evaluate(text))
+    
     def on_unit_type_changed(self, unit_type):
         """处理单位类型变更事件"""
         self.from_unit_combo.clear()
@@ -1456,298 +1609,86 @@ class CalculatorMainWindow(QMainWindow):
         except Exception as e:
             self.show_error(str(e))
     
+    def _add_base_items(self, combo):
+        """把支持的全部进制加入下拉框，显示名称之外以进制数值作为条目数据"""
+        for base in self.base_converter.supported_bases():
+            combo.addItem(self.base_converter.base_name(base), base)
+    
     def convert_base(self):
         """执行进制转换"""
         try:
             number_str = self.input_number.text()
-            from_base_text = self.from_base_combo.currentText()
-            to_base_text = self.to_base_combo.currentText()
+            if not number_str.strip():
+                self.output_number.clear()
+                return
+            from_base = self.from_base_combo.currentData()
+            to_base = self.to_base_combo.currentData()
+            group_size = 0
+            if self.group_digits_check.isChecked():
+                group_size = 4 if to_base in (2, 16) else 3
             
-            # 提取进制数字
-            from_base = int(from_base_text.split('(')[1].split(')')[0])
-            to_base = int(to_base_text.split('(')[1].split(')')[0])
-            
-            result = self.base_converter.convert(number_str, from_base, to_base)
+            result = self.base_converter.convert(number_str, from_base, to_base, group_size)
             self.output_number.setText(result)
         except ValueError as e:
             self.show_error(str(e))
         except Exception as e:
             self.show_error("转换错误")
     
-    def show_history(self):
-        """显示计算历史（Fluent Design风格）"""
-        # 根据当前主题设置颜色方案
-        if self.is_dark_theme:
-            # 深色主题颜色
-            dialog_bg = "#2d2d2d"
-            card_bg = "#3a3a3a"
-            card_hover_bg = "#424242"
-            text_primary = "#ffffff"
-            text_secondary = "#b0b0b0"
-            accent_color = "#0078d4"
-            accent_hover = "#106ebe"
-            accent_pressed = "#005a9e"
-            danger_color = "#f15252"
-            danger_hover = "#e03e3e"
-        else:
-            # 浅色主题颜色
-            dialog_bg = "#ffffff"
-            card_bg = "#f3f3f3"
-            card_hover_bg = "#ebebeb"
-            text_primary = "#1a1a1a"
-            text_secondary = "#666666"
-            accent_color = "#0078d7"
-            accent_hover = "#106ebe"
-            accent_pressed = "#005a9e"
-            danger_color = "#d13438"
-            danger_hover = "#a8071a"
-        
-        if not self.history:
-            # 使用Fluent Design风格的无历史记录提示窗口
-            no_history_dialog = QDialog(self)
-            no_history_dialog.setWindowTitle("历史记录")
-            no_history_dialog.setMinimumWidth(360)
-            no_history_dialog.setMinimumHeight(220)
-            
-            # 设置Fluent Design风格
-            no_history_dialog.setStyleSheet(f"""
-                QDialog {{ 
-                    background-color: {dialog_bg}; 
-                    border-radius: 8px;
-                    border: 1px solid {card_hover_bg};
-                }}
-            """)
-            
-            # 创建主布局
-            main_layout = QVBoxLayout(no_history_dialog)
-            main_layout.setSpacing(24)
-            main_layout.setContentsMargins(24, 24, 24, 24)
-            
-            # 添加图标
-            icon_label = QLabel()
-            icon_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            # 使用简单的文本图标作为替代
-            icon_label.setText("📋")
-            icon_label.setFixedHeight(48)
-            main_layout.addWidget(icon_label)
-            
-            # 添加标题标签
-            title_label = QLabel("暂无计算历史")
-            title_label.setStyleSheet(f"""
-                QLabel {{ 
-                    color: {text_primary}; 
-                    font-size: 18px; 
-                    font-weight: 500;
-                }}
-            """)
-            title_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            main_layout.addWidget(title_label)
-            
-            # 添加说明文本
-            hint_label = QLabel("进行计算后，历史记录将显示在这里")
-            hint_label.setStyleSheet(f"""
-                QLabel {{ 
-                    color: {text_secondary}; 
-                    font-size: 14px;
-                }}
-            """)
-            hint_label.setAlignment(Qt.AlignmentFlag.AlignCenter)
-            main_layout.addWidget(hint_label)
-            
-            # 添加关闭按钮
-            close_button = QPushButton("关闭")
-            close_button.setFixedHeight(36)
-            close_button.setStyleSheet(f"""
-                QPushButton {{ 
-                    background-color: {accent_color}; 
-                    color: white; 
-                    border: none; 
-                    border-radius: 4px; 
-                    font-size: 14px; 
-                    font-weight: 500;
-                    padding: 0 16px;
-                }}
-                QPushButton:hover {{ 
-                    background-color: {accent_hover}; 
-                }}
-                QPushButton:pressed {{ 
-                    background-color: {accent_pressed}; 
-                }}
-            """)
-            close_button.clicked.connect(no_history_dialog.accept)
-            
-            # 创建按钮布局
-            button_layout = QHBoxLayout()
-            button_layout.addStretch()
-            button_layout.addWidget(close_button)
-            button_layout.addStretch()
-            main_layout.addLayout(button_layout)
-            
-            # 显示对话框
-            no_history_dialog.exec()
+    def calculate_programmer(self):
+        """计算程序员模式的表达式，结果同时显示为各进制"""
+        expression = self.programmer_input.text()
+        if not expression.strip():
             return
+        try:
+            base = self.programmer_base_combo.currentData()
+            self._programmer_value = self.programmer_calc.evaluate(expression, base, auto_close=True)
+        except ValueError as e:
+            self.show_error(str(e))
+            return
+        self._show_programmer_value()
+    
+    def on_programmer_word_changed(self):
+        """切换字长或符号：已有结果按新的字长截断后重新显示"""
+        from calculator.core.programmer import ProgrammerCalculator
+        self.programmer_calc = ProgrammerCalculator(
+            self.word_size_combo.currentData(), self.signed_combo.currentData()
+        )
+        if self._programmer_value is not None:
+            self._programmer_value = self.programmer_calc.wrap(self._programmer_value)
+            self._show_programmer_value()
+    
+    def _show_programmer_value(self):
+        """把当前结果的各进制文本填入结果框"""
+        for base, text in self.programmer_calc.views(self._programmer_value).items():
+            self.programmer_outputs[base].setText(text)
+    
+    def show_history(self):
+        """显示计算历史（Fluent Design风格）
         
-        # 创建历史记录对话框
-        history_dialog = QDialog(self)
-        history_dialog.setWindowTitle("历史记录")
-        history_dialog.setMinimumSize(480, 640)
-        history_dialog.setStyleSheet(f"QDialog {{ background-color: {dialog_bg}; color: {text_primary}; border-radius: 8px; border: 1px solid {card_hover_bg}; }}")
-        
-        # 创建主布局
-        main_layout = QVBoxLayout(history_dialog)
-        main_layout.setContentsMargins(20, 20, 20, 20)
-        main_layout.setSpacing(16)
-        
-        # 创建标题标签
-        title_label = QLabel("今天")
-        title_label.setStyleSheet(f"color: {text_secondary}; font-size: 14px; font-weight: 500; margin-bottom: 8px;")
-        main_layout.addWidget(title_label, alignment=Qt.AlignmentFlag.AlignLeft)
-        
-        # 创建滚动区域
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        
-        # 设置滚动条样式
-        scroll_area.setStyleSheet(f"""
-            QScrollArea {{ background-color: transparent; border: none; }}
-            QScrollBar:vertical {{ 
-                background-color: transparent;
-                width: 8px;
-                margin: 0 0 0 0;
-            }}
-            QScrollBar::handle:vertical {{ 
-                background-color: {text_secondary};
-                border-radius: 4px;
-                min-height: 20px;
-            }}
-            QScrollBar::handle:vertical:hover {{ 
-                background-color: {text_primary};
-            }}
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{ 
-                height: 0px;
-                width: 0px;
-            }}
-        """)
-        
-        # 创建滚动内容容器
-        scroll_content = QWidget()
-        scroll_content.setStyleSheet("background-color: transparent;")
-        
-        # 创建内容布局
-        content_layout = QVBoxLayout(scroll_content)
-        content_layout.setSpacing(8)
-        content_layout.setContentsMargins(4, 4, 4, 4)
-        
-        # 处理历史记录，创建分块显示
-        for record in reversed(self.history):  # 倒序显示，最新的在最上面
-            # 分割表达式和结果
-            parts = record.split("=")
-            if len(parts) == 2:
-                expression = parts[0].strip()
-                result = parts[1].strip()
-                
-                # 创建记录块
-                record_block = QFrame()
-                record_block.setFrameShape(QFrame.Shape.Panel)
-                record_block.setStyleSheet(f"""
-                    QFrame {{ 
-                        background-color: {card_bg}; 
-                        border-radius: 8px; 
-                        padding: 16px; 
-                        border: 1px solid transparent;
-                    }}
-                    QFrame:hover {{ 
-                        background-color: {card_hover_bg}; 
-                        border: 1px solid {accent_color};
-                    }}
-                """)
-                
-                # 创建记录块布局
-                block_layout = QVBoxLayout(record_block)
-                block_layout.setContentsMargins(0, 0, 0, 0)
-                block_layout.setSpacing(8)
-                
-                # 添加表达式标签
-                expression_label = QLabel(expression)
-                expression_label.setStyleSheet(f"color: {text_secondary}; font-size: 14px;")
-                expression_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
-                block_layout.addWidget(expression_label)
-                
-                # 添加结果标签
-                result_label = QLabel(result)
-                result_label.setStyleSheet(f"color: {text_primary}; font-size: 18px; font-weight: 600;")
-                result_label.setTextInteractionFlags(Qt.TextInteractionFlag.TextSelectableByMouse)
-                block_layout.addWidget(result_label)
-                
-                # 添加复制按钮
-                copy_button = QPushButton("复制")
-                copy_button.setFixedHeight(28)
-                copy_button.setStyleSheet(f"""
-                    QPushButton {{ 
-                        background-color: transparent; 
-                        color: {accent_color}; 
-                        border: 1px solid {accent_color}; 
-                        border-radius: 4px; 
-                        font-size: 12px;
-                        padding: 0 8px;
-                    }}
-                    QPushButton:hover {{ 
-                        background-color: {accent_color};
-                        color: white;
-                    }}
-                """)
-                copy_button.clicked.connect(lambda checked, r=result: QApplication.clipboard().setText(r))
-                
-                # 添加按钮布局
-                button_layout = QHBoxLayout()
-                button_layout.addStretch()
-                button_layout.addWidget(copy_button)
-                block_layout.addLayout(button_layout)
-                
-                # 添加记录块到内容布局
-                content_layout.addWidget(record_block)
-        
-        # 设置滚动区域的内容
-        scroll_area.setWidget(scroll_content)
-        
-        # 添加滚动区域到主布局
-        main_layout.addWidget(scroll_area, 1)  # 1表示伸展系数
-        
-        # 创建底部布局
-        bottom_layout = QHBoxLayout()
-        
-        # 添加历史记录数量
-        count_label = QLabel(f"共 {len(self.history)} 条记录")
-        count_label.setStyleSheet(f"color: {text_secondary}; font-size: 12px;")
-        bottom_layout.addWidget(count_label)
-        
-        bottom_layout.addStretch()
-        
-        # 添加清空按钮
-        clear_button = QPushButton("清空历史")
-        clear_button.setFixedHeight(32)
-        clear_button.setStyleSheet(f"""
-            QPushButton {{ 
-                background-color: transparent; 
-                color: {danger_color}; 
-                border: 1px solid {danger_color}; 
-                border-radius: 4px; 
-                padding: 0 12px; 
-                font-size: 14px;
-            }}
-            QPushButton:hover {{ 
-                background-color: {danger_color};
-                color: white;
-            }}
-        """)
-        clear_button.clicked.connect(lambda: self.clear_history(history_dialog))
-        bottom_layout.addWidget(clear_button)
+        对话框只在第一次打开时创建，之后常驻并复用；列表只绘制可见的行，
+        历史记录按页懒加载，因此打开耗时与历史记录总数无关。
+        """
+        if self._history_dialog is None:
+            # 历史记录对话框很少使用，第一次打开时才导入
+            from calculator.ui.history_view import HistoryDialog
+            self._history_dialog = HistoryDialog(self.history, self)
+            self._history_dialog.clear_button.clicked.connect(
+                lambda: self.clear_history(self._history_dialog)
+            )
         
-        # 添加底部布局到主布局
-        main_layout.addLayout(bottom_layout)
+        self._history_dialog.set_theme(self._theme_name())
+        self._history_dialog.list_view.scrollToTop()
         
-        # 显示对话框
-        history_dialog.exec()
+        # 非模态显示，已经打开时只需提到最前
+        self._history_dialog.show()
+        self._history_dialog.raise_()
+        self._history_dialog.activateWindow()
+    
+    def _record_history(self, history_item):
+        """追加一条历史记录，并通知已创建的历史记录对话框"""
+        self.history.append(history_item)
+        if self._history_dialog is not None:
+            self._history_dialog.model.record_appended()
     
     def clear_history(self, dialog):
         """清空历史记录，使用Fluent Design风格的确认对话框"""
@@ -1888,262 +1829,15 @@ class CalculatorMainWindow(QMainWindow):
     def _confirm_clear_history(self, confirm_dialog, history_dialog):
         """确认清空历史记录后的操作"""
         self.history = []
+        if self._history_dialog is not None:
+            self._history_dialog.model.set_history(self.history)
         confirm_dialog.accept()
         history_dialog.accept()
     
     def show_help(self):
-        """显示使用说明，使用Fluent Design风格的对话框，并支持深色/浅色模式"""
-        # 根据当前主题设置颜色方案
-        if self.is_dark_theme:
-            # 深色主题颜色
-            dialog_bg = "#2d2d2d"
-            card_bg = "#3a3a3a"
-            card_hover_bg = "#424242"
-            text_primary = "#ffffff"
-            text_secondary = "#b0b0b0"
-            text_tertiary = "#e0e0e0"
-            accent_color = "#0078d4"
-            accent_hover = "#106ebe"
-            accent_pressed = "#005a9e"
-            border_color = "#4a4a4a"
-        else:
-            # 浅色主题颜色
-            dialog_bg = "#ffffff"
-            card_bg = "#f3f3f3"
-            card_hover_bg = "#ebebeb"
-            text_primary = "#1a1a1a"
-            text_secondary = "#444444"
-            text_tertiary = "#666666"
-            accent_color = "#0078d7"
-            accent_hover = "#106ebe"
-            accent_pressed = "#005a9e"
-            border_color = "#e0e0e0"
-        
-        # 创建自定义的Fluent Design风格帮助对话框
-        help_dialog = QDialog(self)
-        help_dialog.setWindowTitle("使用说明")
-        help_dialog.setMinimumSize(640, 720)  # 略微增加尺寸以确保所有内容可见
-        
-        # 设置Fluent Design风格
-        help_dialog.setStyleSheet(f"""
-            QDialog {{ 
-                background-color: {dialog_bg}; 
-                border-radius: 8px;
-                border: 1px solid {border_color};
-            }}
-        """)
-        
-        # 创建主布局
-        main_layout = QVBoxLayout(help_dialog)
-        main_layout.setContentsMargins(24, 24, 24, 24)
-        main_layout.setSpacing(16)  # 统一间距
-        
-        # 添加标题标签
-        title_label = QLabel("Python多功能计算器使用说明")
-        title_label.setStyleSheet(f"""
-            QLabel {{ 
-                color: {text_primary}; 
-                font-size: 20px; 
-                font-weight: 600;
-                margin-bottom: 8px;
-            }}
-        """)
-        main_layout.addWidget(title_label)
-        
-        # 添加版本信息
-        version_label = QLabel("版本 1.0")
-        version_label.setStyleSheet(f"color: {text_secondary}; font-size: 12px;")
-        main_layout.addWidget(version_label)
-        
-        # 创建滚动区域
-        scroll_area = QScrollArea()
-        scroll_area.setWidgetResizable(True)
-        
-        # 设置滚动条样式
-        scroll_area.setStyleSheet(f"""
-            QScrollArea {{ background-color: transparent; border: none; }}
-            QScrollBar:vertical {{ 
-                background-color: transparent;
-                width: 8px;
-                margin: 0 4px 0 0;
-            }}
-            QScrollBar::handle:vertical {{ 
-                background-color: {text_secondary};
-                border-radius: 4px;
-                min-height: 20px;
-            }}
-            QScrollBar::handle:vertical:hover {{ 
-                background-color: {text_primary};
-            }}
-            QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {{ 
-                height: 0px;
-                width: 0px;
-            }}
-        """)
-        
-        # 创建滚动内容容器
-        scroll_content = QWidget()
-        scroll_content.setStyleSheet("background-color: transparent;")
-        
-        # 创建内容布局
-        content_layout = QVBoxLayout(scroll_content)
-        content_layout.setSpacing(20)  # 增加内容块之间的间距
-        content_layout.setContentsMargins(4, 4, 4, 4)
-        
-        # 帮助内容
-        help_sections = [
-            {
-                "title": "1. 基本计算",
-                "content": [
-                    "- 数字键 (0-9)：输入数字",
-                    "- 运算符键 (+, -, *, /)：输入运算符",
-                    "- 小数点 (.)：输入小数点",
-                    "- Enter/Return键：计算结果",
-                    "- Escape键：清除",
-                    "- 减号 (-)：切换正负号",
-                    "- 百分号 (%)：转换为百分比",
-                    "- 鼠标点击：点击相应按钮"
-                ]
-            },
-            {
-                "title": "2. 科学计算",
-                "content": [
-                    "- 基本功能同基本计算器",
-                    "- 键盘快捷键：",
-                    "  - Shift+S：sin",
-                    "  - Shift+C：cos",
-                    "  - Shift+T：tan",
-                    "  - Shift+P：π (圆周率)",
-                    "  - E：e (自然对数底)",
-                    "  - Ctrl+X：平方根",
-                    "- 科学函数按钮：点击相应按钮使用所有科学函数"
-                ]
-            },
-            {
-                "title": "3. 单位换算",
-                "content": [
-                    "- 选择单位类型",
-                    "- 选择源单位和目标单位",
-                    "- 输入要转换的值",
-                    "- 点击转换按钮"
-                ]
-            },
-            {
-                "title": "4. 进制转换",
-                "content": [
-                    "- 选择源进制和目标进制",
-                    "- 输入要转换的数字",
-                    "- 点击转换按钮"
-                ]
-            },
-            {
-                "title": "键盘输入支持",
-                "content": [
-                    "在基本计算器和科学计算器选项卡中可以使用相应的键盘快捷键进行操作，提高计算效率。"
-                ]
-            },
-            {
-                "title": "主题设置",
-                "content": [
-                    "- 浅色/深色主题：在设置菜单中可切换主题",
-                    "- 所有界面元素都会根据当前主题自动适配"
-                ]
-            },
-            {
-                "title": "历史记录",
-                "content": [
-                    "- 计算结果会自动保存在历史记录中",
-                    "- 点击'历史记录'按钮查看所有计算历史",
-                    "- 支持复制历史计算结果"
-                ]
-            }
-        ]
-        
-        # 创建帮助内容块
-        for section in help_sections:
-            # 章节标题
-            section_title = QLabel(section["title"])
-            section_title.setStyleSheet(f"""
-                QLabel {{ 
-                    color: {text_primary}; 
-                    font-size: 16px; 
-                    font-weight: 500;
-                    margin-bottom: 8px;
-                }}
-            """)
-            content_layout.addWidget(section_title)
-            
-            # 章节内容容器
-            content_frame = QFrame()
-            content_frame.setStyleSheet(f"""
-                QFrame {{ 
-                    background-color: {card_bg}; 
-                    border-radius: 8px;
-                    padding: 16px;
-                    border: 1px solid {border_color};
-                }}
-            """)
-            
-            content_block_layout = QVBoxLayout(content_frame)
-            content_block_layout.setContentsMargins(0, 0, 0, 0)
-            content_block_layout.setSpacing(10)  # 增加内容项之间的间距
-            
-            # 添加内容项
-            for item in section["content"]:
-                item_label = QLabel(item)
-                item_label.setStyleSheet(f"""
-                    QLabel {{ 
-                        color: {text_secondary}; 
-                        font-size: 14px;
-                    }}
-                """)
-                item_label.setWordWrap(True)
-                content_block_layout.addWidget(item_label)
-            
-            content_layout.addWidget(content_frame)
-        
-        # 添加底部空白，确保滚动到底部时内容完全可见
-        content_layout.addSpacerItem(QSpacerItem(0, 20, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Fixed))
-        
-        # 设置滚动区域的内容
-        scroll_area.setWidget(scroll_content)
-        
-        # 添加滚动区域到主布局
-        main_layout.addWidget(scroll_area, 1)  # 1表示伸展系数
-        
-        # 添加关闭按钮
-        close_button = QPushButton("关闭")
-        close_button.setFixedHeight(36)
-        close_button.setMinimumWidth(80)  # 设置最小宽度，确保按钮不会太小
-        close_button.setStyleSheet(f"""
-            QPushButton {{ 
-                background-color: {accent_color}; 
-                color: white; 
-                border: none; 
-                border-radius: 4px; 
-                font-size: 14px;
-                font-weight: 500;
-                padding: 0 16px;
-            }}
-            QPushButton:hover {{ 
-                background-color: {accent_hover}; 
-            }}
-            QPushButton:pressed {{ 
-                background-color: {accent_pressed}; 
-            }}
-        """)
-        close_button.clicked.connect(help_dialog.accept)
-        
-        # 创建按钮布局
-        button_layout = QHBoxLayout()
-        button_layout.setContentsMargins(0, 16, 0, 0)  # 增加顶部边距，确保按钮不会紧贴内容
-        button_layout.addStretch()
-        button_layout.addWidget(close_button)
-        button_layout.addStretch()
-        main_layout.addLayout(button_layout)
-        
-        # 显示对话框
-        help_dialog.exec()
+        """显示使用说明，对话框很少使用，第一次打开时才导入"""
+        from calculator.ui.help_dialog import HelpDialog
+        HelpDialog(self.is_dark_theme, self).exec()
     
     def show_error(self, message):
         """显示错误消息"""
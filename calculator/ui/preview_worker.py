@@ -0,0 +1,144 @@
+"""实时预览的后台计算模块
+
+输入框的每次按键都会请求一次预览计算。PreviewScheduler 用一个短的
+QTimer 防抖合并连续按键，把计算交给 QThreadPool 中的工作线程执行，
+并用递增的代号丢弃过期的结果，保证GUI线程不会被耗时的表达式阻塞。
+"""
+
+import threading
+from contextlib import nullcontext
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+
+from calculator.core.incremental import IncrementalEvaluator
+
+
+class _PreviewSignals(QObject):
+    """工作线程通过信号把结果送回GUI线程"""
+
+    # 代号, 计算结果（失败时为None）
+    finished = pyqtSignal(int, object)
+
+
+class PreviewTask(QRunnable):
+    """在工作线程中执行的一次预览计算"""
+
+    def __init__(self, evaluator, lock, text, generation, context=None):
+        """初始化任务
+
+        Args:
+            evaluator: 增量求值器，同一时间只允许一个线程使用
+            lock: 保护求值器的锁
+            text: 要计算的表达式文本
+            generation: 请求代号
+            context: 有 localcontext() 方法的数值上下文（如 DecimalContext），
+                计算在其中进行；为None时使用工作线程默认的上下文
+        """
+        super().__init__()
+        self.setAutoDelete(False)
+        self.signals = _PreviewSignals()
+        self._evaluator = evaluator
+        self._lock = lock
+        self._text = text
+        self.generation = generation
+        self._context = context
+        self._cancelled = False
+
+    def cancel(self):
+        """取消任务；尚未开始的计算会被跳过，已经开始的计算会执行完"""
+        self._cancelled = True
+
+    def run(self):
+        result = None
+        with self._lock:
+            if not self._cancelled:
+                try:
+                    with self._context.localcontext() if self._context is not None else nullcontext():
+                        result = self._evaluator.update(self._text)
+                except Exception:
+                    result = None
+        # 无论是否取消都发出信号，调度器据此释放对任务的引用
+        self.signals.finished.emit(self.generation, result)
+
+
+class PreviewScheduler(QObject):
+    """单个输入框的预览调度器：防抖、后台计算、取消和丢弃过期结果"""
+
+    # 最新请求的计算结果；表达式无效时为None
+    result_ready = pyqtSignal(object)
+
+    def __init__(self, delay_ms=60, thread_pool=None, number=None, context=None, parent=None):
+        """初始化调度器
+
+        Args:
+            delay_ms: 防抖间隔（毫秒），在此时间内的连续请求只计算最后一次
+            thread_pool: 使用的线程池，默认为全局线程池
+            number: 数字的数值类型，如 fractions.Fraction；为None时为int/float
+            context: 计算所在的数值上下文，如十进制模式的 DecimalContext（决定精度）；
+                为None时使用工作线程默认的上下文
+            parent: 父对象
+        """
+        super().__init__(parent)
+        self._evaluator = IncrementalEvaluator(number)
+        self._context = context
+        self._lock = threading.Lock()
+        self._thread_pool = thread_pool or QThreadPool.globalInstance()
+        self._generation = 0
+        self._pending_text = None
+        # 已提交到线程池、尚未返回的任务（代号 -> 任务），保持引用直到任务结束
+        self._tasks = {}
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay_ms)
+        self._timer.timeout.connect(self._submit)
+
+    def request(self, text):
+        """请求计算text的预览结果，结果通过result_ready信号异步返回"""
+        self._generation += 1
+        self._cancel_tasks()
+        self._pending_text = text
+        self._timer.start()
+
+    def set_number(self, number, context=None):
+        """更换数字的数值类型和数值上下文，尚未返回的请求被取消
+
+        Args:
+            number: 数值类型，如 fractions.Fraction；为None时为int/float
+            context: 数值上下文，见 __init__
+        """
+        self.cancel()
+        # 已开始的任务持有旧的求值器，换成新对象即可，不需要等待它结束
+        self._evaluator = IncrementalEvaluator(number)
+        self._context = context
+
+    def cancel(self):
+        """取消所有尚未返回的请求"""
+        self._generation += 1
+        self._timer.stop()
+        self._pending_text = None
+        self._cancel_tasks()
+
+    def _cancel_tasks(self):
+        """取消已提交的任务；尚未开始的任务直接从线程池中移除"""
+        for generation, task in list(self._tasks.items()):
+            task.cancel()
+            if self._thread_pool.tryTake(task):
+                del self._tasks[generation]
+
+    def _submit(self):
+        """防抖结束后把最新的请求提交到线程池"""
+        if self._pending_text is None:
+            return
+        task = PreviewTask(self._evaluator, self._lock, self._pending_text, self._generation, self._context)
+        task.signals.finished.connect(self._on_finished)
+        self._pending_text = None
+        self._tasks[task.generation] = task
+        self._thread_pool.start(task)
+
+    def _on_finished(self, generation, result):
+        """在GUI线程中接收结果，丢弃已被新请求取代的结果"""
+        self._tasks.pop(generation, None)
+        if generation != self._generation:
+            return
+        self.result_ready.emit(result)
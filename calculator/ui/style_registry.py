@@ -0,0 +1,90 @@
+"""显示区域样式注册表
+
+每个 (控件角色, 主题, 字体大小) 组合的样式表只生成一次并缓存；
+应用到控件时记录上一次应用的组合，只有角色、主题或字体大小真正变化时
+才调用 setStyleSheet，避免Qt在每次按键时重新解析样式并重新polish控件。
+"""
+
+import weakref
+
+# 显示区域的配色方案
+DISPLAY_PALETTES = {
+    "dark": {
+        "background": "#3a3a3a",
+        "text": "#ffffff",
+        "text_secondary": "#cccccc"
+    },
+    "light": {
+        "background": "#ffffff",
+        "text": "#000000",
+        "text_secondary": "#666666"
+    }
+}
+
+# 控件角色: (默认字体大小, 文字颜色)
+DISPLAY_ROLES = {
+    "history": (16, "text_secondary"),       # 上移淡化的表达式
+    "input": (24, "text"),                   # 表达式输入区域
+    "pre_result": (18, "text_secondary")     # 预计算结果
+}
+
+
+class StyleRegistry:
+    """缓存并按需应用显示区域样式表"""
+
+    def __init__(self):
+        # (角色, 主题, 字体大小) -> 样式表字符串
+        self._stylesheets = {}
+        # 控件 -> 上一次应用的 (角色, 主题, 字体大小)
+        self._applied = weakref.WeakKeyDictionary()
+
+    def stylesheet(self, role, theme, font_size=None):
+        """获取样式表，同一组合只生成一次
+
+        Args:
+            role: 控件角色，见 DISPLAY_ROLES
+            theme: 主题名称 (light 或 dark)
+            font_size: 字体大小（像素），为None时使用角色的默认大小
+
+        Returns:
+            样式表字符串
+        """
+        default_size, color_key = DISPLAY_ROLES[role]
+        if font_size is None:
+            font_size = default_size
+        key = (role, theme, font_size)
+        stylesheet = self._stylesheets.get(key)
+        if stylesheet is None:
+            palette = DISPLAY_PALETTES[theme]
+            # 统一使用透明边框
+            stylesheet = (
+                f"font-size: {font_size}px; color: {palette[color_key]}; padding: 5px; "
+                f"background-color: {palette['background']}; border: 1px solid transparent;"
+            )
+            self._stylesheets[key] = stylesheet
+        return stylesheet
+
+    def apply(self, widget, role, theme, font_size=None):
+        """将样式应用到控件，组合未变化时不做任何Qt调用
+
+        Args:
+            widget: 目标控件
+            role: 控件角色
+            theme: 主题名称
+            font_size: 字体大小，为None时使用角色的默认大小
+
+        Returns:
+            是否真正调用了setStyleSheet
+        """
+        if font_size is None:
+            font_size = DISPLAY_ROLES[role][0]
+        key = (role, theme, font_size)
+        if self._applied.get(widget) == key:
+            return False
+        widget.setStyleSheet(self.stylesheet(role, theme, font_size))
+        self._applied[widget] = key
+        return True
+
+    def applied_style(self, widget):
+        """获取控件上一次应用的 (角色, 主题, 字体大小)，未应用过时返回None"""
+        return self._applied.get(widget)